@@ -0,0 +1,69 @@
+"""
+Memory of many ASTs held as node objects versus one ASTArena, and the
+time of running StaticChecker over either form.
+
+Usage:
+    python benchmarks/bench_ast_arena.py [n_programs] [n_stmts]
+"""
+
+import sys
+import tracemalloc
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.semantics.static_checker import StaticChecker
+from src.utils.ast_arena import ASTArena
+
+
+def parse(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    return build_ast(parser, "sll-ll")
+
+
+def traced_size(fn):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, size
+
+
+def check_all(programs):
+    for program in programs:
+        StaticChecker().check_program(program)
+
+
+def main():
+    n_programs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    n_stmts = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    source = generate_program(2, 3, n_stmts)
+    template = parse(source)
+
+    # Rebuild from one arena so both forms hold distinct, identical trees
+    seed = ASTArena()
+    seed_root = seed.add(template)
+    nodes, nodes_size = traced_size(lambda: [seed.to_node(seed_root) for _ in range(n_programs)])
+
+    def fill_arena():
+        arena = ASTArena()
+        return arena, [arena.add(program) for program in nodes]
+
+    (arena, roots), arena_size = traced_size(fill_arena)
+    views = [arena.view(root) for root in roots]
+    n_nodes = len(arena)
+
+    rows = []
+    for name, size, programs in [("node objects", nodes_size, nodes), ("ASTArena", arena_size, views)]:
+        elapsed = measure(lambda: check_all(programs))
+        rows.append([name, f"{size / n_nodes:.1f}", f"{size / (1 << 20):.1f}", f"{elapsed:.2f}"])
+    print(f"{n_programs} programs, {n_nodes} AST nodes")
+    print_table(["form", "bytes/node", "total MiB", "check s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Size and load time of the binary AST format versus pickle, compared
+with lexing, parsing and building the AST from source.
+
+Usage:
+    python benchmarks/bench_ast_binary.py [n_methods] [n_stmts]
+"""
+
+import pickle
+import sys
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.utils.ast_binary import dumps, loads
+
+
+def parse(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    return build_ast(parser, "sll-ll")
+
+
+def main():
+    n_methods = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    n_stmts = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    sys.setrecursionlimit(10000)
+    source = generate_program(4, n_methods, n_stmts)
+    ast = parse(source)  # also warms the shared prediction DFA
+
+    binary = dumps(ast)
+    pickled = pickle.dumps(ast, pickle.HIGHEST_PROTOCOL)
+    assert str(loads(binary)) == str(ast)
+
+    rows = [
+        ["parse source", len(source) >> 10, f"{measure(lambda: parse(source)):.3f}", "-"],
+        ["pickle", len(pickled) >> 10,
+         f"{measure(lambda: pickle.loads(pickled)):.3f}",
+         f"{measure(lambda: pickle.dumps(ast, pickle.HIGHEST_PROTOCOL)):.3f}"],
+        ["binary format", len(binary) >> 10,
+         f"{measure(lambda: loads(binary)):.3f}", f"{measure(lambda: dumps(ast)):.3f}"],
+    ]
+    print_table(["input", "KiB", "load s", "dump s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Peak memory and end-to-end time of building the AST by walking a full
+parse tree versus building it during the parse with build_ast.
+
+Usage:
+    python benchmarks/bench_ast_build.py [n_methods] [n_stmts]
+"""
+
+import sys
+
+from common import generate_program, print_table, profile
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.astgen.ast_generation import ASTGeneration
+from src.utils.parse_strategy import parse_two_stage
+
+
+def make_parser(source: str):
+    return OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+
+
+def tree_walk(source: str):
+    return ASTGeneration().visit(parse_two_stage(make_parser(source)))
+
+
+def direct(source: str):
+    return build_ast(make_parser(source), "sll-ll")
+
+
+def main():
+    n_methods = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    n_stmts = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    source = generate_program(4, n_methods, n_stmts)
+    tree_walk(generate_program(1, 1, 100))  # warm the shared prediction DFA
+
+    rows, outputs = [], []
+    for name, fn in [("parse tree + visitor", tree_walk), ("direct (listener)", direct)]:
+        ast, elapsed, peak = profile(lambda: fn(source))
+        outputs.append(str(ast))
+        rows.append([name, f"{elapsed:.2f}", f"{peak / (1 << 20):.1f}"])
+    assert outputs[0] == outputs[1]
+    print(f"{len(source) >> 10} KiB source, {4 * n_methods * n_stmts} statements")
+    print_table(["construction", "seconds", "peak MiB"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Cost of comparing ASTs structurally versus by their string form, and of
+memoizing on subtrees with the cached structural hash.
+
+Two ASTs are generated from the same parse tree, and a third from a
+program whose last statement differs. Each pair is compared with
+str(a) == str(b) and with a == b, the latter both before and after the
+trees' hashes are cached. A lookup of every method body in a dict keyed
+by body is timed with the hash cold and cached.
+
+Usage:
+    python benchmarks/bench_ast_equality.py [n_methods] [n_stmts]
+"""
+
+import sys
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.utils.nodes import MethodDecl, invalidate_hashes
+from src.utils.parse_strategy import parse_two_stage
+
+
+def generate(source):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    return ASTGeneration().visit(parse_two_stage(parser))
+
+
+def bodies(ast):
+    return [m.body for c in ast.class_decls for m in c.members if isinstance(m, MethodDecl)]
+
+
+def memo_lookups(ast, memo):
+    for body in bodies(ast):
+        memo[body]
+
+
+def main():
+    n_methods = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    n_stmts = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    sys.setrecursionlimit(10000)
+    source = generate_program(4, n_methods, n_stmts)
+    changed = source[:source.rindex("return f;")] + "return f + 1;" + source[source.rindex("return f;") + 9:]
+    ast, same, other = generate(source), generate(source), generate(changed)
+
+    rows = []
+    for name, b in [("equal trees", same), ("last statement differs", other)]:
+        invalidate_hashes(ast), invalidate_hashes(b)
+        str_time = measure(lambda: str(ast) == str(b), repeat=5)
+        cold_time = measure(lambda: ast == b, repeat=5)
+        hash(ast), hash(b)
+        cached_time = measure(lambda: ast == b, repeat=5)
+        rows.append([name, f"{str_time * 1000:.2f}", f"{cold_time * 1000:.2f}", f"{cached_time * 1000:.3f}"])
+    print_table(["comparison", "str() ms", "== ms", "== hashed ms"], rows)
+    print()
+
+    invalidate_hashes(ast)
+    memo = {body: None for body in bodies(ast)}
+    cold_time = measure(lambda: (invalidate_hashes(same), memo_lookups(same, memo)), repeat=5)
+    memo_lookups(same, memo)
+    cached_time = measure(lambda: memo_lookups(same, memo), repeat=5)
+    print_table(
+        ["memo lookups", "ms"],
+        [[f"{len(memo)} bodies, hash cold", f"{cold_time * 1000:.2f}"],
+         [f"{len(memo)} bodies, hash cached", f"{cached_time * 1000:.3f}"]],
+    )
+
+
+if __name__ == "__main__":
+    main()
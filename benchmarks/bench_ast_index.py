@@ -0,0 +1,77 @@
+"""
+Cost of building an ASTIndex during AST generation, and of answering
+repeated node queries from it versus walking the whole Program.
+
+Each query asks for the MethodCall nodes calling one method, or the
+Identifier nodes naming one variable, of a generated program; the walk
+answers it with an IterativeVisitor over the full tree.
+
+Usage:
+    python benchmarks/bench_ast_index.py [n_methods] [n_queries]
+"""
+
+import sys
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.utils.ast_index import ASTIndex
+from src.utils.nodes import Identifier, MethodCall
+from src.utils.parse_strategy import parse_two_stage
+from src.utils.traversal import IterativeVisitor
+
+
+class Find(IterativeVisitor):
+    def __init__(self, kind, name_field, name):
+        super().__init__()
+        self.kind, self.name_field, self.name = kind, name_field, name
+        self.found = []
+
+    def enter_node(self, node):
+        if type(node) is self.kind and getattr(node, self.name_field) == self.name:
+            self.found.append(node)
+
+
+def queries(n_methods, n_queries):
+    names = [(MethodCall, "method_name", f"m{i % n_methods}") for i in range(n_queries // 2)]
+    return names + [(Identifier, "name", name) for name in ["i", "f", "b", "s"] * (n_queries // 8)]
+
+
+def main():
+    n_methods = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    n_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    sys.setrecursionlimit(10000)
+    source = generate_program(4, n_methods, 100)
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    tree = parse_two_stage(parser)
+    plain_time = measure(lambda: ASTGeneration().visit(tree), repeat=3)
+    indexed_time = measure(lambda: ASTGeneration(index=ASTIndex()).visit(tree), repeat=3)
+    index = ASTIndex()
+    ast = ASTGeneration(index=index).visit(tree)
+
+    work = queries(n_methods, n_queries)
+
+    def walk_all():
+        for kind, field, name in work:
+            finder = Find(kind, field, name)
+            finder.traverse(ast)
+
+    def look_up_all():
+        for kind, _, name in work:
+            index.find(kind, name)
+
+    walk_time = measure(walk_all, repeat=3)
+    lookup_time = measure(look_up_all, repeat=3)
+    print(f"{len(index.parents)} nodes, {len(work)} queries")
+    print_table(
+        ["", "no index", "ASTIndex"],
+        [["ASTGeneration s", f"{plain_time:.3f}", f"{indexed_time:.3f}"],
+         ["queries s", f"{walk_time:.3f}", f"{lookup_time:.6f}"]],
+    )
+
+
+if __name__ == "__main__":
+    main()
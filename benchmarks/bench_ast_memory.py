@@ -0,0 +1,95 @@
+"""
+Bytes per node and total AST memory of slotted AST nodes versus the
+previous __dict__-backed layout.
+
+The AST of a synthetic program is copied twice under tracemalloc: once
+into the slotted node classes of src/utils/nodes.py, and once into
+plain classes that store the same fields in a per-instance __dict__, as
+the node classes did before they declared __slots__.
+
+Usage:
+    python benchmarks/bench_ast_memory.py [n_methods] [n_stmts]
+"""
+
+import sys
+import tracemalloc
+
+from common import generate_program, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.utils.nodes import ASTNode
+
+
+def fields(node_class):
+    return [
+        name
+        for klass in reversed(node_class.__mro__)
+        for name in vars(klass).get("__slots__", ())
+    ]
+
+
+def slotted(node_class):
+    return node_class.__new__(node_class)
+
+
+_plain_classes = {}
+
+
+def plain(node_class):
+    if node_class not in _plain_classes:
+        _plain_classes[node_class] = type(node_class.__name__, (), {})
+    return _plain_classes[node_class]()
+
+
+def copy_tree(value, make):
+    """Copy an AST, creating each node with make(node_class)."""
+    if isinstance(value, list):
+        return [copy_tree(item, make) for item in value]
+    if not isinstance(value, ASTNode):
+        return value
+    node = make(type(value))
+    for name in fields(type(value)):
+        setattr(node, name, copy_tree(getattr(value, name), make))
+    return node
+
+
+def count_nodes(value):
+    if isinstance(value, list):
+        return sum(count_nodes(item) for item in value)
+    if not isinstance(value, ASTNode):
+        return 0
+    return 1 + sum(count_nodes(getattr(value, name)) for name in fields(type(value)))
+
+
+def traced_size(fn):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    n_methods = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    n_stmts = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    sys.setrecursionlimit(10000)
+    source = generate_program(4, n_methods, n_stmts)
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    ast = build_ast(parser, "sll-ll")
+    n_nodes = count_nodes(ast)
+
+    rows = []
+    for name, make in [("__dict__ (before)", plain), ("__slots__", slotted)]:
+        copy_tree(ast, make)  # create the plain classes outside the trace
+        _, size = traced_size(lambda: copy_tree(ast, make))
+        rows.append([name, f"{size / n_nodes:.1f}", f"{size / (1 << 20):.1f}"])
+    print(f"{len(source) >> 10} KiB source, {n_nodes} AST nodes; totals include the node lists")
+    print_table(["node layout", "bytes/node", "total MiB"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Time and peak memory of printing ASTs with the streaming printer versus
+building the string of every subtree, as each node's __str__ did.
+
+A large program and a deeply nested else-if chain are printed three
+ways: by concatenating the strings of the children at every node, the
+scheme of the former __str__ methods rebuilt on the printer's PIECES
+table, by write_ast into an io.StringIO, and by write_ast straight into
+a file.
+
+Usage:
+    python benchmarks/bench_ast_printer.py [n_methods] [depth]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.utils.ast_printer import pieces, write_ast
+from src.utils.nodes import *
+
+
+def concatenated(node) -> str:
+    """Render node from its children's rendered strings, as __str__ used to."""
+    parts = pieces(node)
+    if type(parts) is str:
+        return parts
+    return "".join(concatenated(p) if isinstance(p, ASTNode) else str(p) for p in parts)
+
+
+def else_if_chain(depth: int) -> Program:
+    stmt = BreakStatement()
+    for i in range(depth):
+        stmt = IfStatement(BinaryOp(Identifier("i"), "==", IntLiteral(i)), ReturnStatement(IntLiteral(i)), stmt)
+    method = MethodDecl(False, PrimitiveType("int"), "m", [], BlockStatement([], [stmt]))
+    return Program([ClassDecl("A", None, [method])])
+
+
+def to_file(ast, path):
+    with open(path, "w") as f:
+        write_ast(ast, f)
+
+
+def peak(function) -> int:
+    tracemalloc.start()
+    function()
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    n_methods = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    sys.setrecursionlimit(max(10000, 4 * depth))
+    source = generate_program(4, n_methods, 100)
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    path = os.path.join(tempfile.mkdtemp(), "ast.txt")
+
+    rows = []
+    for name, ast in [(f"program, {n_methods} methods/class", build_ast(parser, "sll-ll")),
+                      (f"else-if chain, depth {depth}", else_if_chain(depth))]:
+        size = len(concatenated(ast))
+        for printer, function in [
+            ("concatenate subtrees", lambda: concatenated(ast)),
+            ("write_ast to StringIO", lambda: write_ast(ast, io.StringIO())),
+            ("write_ast to file", lambda: to_file(ast, path)),
+        ]:
+            rows.append([name, f"{size >> 10}", printer, f"{measure(function, repeat=3):.3f}",
+                         f"{peak(function) / 2**20:.1f}"])
+    print_table(["tree", "KiB", "printer", "time s", "peak MiB"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Time to find every semantic error in a large program: one pipeline run
+with a collecting StaticChecker versus the raise-on-first pipeline
+repeated once per error, as in an edit-and-rerun loop, with a clean run
+as the baseline. Each run parses the source, builds the AST and checks it.
+
+Usage:
+    python benchmarks/bench_checker_recovery.py [n_errors]
+"""
+
+import sys
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.semantics.static_checker import StaticChecker
+from src.semantics.static_error import StaticError
+
+
+CORRECT = "float f := y;"
+BROKEN = "float f := missing;"
+
+
+def inject_errors(source: str, n_errors: int) -> str:
+    # Read an undeclared name in the locals of evenly spaced methods
+    parts = source.split(CORRECT)
+    step = max(1, (len(parts) - 1) // n_errors)
+    out = parts[0]
+    for i, part in enumerate(parts[1:]):
+        broken = i % step == 0 and i // step < n_errors
+        out += (BROKEN if broken else CORRECT) + part
+    return out
+
+
+def run_pipeline(source: str, collect: bool = False):
+    ast = build_ast(OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source)))), "sll-ll")
+    checker = StaticChecker()
+    if collect:
+        checker.errors = []
+    try:
+        checker.check_program(ast)
+    except StaticError as error:
+        return [error]
+    return checker.errors or []
+
+
+def rerun_until_clean(source: str):
+    # Fix the first reported error and run again, like a user would
+    runs = 0
+    while True:
+        runs += 1
+        if not run_pipeline(source):
+            return runs
+        source = source.replace(BROKEN, CORRECT, 1)
+
+
+def main():
+    n_errors = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    sys.setrecursionlimit(10000)
+    clean = generate_program(4, 10, 50)
+    broken = inject_errors(clean, n_errors)
+    run_pipeline(clean)  # warm the shared prediction DFA
+
+    errors = run_pipeline(broken, collect=True)
+    assert len(errors) == n_errors, [str(error) for error in errors]
+    rows = [
+        ["clean run", 1, f"{measure(lambda: run_pipeline(clean)):.2f}"],
+        ["collecting run", 1, f"{measure(lambda: run_pipeline(broken, collect=True)):.2f}"],
+        ["raise + rerun", rerun_until_clean(broken), f"{measure(lambda: rerun_until_clean(broken), repeat=1):.2f}"],
+    ]
+    print(f"{len(clean) >> 10} KiB source, {n_errors} semantic errors")
+    print_table(["strategy", "runs", "seconds"], rows)
+
+
+if __name__ == "__main__":
+    main()
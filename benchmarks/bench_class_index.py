@@ -0,0 +1,64 @@
+"""
+Cost of subclass tests in a deep inheritance chain, walking superclass
+links versus the interval numbering of ClassIndex, and the StaticChecker
+time of a program coercing objects to their ancestors.
+
+Usage:
+    python benchmarks/bench_class_index.py [depth] [n_tests]
+"""
+
+import random
+import sys
+
+from common import measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.semantics.class_index import ClassIndex
+from src.semantics.static_checker import StaticChecker
+
+
+def hierarchy(depth: int) -> str:
+    classes = ["class C0 { }"]
+    classes += [f"class C{c} extends C{c - 1} {{ }}" for c in range(1, depth)]
+    decls = [f"        C{c} v{c} := new C{depth - 1}();" for c in range(depth)]
+    classes.append("class Program {\n    static void main() {\n" + "\n".join(decls) + "\n    }\n}")
+    return "\n".join(classes) + "\n"
+
+
+def walk_superclasses(superclasses, name, ancestor):
+    while name is not None:
+        if name == ancestor:
+            return True
+        name = superclasses.get(name)
+    return False
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    n_tests = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(hierarchy(depth)))))
+    ast = build_ast(parser, "sll-ll")
+    index = ClassIndex(ast)
+    superclasses = {decl.name: decl.superclass for decl in ast.class_decls}
+    rng = random.Random(0)
+    pairs = [(f"C{rng.randrange(depth)}", f"C{rng.randrange(depth)}") for _ in range(n_tests)]
+
+    walk_time = measure(lambda: [walk_superclasses(superclasses, a, b) for a, b in pairs])
+    index_time = measure(lambda: [index.is_subclass(a, b) for a, b in pairs])
+    number_time = measure(lambda: ClassIndex(ast))
+    check_time = measure(lambda: StaticChecker().check_program(ast))
+    print(f"{depth} classes, {n_tests} subclass tests")
+    print_table(
+        ["", "ms"],
+        [["superclass walk", f"{walk_time * 1000:.1f}"],
+         ["ClassIndex.is_subclass", f"{index_time * 1000:.1f}"],
+         ["ClassIndex numbering", f"{number_time * 1000:.2f}"],
+         ["StaticChecker", f"{check_time * 1000:.1f}"]],
+    )
+
+
+if __name__ == "__main__":
+    main()
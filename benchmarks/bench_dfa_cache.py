@@ -0,0 +1,72 @@
+"""
+First-parse latency of a fresh process with empty prediction DFAs versus
+one that restores a DFA cache warmed from a corpus.
+
+Each measurement runs in its own interpreter, as a per-file compile job
+would. The cache load time is reported separately from the parse.
+
+Usage:
+    python benchmarks/bench_dfa_cache.py [n_runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import generate_program, print_table
+
+from src.utils.dfa_cache import dfa_state_count, load_dfa_cache, save_dfa_cache, warm_dfa_cache
+
+
+def corpus():
+    return [generate_program(c, m, s) for c, m, s in [(1, 1, 10), (2, 3, 20), (3, 5, 40)]]
+
+
+def target():
+    # A program the warm-up corpus has not seen verbatim
+    return generate_program(2, 2, 15).replace("C1", "Shape")
+
+
+def child(cache_path: str):
+    start = time.perf_counter()
+    if cache_path != "-":
+        assert load_dfa_cache(cache_path)
+    loaded = time.perf_counter()
+    assert warm_dfa_cache([target()]) == 1
+    parsed = time.perf_counter()
+    print(loaded - start, parsed - loaded)
+
+
+def run_child(cache_path: str):
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", cache_path],
+        capture_output=True, text=True, check=True,
+    )
+    return [float(x) for x in result.stdout.split()]
+
+
+def main():
+    n_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "oplang.dfa")
+        warm_dfa_cache(corpus())
+        save_dfa_cache(cache_path)
+        print(f"cache: {dfa_state_count()} DFA states, {os.path.getsize(cache_path) >> 10} KiB")
+
+        rows = []
+        for name, path in [("cold", "-"), ("warm", cache_path)]:
+            runs = [run_child(path) for _ in range(n_runs)]
+            load = statistics.median(r[0] for r in runs)
+            parse = statistics.median(r[1] for r in runs)
+            rows.append([name, f"{load * 1e3:.1f}", f"{parse * 1e3:.1f}", f"{(load + parse) * 1e3:.1f}"])
+    print_table(["DFA", "load ms", "first parse ms", "total ms"], rows)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,60 @@
+"""
+Time of walking and checking a large AST with per-instance dispatch
+tables versus the double dispatch through node.accept().
+
+Usage:
+    python benchmarks/bench_dispatch.py [n_methods] [n_stmts]
+"""
+
+import sys
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.semantics.static_checker import StaticChecker
+from src.utils.visitor import BaseVisitor
+
+
+class Walker(BaseVisitor):
+    def visit_method_invocation_statement(self, node, o=None):
+        self.visit(node.method_call, o)
+
+
+class DoubleDispatch:
+    """Mixin restoring the visit() that goes through node.accept()."""
+
+    def visit(self, node, o=None):
+        return node.accept(self, o)
+
+
+class DoubleDispatchWalker(DoubleDispatch, Walker):
+    pass
+
+
+class DoubleDispatchChecker(DoubleDispatch, StaticChecker):
+    pass
+
+
+def main():
+    n_methods = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    n_stmts = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    source = generate_program(4, n_methods, n_stmts)
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    ast = build_ast(parser, "sll-ll")
+
+    rows = []
+    for name, walker, checker in [
+        ("node.accept()", DoubleDispatchWalker, DoubleDispatchChecker),
+        ("dispatch table", Walker, StaticChecker),
+    ]:
+        walk_time = measure(lambda: walker().visit(ast), repeat=5)
+        check_time = measure(lambda: checker().check_program(ast), repeat=5)
+        rows.append([name, f"{walk_time * 1000:.1f}", f"{check_time * 1000:.1f}"])
+    print_table(["dispatch", "walk ms", "StaticChecker ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Parse-tree size and parse/AST time on expression-dense programs.
+
+Counts every rule context and terminal node in the ANTLR parse tree, so
+the effect of the expression rule layout on tree size can be compared
+across grammar revisions.
+
+Usage:
+    python benchmarks/bench_expr_tree.py [n_stmts]
+"""
+
+import sys
+
+from common import measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.tree.Tree import TerminalNode
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.utils.parse_strategy import parse_two_stage
+
+
+EXPRESSIONS = [
+    "a + b * 2 - c / 3.0 % d",
+    "(x >= 1) && !done || -y < z",
+    "s ^ \"tail\" ^ t.name",
+    "p.q(1, 2.5, r[3]).w[i + 1] * -k",
+    "new Point(1, 2).dist(o) <= 10 == true",
+    "{1, 2, 3}[0] + 42 \\ 5",
+]
+
+
+def generate_expression_program(n_stmts: int) -> str:
+    stmts = "\n".join(
+        f"        v := {EXPRESSIONS[i % len(EXPRESSIONS)]};" for i in range(n_stmts)
+    )
+    return f"class Dense {{\n    void run() {{\n{stmts}\n    }}\n}}\n"
+
+
+def count_nodes(tree):
+    rules, terminals = 0, 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, TerminalNode):
+            terminals += 1
+            continue
+        rules += 1
+        stack.extend(node.getChildren())
+    return rules, terminals
+
+
+def parse(source: str):
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    return parse_two_stage(parser)
+
+
+def main():
+    n_stmts = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    source = generate_expression_program(n_stmts)
+    parse(source)  # warm the shared prediction DFA
+
+    tree = parse(source)
+    rules, terminals = count_nodes(tree)
+    parse_time = measure(lambda: parse(source))
+    ast_time = measure(lambda: ASTGeneration().visit(tree))
+
+    print_table(
+        ["statements", "rule nodes", "terminals", "parse s", "AST s"],
+        [[n_stmts, rules, terminals, f"{parse_time:.2f}", f"{ast_time:.3f}"]],
+    )
+
+
+if __name__ == "__main__":
+    main()
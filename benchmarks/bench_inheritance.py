@@ -0,0 +1,80 @@
+"""
+StaticChecker time for a long inheritance chain of wide classes, with
+inherited members resolved through linked member tables versus copied
+into every subclass.
+
+Class C<c> extends C<c-1> and declares n_members attributes of its own
+plus one method reading an attribute of the root class and one of its
+superclass. The copying checker deep-copies every inherited member into
+each subclass, as StaticChecker did before; it is run on chains of up
+to copy_depth classes only, as its time grows with depth squared.
+
+Usage:
+    python benchmarks/bench_inheritance.py [depth] [n_members] [copy_depth]
+"""
+
+import sys
+from copy import deepcopy
+
+from common import measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.semantics.scope_table import ScopeTable
+from src.semantics.static_checker import StaticChecker, get_class_symb
+
+
+class CopyingChecker(StaticChecker):
+    """Checker that copies the superclass's members into each subclass."""
+
+    def visit_class_decl(self, node, env):
+        superclass_symb = get_class_symb(node.superclass, env.global_scope) if node.superclass else None
+        if superclass_symb is None:
+            return super().visit_class_decl(node, env)
+        flattened = ScopeTable(env)
+        members, chain = superclass_symb.members, []
+        while members is not env:
+            chain.append(members)
+            members = members.parent
+        for members in reversed(chain):
+            for member in members:
+                flattened.declare(deepcopy(member))
+        copied = type(superclass_symb)(superclass_symb.name, superclass_symb.superclass, flattened)
+        env.symbols[superclass_symb.name] = copied
+        try:
+            return super().visit_class_decl(node, env)
+        finally:
+            env.symbols[superclass_symb.name] = superclass_symb
+
+
+def chain(depth: int, n_members: int) -> str:
+    classes = []
+    for c in range(depth):
+        extends = f" extends C{c - 1}" if c > 0 else ""
+        members = [f"    int a{c}_{k};" for k in range(n_members)]
+        inherited = f"a{c - 1}_{c % n_members}" if c > 0 else f"a0_0"
+        members.append(f"    int f{c}() {{ return this.a0_0 + {inherited}; }}")
+        if c == depth - 1:
+            members.append("    static void main() { }")
+        classes.append(f"class C{c}{extends} {{\n" + "\n".join(members) + "\n}")
+    return "\n".join(classes) + "\n"
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    n_members = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    copy_depth = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    rows = []
+    for d in sorted({depth // 10, depth // 2, depth, copy_depth}):
+        parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(chain(d, n_members)))))
+        ast = build_ast(parser, "sll-ll")
+        linked = measure(lambda: StaticChecker().check_program(ast))
+        copied = measure(lambda: CopyingChecker().check_program(ast), repeat=1) if d <= copy_depth else None
+        rows.append([d, n_members, f"{copied:.2f}" if copied is not None else "-", f"{linked:.3f}"])
+    print_table(["depth", "members/class", "copied s", "linked s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+AST memory and name comparison cost with and without interning of
+names and type nodes.
+
+The same parse tree is turned into ASTs twice: with the InternTable used
+by ASTGeneration, and with a table that returns fresh strings and type
+nodes as ASTGeneration did before. The retained memory of the ASTs, the
+time of the scope lookups StaticChecker performs by name, and the time
+of a full StaticChecker run are reported for both.
+
+Usage:
+    python benchmarks/bench_interning.py [n_copies] [n_stmts]
+"""
+
+import sys
+import tracemalloc
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.semantics.scope_table import ScopeTable
+from src.semantics.static_checker import StaticChecker, get_symb_by_id
+from src.utils.interning import InternTable
+from src.utils.nodes import ClassType, Identifier, PrimitiveType
+from src.utils.parse_strategy import parse_two_stage
+from src.utils.visitor import BaseVisitor
+
+
+class CopyingTable(InternTable):
+    """Table that shares nothing, as in ASTs built before interning."""
+
+    def name(self, text: str) -> str:
+        return text
+
+    def primitive_type(self, type_name: str) -> PrimitiveType:
+        return PrimitiveType(type_name)
+
+    def class_type(self, class_name: str) -> ClassType:
+        return ClassType(class_name)
+
+
+class _Symbol:
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class IdentifierCollector(BaseVisitor):
+    def __init__(self):
+        self.names = []
+
+    def visit_identifier(self, node: Identifier, o=None):
+        self.names.append(node.name)
+
+    def visit_method_invocation_statement(self, node, o=None):
+        self.visit(node.method_call, o)
+
+
+def lookups(ast):
+    """Return a lookup workload: every identifier use against a scope of declarations."""
+    collector = IdentifierCollector()
+    collector.visit(ast)
+    declared = {}
+    for name in collector.names:
+        declared.setdefault(name, name)
+    # Scope entries hold the declaration's own string, as in the checker
+    env = ScopeTable()
+    for name in declared.values():
+        env.declare(_Symbol(name))
+    return collector.names, env
+
+
+def scan(names, env):
+    for name in names:
+        get_symb_by_id(name, env)
+
+
+def main():
+    n_copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    n_stmts = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    sys.setrecursionlimit(10000)
+    source = generate_program(4, 10, n_stmts)
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    tree = parse_two_stage(parser)
+
+    rows = []
+    for name, table_class in [("fresh strings/types", CopyingTable), ("interned", InternTable)]:
+        table = table_class()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        asts = [ASTGeneration(table).visit(tree) for _ in range(n_copies)]
+        size = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        names, env = lookups(asts[0])
+        scan_time = measure(lambda: scan(names, env))
+        check_time = measure(lambda: StaticChecker().check_program(asts[0]))
+        rows.append([name, f"{size / n_copies / 1024:.0f}", f"{scan_time * 1000:.1f}", f"{check_time:.3f}"])
+
+    print(f"{len(source) >> 10} KiB source, {n_copies} ASTs")
+    print_table(["ASTs", "KiB per AST", "lookups ms", "check s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Tokenization throughput of the generated ANTLR lexer versus the
+hand-written FastLexer on generated programs.
+
+Usage:
+    python benchmarks/bench_lexers.py
+"""
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, Token
+from build.OPLangLexer import OPLangLexer
+from src.grammar.fast_lexer import FastLexer
+
+
+SIZES = [(1, 10, 100), (4, 10, 100), (16, 10, 100)]
+
+
+def drain(lexer):
+    count = 0
+    while lexer.nextToken().type != Token.EOF:
+        count += 1
+    return count
+
+
+def main():
+    rows = []
+    for n_classes, n_methods, n_stmts in SIZES:
+        source = generate_program(n_classes, n_methods, n_stmts)
+        size = len(source.encode("utf-8"))
+        n_tokens = drain(FastLexer(source))
+        assert n_tokens == drain(OPLangLexer(InputStream(source)))
+        antlr_time = measure(lambda: drain(OPLangLexer(InputStream(source))))
+        fast_time = measure(lambda: drain(FastLexer(source)))
+        rows.append([
+            size,
+            n_tokens,
+            f"{size / antlr_time / 1024:.0f}",
+            f"{size / fast_time / 1024:.0f}",
+            f"{antlr_time / fast_time:.1f}x",
+        ])
+    print_table(["bytes", "tokens", "ANTLR KiB/s", "fast KiB/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Wall time of StaticChecker on a large program versus ParallelChecker,
+which checks the signatures first and the method bodies in 1, 2 and 4
+worker processes, together with the time of the signature pass alone.
+Speedups need as many free cores as workers.
+
+Usage:
+    python benchmarks/bench_parallel_checker.py [n_classes] [n_methods]
+"""
+
+import os
+import sys
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.semantics.parallel_checker import ParallelChecker, SignatureChecker
+from src.semantics.static_checker import StaticChecker
+
+
+def main():
+    n_classes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    n_methods = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    sys.setrecursionlimit(10000)
+    source = generate_program(n_classes, n_methods, 100)
+    ast = build_ast(OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source)))), "sll-ll")
+
+    serial = measure(lambda: StaticChecker().check_program(ast))
+    rows = [
+        ["serial", f"{serial:.3f}", "1.00"],
+        ["signatures only", f"{measure(lambda: SignatureChecker().check_program(ast)):.3f}", ""],
+    ]
+    for workers in [1, 2, 4]:
+        elapsed = measure(lambda: ParallelChecker(workers).check_program(ast))
+        rows.append([f"{workers} workers", f"{elapsed:.3f}", f"{serial / elapsed:.2f}"])
+    print(f"{n_classes * n_methods} method bodies, {os.cpu_count()} CPUs")
+    print_table(["checker", "seconds", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
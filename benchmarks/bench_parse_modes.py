@@ -0,0 +1,50 @@
+"""
+Parse throughput of the single-stage LL parse versus the two-stage
+SLL-then-LL parse on generated multi-thousand-line programs.
+
+Usage:
+    python benchmarks/bench_parse_modes.py
+"""
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.utils.error_listener import NewErrorListener
+from src.utils.parse_strategy import parse_with_mode
+
+
+SIZES = [(2, 10, 100), (4, 10, 100), (8, 10, 100)]
+
+
+def parse(source: str, mode: str):
+    lexer = OPLangLexer(InputStream(source))
+    parser = OPLangParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parse_with_mode(parser, mode)
+
+
+def main():
+    rows = []
+    for n_classes, n_methods, n_stmts in SIZES:
+        source = generate_program(n_classes, n_methods, n_stmts)
+        size = len(source.encode("utf-8"))
+        lines = source.count("\n")
+        timings = {}
+        for mode in ("ll", "sll-ll"):
+            parse(source, mode)  # warm the shared prediction DFA
+            timings[mode] = measure(lambda: parse(source, mode))
+        rows.append([
+            lines,
+            size,
+            f"{size / timings['ll'] / 1024:.1f}",
+            f"{size / timings['sll-ll'] / 1024:.1f}",
+            f"{timings['ll'] / timings['sll-ll']:.2f}x",
+        ])
+    print_table(["lines", "bytes", "LL KiB/s", "SLL->LL KiB/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+StaticChecker time for a method with thousands of locals and a class
+with thousands of members, whose environment is a chain of hash scopes.
+
+Every local is declared in its own declaration that reads the previous
+one, then assigned; every attribute is read by a method of its own. With
+constant-time declarations and lookups, the time per symbol stays flat
+as the counts double.
+
+Usage:
+    python benchmarks/bench_scope_table.py [n_symbols ...]
+"""
+
+import sys
+
+from common import measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.semantics.static_checker import StaticChecker
+
+
+def many_locals(n: int) -> str:
+    lines = ["class Locals {", "    static void main() {", "        int v0 := 0;"]
+    lines += [f"        int v{k} := v{k - 1} + 1;" for k in range(1, n)]
+    lines += [f"        v{k} := v{n - 1 - k};" for k in range(n)]
+    return "\n".join(lines + ["    }", "}"]) + "\n"
+
+
+def many_members(n: int) -> str:
+    lines = ["class Members {"]
+    lines += [f"    int a{k} := {k};" for k in range(n)]
+    lines += [f"    int get{k}() {{ return a{k} + this.a{n - 1 - k}; }}" for k in range(n)]
+    return "\n".join(lines + ["    static void main() { }", "}"]) + "\n"
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1:]] or [1000, 2000, 4000]
+    rows = []
+    for name, generate in [("locals", many_locals), ("members", many_members)]:
+        for n in sizes:
+            parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(generate(n)))))
+            ast = build_ast(parser, "sll-ll")
+            check_time = measure(lambda: StaticChecker().check_program(ast))
+            rows.append([name, n, f"{check_time * 1000:.1f}", f"{check_time / n * 1e6:.1f}"])
+    print_table(["symbols", "count", "StaticChecker ms", "us/symbol"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Wall time of fanning AST analyses out to a process pool, with the AST
+pickled into every task versus shared once through shared memory.
+
+Each task walks the whole AST of a generated program with tree_height.
+With pickling, every task receives its own copy of the Program; with
+SharedAST, the tree is laid out once and every task receives a small
+handle and attaches read-only views. Runs use 1, 4 and 16 workers.
+
+Usage:
+    python benchmarks/bench_shared_ast.py [n_tasks] [n_methods]
+"""
+
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from common import generate_program, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.utils.shared_ast import SharedArena, SharedAST
+from src.utils.traversal import tree_height
+
+
+def walk_pickled(ast):
+    return tree_height(ast)
+
+
+def walk_shared(handle):
+    with SharedArena(handle) as arena:
+        return tree_height(arena.root())
+
+
+def run(workers: int, function, args) -> float:
+    with ProcessPoolExecutor(workers) as pool:
+        # Start the workers before timing
+        list(pool.map(abs, range(workers)))
+        start = time.perf_counter()
+        results = list(pool.map(function, args))
+        elapsed = time.perf_counter() - start
+    assert len(set(results)) == 1
+    return elapsed
+
+
+def main():
+    n_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    n_methods = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    sys.setrecursionlimit(10000)
+    source = generate_program(4, n_methods, 100)
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    ast = build_ast(parser, "sll-ll")
+
+    start = time.perf_counter()
+    shared = SharedAST(ast)
+    share_time = time.perf_counter() - start
+    with shared:
+        print(f"{n_tasks} tasks; pickled AST {len(pickle.dumps(ast)) >> 10} KiB, "
+              f"shared block {shared.shm.size >> 10} KiB laid out in {share_time:.3f} s, "
+              f"handle {len(pickle.dumps(shared.handle))} bytes")
+        rows = []
+        for workers in [1, 4, 16]:
+            pickled_time = run(workers, walk_pickled, [ast] * n_tasks)
+            shared_time = run(workers, walk_shared, [shared.handle] * n_tasks)
+            rows.append([workers, f"{pickled_time:.3f}", f"{shared_time:.3f}"])
+    print_table(["workers", "pickled s", "shared s"], rows)
+
+
+if __name__ == "__main__":
+    main()
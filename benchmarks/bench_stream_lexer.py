@@ -0,0 +1,54 @@
+"""
+Peak memory and time of counting the tokens of a large OPLang file by
+streaming it through stream_tokens versus reading it whole into a str.
+
+Usage:
+    python benchmarks/bench_stream_lexer.py [size_in_mib]
+"""
+
+import os
+import sys
+import tempfile
+
+from common import generate_program, print_table, profile
+
+from src.grammar.fast_lexer import FastLexer
+from src.grammar.stream_lexer import stream_tokens
+
+
+def write_source(path: str, size_mib: int):
+    block = generate_program(4, 10, 100)
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(size_mib * (1 << 20) // len(block) + 1):
+            f.write(block)
+
+
+def count_whole(path: str):
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for _ in FastLexer(f.read()))
+
+
+def count_streaming(path: str, chunk_size: int):
+    return sum(1 for _ in stream_tokens(path, chunk_size))
+
+
+def main():
+    size_mib = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.op")
+        write_source(path, size_mib)
+        file_size = os.path.getsize(path)
+
+        runs = [("whole file", lambda: count_whole(path))]
+        for chunk_size in (1 << 16, 1 << 20):
+            runs.append((f"stream {chunk_size >> 10} KiB", lambda c=chunk_size: count_streaming(path, c)))
+
+        rows = []
+        for name, fn in runs:
+            n_tokens, elapsed, peak = profile(fn, repeat=1)
+            rows.append([name, file_size >> 20, n_tokens, f"{elapsed:.2f}", f"{peak / (1 << 20):.2f}"])
+    print_table(["mode", "file MiB", "tokens", "seconds", "peak MiB"], rows)
+
+
+if __name__ == "__main__":
+    main()
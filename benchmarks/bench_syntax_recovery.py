@@ -0,0 +1,78 @@
+"""
+Time to find every syntax error in a large program: one recovering
+parse versus the raise-on-first parse repeated once per error, as in an
+edit-and-rerun loop, with a clean parse as the baseline.
+
+Usage:
+    python benchmarks/bench_syntax_recovery.py [n_errors]
+"""
+
+import sys
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.utils.error_listener import NewErrorListener, SyntaxException
+from src.utils.parse_strategy import parse_recovering
+
+
+BROKEN = "float f := ;"
+
+
+def inject_errors(source: str, n_errors: int) -> str:
+    # Break the local declaration of evenly spaced methods
+    parts = source.split("float f := y;")
+    step = max(1, (len(parts) - 1) // n_errors)
+    out = parts[0]
+    for i, part in enumerate(parts[1:]):
+        broken = i % step == 0 and i // step < n_errors
+        out += (BROKEN if broken else "float f := y;") + part
+    return out
+
+
+def make_parser(source: str):
+    return OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+
+
+def parse_raising(source: str):
+    parser = make_parser(source)
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    try:
+        parser.program()
+    except SyntaxException:
+        return 1
+    return 0
+
+
+def rerun_until_clean(source: str):
+    # Fix the first reported error and parse again, like a user would
+    runs = 0
+    while True:
+        runs += 1
+        if not parse_raising(source):
+            return runs
+        source = source.replace(BROKEN, "float f := y;", 1)
+
+
+def main():
+    n_errors = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    clean = generate_program(4, 10, 50)
+    broken = inject_errors(clean, n_errors)
+    parse_raising(clean)  # warm the shared prediction DFA
+
+    _, errors = parse_recovering(make_parser(broken))
+    assert len(errors) == n_errors, len(errors)
+    rows = [
+        ["clean parse", 1, f"{measure(lambda: parse_raising(clean)):.2f}"],
+        ["recovering parse", 1, f"{measure(lambda: parse_recovering(make_parser(broken))):.2f}"],
+        ["raise + rerun", rerun_until_clean(broken), f"{measure(lambda: rerun_until_clean(broken), repeat=1):.2f}"],
+    ]
+    print(f"{len(clean) >> 10} KiB source, {n_errors} syntax errors")
+    print_table(["strategy", "parses", "seconds"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Retained bytes per token and tokenization/parse time of CommonTokenStream
+versus the array-backed CompactTokenStream.
+
+Usage:
+    python benchmarks/bench_token_buffer.py [n_stmts]
+"""
+
+import sys
+import tracemalloc
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.grammar.fast_lexer import FastLexer
+from src.grammar.token_buffer import CompactTokenStream
+from src.utils.parse_strategy import parse_two_stage
+
+
+STREAMS = {
+    "CommonTokenStream": lambda source: CommonTokenStream(OPLangLexer(InputStream(source))),
+    "Compact (ANTLR lexer)": lambda source: CompactTokenStream(OPLangLexer(InputStream(source)), source),
+    "Compact (FastLexer)": lambda source: CompactTokenStream(FastLexer(source), source),
+}
+
+
+def filled(make_stream, source):
+    stream = make_stream(source)
+    stream.fill()
+    return stream
+
+
+def retained_bytes(make_stream, source):
+    # Memory still held once the stream is filled, excluding the source
+    tracemalloc.start()
+    stream = filled(make_stream, source)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return current, len(stream.tokens)
+
+
+def main():
+    n_stmts = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    source = generate_program(4, 10, n_stmts)
+    parse_two_stage(OPLangParser(STREAMS["CommonTokenStream"](source)))  # warm the DFA
+
+    rows = []
+    for name, make_stream in STREAMS.items():
+        size, n_tokens = retained_bytes(make_stream, source)
+        lex_time = measure(lambda: filled(make_stream, source))
+        parse_time = measure(lambda: parse_two_stage(OPLangParser(make_stream(source))))
+        rows.append([name, n_tokens, f"{size / n_tokens:.1f}", f"{lex_time:.2f}", f"{parse_time:.2f}"])
+    print(f"{len(source) >> 10} KiB source")
+    print_table(["stream", "tokens", "bytes/token", "tokenize s", "parse s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Time of a full AST walk with the recursive BaseVisitor versus the
+explicit-stack IterativeVisitor, and the deepest else-if chain each
+can walk.
+
+Usage:
+    python benchmarks/bench_traversal.py [n_methods] [n_stmts]
+"""
+
+import sys
+
+from common import generate_program, measure, print_table
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_builder import build_ast
+from src.utils.nodes import BlockStatement, BoolLiteral, BreakStatement, IfStatement
+from src.utils.traversal import IterativeVisitor
+from src.utils.visitor import BaseVisitor
+
+
+class Walker(BaseVisitor):
+    def visit_method_invocation_statement(self, node, o=None):
+        self.visit(node.method_call, o)
+
+
+def else_if_chain(depth: int):
+    stmt = BreakStatement()
+    for _ in range(depth):
+        stmt = IfStatement(BoolLiteral(True), BlockStatement([], []), stmt)
+    return stmt
+
+
+def deepest(walk, limit: int = 1_000_000) -> str:
+    depth = 1000
+    while depth <= limit:
+        try:
+            walk(else_if_chain(depth))
+        except RecursionError:
+            return f"< {depth}"
+        depth *= 10
+    return f">= {limit}"
+
+
+def main():
+    n_methods = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    n_stmts = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    source = generate_program(4, n_methods, n_stmts)
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    ast = build_ast(parser, "sll-ll")
+
+    rows = []
+    for name, walk in [("BaseVisitor (recursive)", Walker().visit), ("IterativeVisitor", IterativeVisitor().traverse)]:
+        rows.append([name, f"{measure(lambda: walk(ast)):.3f}", deepest(walk)])
+    print_table(["traversal", "walk s", "deepest chain"], rows)
+
+
+if __name__ == "__main__":
+    main()
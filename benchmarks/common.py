@@ -0,0 +1,111 @@
+"""
+Shared helpers for the OPLang benchmark scripts.
+This module sets up the import paths used by the pipeline, generates
+synthetic OPLang programs of configurable size, and times and profiles
+callables.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "build"))
+
+
+STATEMENT_TEMPLATES = [
+    "i := i + {k};",
+    "f := f * 1.5 + i;",
+    "b := (i >= {k}) && !b;",
+    "s := s ^ \"x{k}\";",
+    "if b then i := i - 1; else i := i % {m};",
+    "for j := 0 to {k} do f := f + j;",
+    "arr[{idx}] := i * {k} \\ {m};",
+    "f := this.{callee}(i, f);",
+]
+
+
+def generate_method(index: int, n_stmts: int) -> str:
+    """Render one float-returning instance method with n_stmts statements."""
+    callee = f"m{index - 1}" if index > 0 else None
+    templates = [t for t in STATEMENT_TEMPLATES if callee or "{callee}" not in t]
+    lines = [
+        f"    float m{index}(int x; float y) {{",
+        "        int i := x, j;",
+        "        float f := y;",
+        "        boolean b := true;",
+        "        string s := \"\";",
+        "        int[8] arr;",
+    ]
+    for k in range(n_stmts):
+        template = templates[k % len(templates)]
+        stmt = template.format(k=k + 1, m=k % 7 + 2, idx=k % 8, callee=callee)
+        lines.append(f"        {stmt}")
+    lines.append("        return f;")
+    lines.append("    }")
+    return "\n".join(lines)
+
+
+def generate_program(n_classes: int = 1, n_methods: int = 1, n_stmts: int = 10) -> str:
+    """
+    Generate a syntactically and semantically valid OPLang program.
+
+    Args:
+        n_classes (int): Number of classes; each extends the previous one
+        n_methods (int): Number of methods per class
+        n_stmts (int): Number of statements per method body
+
+    Returns:
+        str: The program source
+    """
+    classes = []
+    for c in range(n_classes):
+        extends = f" extends C{c - 1}" if c > 0 else ""
+        members = [f"    int a{c}, b{c};", f"    static final int K{c} := {c};"]
+        members += [generate_method(m, n_stmts) for m in range(n_methods)]
+        if c == n_classes - 1:
+            members.append("    static void main() { }")
+        classes.append(f"class C{c}{extends} {{\n" + "\n".join(members) + "\n}")
+    return "\n\n".join(classes) + "\n"
+
+
+def measure(fn, repeat: int = 3):
+    """Return the best wall-clock time in seconds of repeat calls to fn."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def profile(fn, repeat: int = 3):
+    """
+    Time fn and measure the peak memory it allocates.
+
+    Args:
+        fn: Callable to profile, called repeat + 1 times
+        repeat (int): Number of timed calls
+
+    Returns:
+        (result of fn, best time in seconds, peak traced bytes)
+    """
+    # Time untraced runs; tracemalloc slows allocation-heavy code a lot
+    elapsed = measure(fn, repeat)
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def print_table(headers, rows):
+    """Print rows as a left-aligned plain-text table."""
+    cells = [list(map(str, headers))] + [list(map(str, row)) for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for n, row in enumerate(cells):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+        if n == 0:
+            print("  ".join("-" * width for width in widths))
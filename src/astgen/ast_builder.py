@@ -0,0 +1,116 @@
+"""
+Direct AST construction for OPLang programming language.
+This module builds AST nodes while the parser runs, through a parse
+listener, so the full ANTLR parse tree is never materialised.
+"""
+
+from antlr4 import ParserRuleContext
+from antlr4.tree.Tree import ParseTreeListener
+
+from build.OPLangParser import OPLangParser
+from src.utils.ast_index import ASTIndex
+from src.utils.error_listener import SyntaxException
+from src.utils.parse_strategy import parse_with_mode
+from .ast_generation import ASTGeneration
+
+
+class _CachedASTGeneration(ASTGeneration):
+    """ASTGeneration that reads finished children from their cached AST."""
+
+    def visit(self, tree):
+        if isinstance(tree, ParserRuleContext):
+            return tree.ast
+        return tree.accept(self)
+
+    def visitChildren(self, node):
+        result = self.defaultResult()
+        for child in node.getChildren():
+            result = self.aggregateResult(result, self.visit(child))
+        return result
+
+
+class ASTBuilder(ParseTreeListener):
+    """
+    Parse listener that turns each rule context into its AST on exit.
+
+    The parser must run with buildParseTrees = False. In that mode the
+    parser still attaches consumed tokens to the current context but never
+    links rule contexts together, so the listener does it: a context is
+    attached to its parent only once it has been reduced to an AST, and
+    its own children are dropped at that point. Only the contexts on the
+    current rule path, plus the reduced children of those, are alive at
+    any time.
+
+    The AST for each context is computed by the unchanged ASTGeneration
+    methods, which therefore see exactly the children they see in a full
+    parse tree. Rules whose AST depends on the caller are left unreduced
+    and are visited by their parent as usual.
+    """
+
+    # Built by the enclosing declaration, which passes the node class
+    DEFERRED = (OPLangParser.Ne_cm_asgn_id_listContext, OPLangParser.Asgn_idContext)
+
+    def __init__(self, index: ASTIndex = None):
+        # Resolve each rule's visit method once instead of through accept()
+        generation = _CachedASTGeneration(index=index)
+        self.reducers = {}
+        for rule in OPLangParser.ruleNames:
+            name = rule[0].upper() + rule[1:]
+            self.reducers[getattr(OPLangParser, name + "Context")] = getattr(generation, "visit" + name)
+        for ctx_class in self.DEFERRED:
+            self.reducers[ctx_class] = None
+
+    def enterEveryRule(self, ctx:ParserRuleContext):
+        # A left-recursive rule re-parents its finished left operand under
+        # the new context after that operand has already been attached to
+        # the enclosing rule; move it across
+        parent = ctx.parentCtx
+        if parent is not None and parent.children and parent.children[-1].parentCtx is ctx:
+            ctx.addChild(parent.children.pop())
+
+    def exitEveryRule(self, ctx:ParserRuleContext):
+        # After a syntax error the contexts may be incomplete, and rules are
+        # still exited while a raising error listener, or the bailing SLL
+        # stage of a two-stage parse, which reports no error, unwinds the
+        # parse; the bail marks every context it unwinds with the exception
+        if ctx.exception is not None or ctx.parser.getNumberOfSyntaxErrors():
+            return
+        reduce = self.reducers[type(ctx)]
+        if reduce is not None:
+            ctx.ast = reduce(ctx)
+            ctx.children = None
+        if ctx.parentCtx is not None:
+            ctx.parentCtx.addChild(ctx)
+
+
+def build_ast(parser, mode: str = "ll", entry: str = "program", index: ASTIndex = None):
+    """
+    Parse with parser and build the AST during the parse.
+
+    The result is identical to visiting the parse tree with ASTGeneration,
+    but the parse tree is discarded rule by rule as it is reduced, which
+    lowers peak memory and skips the second tree walk.
+
+    Args:
+        parser: An OPLangParser instance with its error listeners installed
+        mode (str): Parse mode, as accepted by parse_with_mode
+        entry (str): Name of the start rule to invoke
+        index (ASTIndex): Optional index to add the generated Program to
+
+    Returns:
+        The AST node for the start rule
+
+    Raises:
+        SyntaxException: If the parser recovered from syntax errors
+            instead of raising, as no AST is built for invalid input
+    """
+    builder = ASTBuilder(index)
+    parser.buildParseTrees = False
+    parser.addParseListener(builder)
+    try:
+        tree = parse_with_mode(parser, mode, entry)
+    finally:
+        parser.removeParseListener(builder)
+    if parser.getNumberOfSyntaxErrors():
+        raise SyntaxException(f"{parser.getNumberOfSyntaxErrors()} syntax error(s)")
+    return tree.ast
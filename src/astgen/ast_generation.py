@@ -7,30 +7,45 @@ into Abstract Syntax Trees using the visitor pattern.
 from functools import reduce
 from build.OPLangVisitor import OPLangVisitor
 from build.OPLangParser import OPLangParser
+from src.utils.ast_index import ASTIndex
+from src.utils.interning import InternTable
 from src.utils.nodes import *
 
 
 class ASTGeneration(OPLangVisitor):
+    def __init__(self, intern_table: InternTable = None, index: ASTIndex = None):
+        # Pass one table to every ASTGeneration of a compilation so that
+        # all of its ASTs share names and type nodes
+        self.interned = intern_table if intern_table is not None else InternTable()
+        # Optional index that every generated Program is added to
+        self.index = index
+
+
+    def name(self, terminal) -> str:
+        """Return the interned text of a terminal node."""
+        return self.interned.name(terminal.getText())
+
+
     # Visit a parse tree produced by OPLangParser#program.
     def visitProgram(self, ctx:OPLangParser.ProgramContext):
         # program: ne_cls_decl_list EOF;
         cls_decl_list = self.visit(ctx.ne_cls_decl_list())
-        return Program(cls_decl_list)
+        program = Program(cls_decl_list)
+        if self.index is not None:
+            self.index.add(program)
+        return program
 
 
     # Visit a parse tree produced by OPLangParser#ne_cls_decl_list.
     def visitNe_cls_decl_list(self, ctx:OPLangParser.Ne_cls_decl_listContext):
-        # ne_cls_decl_list: cls_decl ne_cls_decl_list | cls_decl ;
-        cls_decl_list = [self.visit(ctx.cls_decl())]
-        if ctx.ne_cls_decl_list():
-            return cls_decl_list + self.visit(ctx.ne_cls_decl_list())
-        return cls_decl_list
+        # ne_cls_decl_list: cls_decl+ ;
+        return [self.visit(cls_decl) for cls_decl in ctx.cls_decl()]
 
 
     # Visit a parse tree produced by OPLangParser#cls_decl.
     def visitCls_decl(self, ctx:OPLangParser.Cls_declContext):
         # cls_decl: CLASS ID cls_extension LB mem_decl_list RB ;
-        cls_name = str(ctx.ID())
+        cls_name = self.name(ctx.ID())
         sup_name = self.visit(ctx.cls_extension())
         mem_decl_list = self.visit(ctx.mem_decl_list())
         return ClassDecl(cls_name, sup_name, mem_decl_list)
@@ -39,16 +54,13 @@ class ASTGeneration(OPLangVisitor):
     # Visit a parse tree produced by OPLangParser#cls_extension.
     def visitCls_extension(self, ctx:OPLangParser.Cls_extensionContext):
         # cls_extension: EXTENDS ID |  ;
-        return str(ctx.ID()) if ctx.ID() else None
+        return self.name(ctx.ID()) if ctx.ID() else None
 
 
     # Visit a parse tree produced by OPLangParser#mem_decl_list.
     def visitMem_decl_list(self, ctx:OPLangParser.Mem_decl_listContext):
-        # mem_decl_list: mem_decl mem_decl_list |  ;
-        if not ctx.mem_decl():
-            return []
-        mem_decl_list = [self.visit(ctx.mem_decl())]
-        return mem_decl_list + self.visit(ctx.mem_decl_list())
+        # mem_decl_list: mem_decl* ;
+        return [self.visit(mem_decl) for mem_decl in ctx.mem_decl()]
 
 
     # Visit a parse tree produced by OPLangParser#mem_decl.
@@ -76,17 +88,14 @@ class ASTGeneration(OPLangVisitor):
 
     # Visit a parse tree produced by OPLangParser#ne_cm_asgn_id_list.
     def visitNe_cm_asgn_id_list(self, ctx:OPLangParser.Ne_cm_asgn_id_listContext, structure):
-        # ne_cm_asgn_id_list: asgn_id COMMA ne_cm_asgn_id_list | asgn_id ;
-        attr_list = [self.visitAsgn_id(ctx.asgn_id(), structure)]
-        if ctx.ne_cm_asgn_id_list():
-            return attr_list + self.visitNe_cm_asgn_id_list(ctx.ne_cm_asgn_id_list(), structure)
-        return attr_list
+        # ne_cm_asgn_id_list: asgn_id (COMMA asgn_id)* ;
+        return [self.visitAsgn_id(asgn_id, structure) for asgn_id in ctx.asgn_id()]
 
 
     # Visit a parse tree produced by OPLangParser#asgn_id.
     def visitAsgn_id(self, ctx:OPLangParser.Asgn_idContext, structure):
         # asgn_id: ID asgn_expr ;
-        name = str(ctx.ID())
+        name = self.name(ctx.ID())
         init_value = self.visit(ctx.asgn_expr())
         return structure(name, init_value)
 
@@ -104,7 +113,7 @@ class ASTGeneration(OPLangVisitor):
         # method_decl: method_modifier dtype ID LP sm_param_decl_list RP block_stmt ;
         is_static = self.visit(ctx.method_modifier())
         return_type = self.visit(ctx.dtype())
-        name = str(ctx.ID())
+        name = self.name(ctx.ID())
         param_list = self.visit(ctx.sm_param_decl_list())
         body = self.visit(ctx.block_stmt())
         return MethodDecl(is_static, return_type, name, param_list, body)
@@ -126,11 +135,8 @@ class ASTGeneration(OPLangVisitor):
 
     # Visit a parse tree produced by OPLangParser#ne_sm_param_decl_list.
     def visitNe_sm_param_decl_list(self, ctx:OPLangParser.Ne_sm_param_decl_listContext):
-        # ne_sm_param_decl_list: param_decl SEMI sm_param_decl_list | param_decl ;
-        param_list = self.visit(ctx.param_decl())
-        if ctx.sm_param_decl_list():
-            return param_list + self.visit(ctx.sm_param_decl_list())
-        return param_list
+        # ne_sm_param_decl_list: param_decl (SEMI param_decl)* SEMI? ;
+        return [param for param_decl in ctx.param_decl() for param in self.visit(param_decl)]
 
 
     # Visit a parse tree produced by OPLangParser#param_decl.
@@ -143,11 +149,8 @@ class ASTGeneration(OPLangVisitor):
 
     # Visit a parse tree produced by OPLangParser#ne_cm_id_list.
     def visitNe_cm_id_list(self, ctx:OPLangParser.Ne_cm_id_listContext):
-        # ne_cm_id_list: ID COMMA ne_cm_id_list | ID ;
-        id_list = [str(ctx.ID())]
-        if ctx.ne_cm_id_list():
-            return id_list + self.visit(ctx.ne_cm_id_list())
-        return id_list
+        # ne_cm_id_list: ID (COMMA ID)* ;
+        return [self.name(id) for id in ctx.ID()]
 
 
     # Visit a parse tree produced by OPLangParser#constructor_decl.
@@ -161,7 +164,7 @@ class ASTGeneration(OPLangVisitor):
     # Visit a parse tree produced by OPLangParser#default_constructor_decl.
     def visitDefault_constructor_decl(self, ctx:OPLangParser.Default_constructor_declContext):
         # default_constructor_decl: ID LP RP block_stmt ;
-        cons_name = str(ctx.ID())
+        cons_name = self.name(ctx.ID())
         param_list = []
         body = self.visit(ctx.block_stmt())
         return ConstructorDecl(cons_name, param_list, body)
@@ -170,10 +173,10 @@ class ASTGeneration(OPLangVisitor):
     # Visit a parse tree produced by OPLangParser#copy_constructor_decl.
     def visitCopy_constructor_decl(self, ctx:OPLangParser.Copy_constructor_declContext):
         # copy_constructor_decl: ID LP ID ID RP block_stmt ;
-        cons_name = str(ctx.ID(0))
-        cls_name = str(ctx.ID(1))
-        param_name = str(ctx.ID(2))
-        param_list = [Parameter(ClassType(cls_name), param_name)]
+        cons_name = self.name(ctx.ID(0))
+        cls_name = self.name(ctx.ID(1))
+        param_name = self.name(ctx.ID(2))
+        param_list = [Parameter(self.interned.class_type(cls_name), param_name)]
         body = self.visit(ctx.block_stmt())
         return ConstructorDecl(cons_name, param_list, body)
 
@@ -181,7 +184,7 @@ class ASTGeneration(OPLangVisitor):
     # Visit a parse tree produced by OPLangParser#user_constructor_decl.
     def visitUser_constructor_decl(self, ctx:OPLangParser.User_constructor_declContext):
         # user_constructor_decl: ID LP sm_param_decl_list RP block_stmt ;
-        cons_name = str(ctx.ID())
+        cons_name = self.name(ctx.ID())
         param_list = self.visit(ctx.sm_param_decl_list())
         body = self.visit(ctx.block_stmt())
         return ConstructorDecl(cons_name, param_list, body)
@@ -190,7 +193,7 @@ class ASTGeneration(OPLangVisitor):
     # Visit a parse tree produced by OPLangParser#destructor_decl.
     def visitDestructor_decl(self, ctx:OPLangParser.Destructor_declContext):
         # destructor_decl: TILDE ID LP RP block_stmt ;
-        dest_name = str(ctx.ID())
+        dest_name = self.name(ctx.ID())
         body = self.visit(ctx.block_stmt())
         return DestructorDecl(dest_name, body)
 
@@ -199,7 +202,7 @@ class ASTGeneration(OPLangVisitor):
     def visitDtype(self, ctx:OPLangParser.DtypeContext):
         # dtype: ptype | atype | ctype | rtype | VOID ;
         if ctx.VOID():
-            return PrimitiveType(str(ctx.VOID()))
+            return self.interned.primitive_type(ctx.VOID().getText())
         return self.visitChildren(ctx)
 
 
@@ -210,7 +213,7 @@ class ASTGeneration(OPLangVisitor):
         type_name = str(ctx.FLOAT()) if ctx.FLOAT() else type_name
         type_name = str(ctx.BOOLEAN()) if ctx.BOOLEAN() else type_name
         type_name = str(ctx.STRING()) if ctx.STRING() else type_name
-        return PrimitiveType(type_name)
+        return self.interned.primitive_type(type_name)
 
 
     # Visit a parse tree produced by OPLangParser#atype.
@@ -224,8 +227,8 @@ class ASTGeneration(OPLangVisitor):
     # Visit a parse tree produced by OPLangParser#ctype.
     def visitCtype(self, ctx:OPLangParser.CtypeContext):
         # ctype: ID ;
-        cls_name = str(ctx.ID())
-        return ClassType(cls_name)
+        cls_name = self.name(ctx.ID())
+        return self.interned.class_type(cls_name)
 
 
     # Visit a parse tree produced by OPLangParser#rtype.
@@ -237,129 +240,71 @@ class ASTGeneration(OPLangVisitor):
 
     # Visit a parse tree produced by OPLangParser#expr.
     def visitExpr(self, ctx:OPLangParser.ExprContext):
-        # expr    : gtexpr (LT | GT | LTE | GTE) gtexpr | gtexpr ;
-        if ctx.getChildCount() == 1:
-            return self.visit(ctx.gtexpr(0))
-        lhs, rhs = self.visit(ctx.gtexpr(0)), self.visit(ctx.gtexpr(1))
-        op = str(ctx.getChild(1))
-        return BinaryOp(lhs, op, rhs)
-
-
-    # Visit a parse tree produced by OPLangParser#gtexpr.
-    def visitGtexpr(self, ctx:OPLangParser.GtexprContext):
-        # gtexpr  : eqexpr (EQ | NEQ) eqexpr | eqexpr ;
-        if ctx.getChildCount() == 1:
-            return self.visit(ctx.eqexpr(0))
-        lhs, rhs = self.visit(ctx.eqexpr(0)), self.visit(ctx.eqexpr(1))
-        op = str(ctx.getChild(1))
-        return BinaryOp(lhs, op, rhs)
-
-
-    # Visit a parse tree produced by OPLangParser#eqexpr.
-    def visitEqexpr(self, ctx:OPLangParser.EqexprContext):
-        # eqexpr  : eqexpr (AND | OR) lgexpr | lgexpr ;
-        if ctx.getChildCount() == 1:
-            return self.visit(ctx.lgexpr())
-        lhs, rhs = self.visit(ctx.eqexpr()), self.visit(ctx.lgexpr())
-        op = str(ctx.getChild(1))
-        return BinaryOp(lhs, op, rhs)
-
-
-    # Visit a parse tree produced by OPLangParser#lgexpr.
-    def visitLgexpr(self, ctx:OPLangParser.LgexprContext):
-        # lgexpr  : lgexpr (ADD | SUB) addexpr | addexpr ;
-        if ctx.getChildCount() == 1:
-            return self.visit(ctx.addexpr())
-        lhs, rhs = self.visit(ctx.lgexpr()), self.visit(ctx.addexpr())
-        op = str(ctx.getChild(1))
-        return BinaryOp(lhs, op, rhs)
-
-
-    # Visit a parse tree produced by OPLangParser#addexpr.
-    def visitAddexpr(self, ctx:OPLangParser.AddexprContext):
-        # addexpr : addexpr (MUL | FLTDIV | INTDIV | MOD) mulexpr | mulexpr ;
-        if ctx.getChildCount() == 1:
-            return self.visit(ctx.mulexpr())
-        lhs, rhs = self.visit(ctx.addexpr()), self.visit(ctx.mulexpr())
-        op = str(ctx.getChild(1))
-        return BinaryOp(lhs, op, rhs)
-
-
-    # Visit a parse tree produced by OPLangParser#mulexpr.
-    def visitMulexpr(self, ctx:OPLangParser.MulexprContext):
-        # mulexpr : mulexpr CONCAT conexpr | conexpr ;
-        if ctx.getChildCount() == 1:
-            return self.visit(ctx.conexpr())
-        lhs, rhs = self.visit(ctx.mulexpr()), self.visit(ctx.conexpr())
-        op = str(ctx.getChild(1))
-        return BinaryOp(lhs, op, rhs)
-
-
-    # Visit a parse tree produced by OPLangParser#conexpr.
-    def visitConexpr(self, ctx:OPLangParser.ConexprContext):
-        # conexpr : NOT conexpr | notexpr ;
-        if not ctx.NOT():
-            return self.visit(ctx.notexpr())
-        op = str(ctx.NOT())
-        operand = self.visit(ctx.conexpr())
-        return UnaryOp(op, operand)
-
-
-    # Visit a parse tree produced by OPLangParser#notexpr.
-    def visitNotexpr(self, ctx:OPLangParser.NotexprContext):
-        # notexpr : (ADD | SUB) notexpr | uniexpr ;
-        if ctx.getChildCount() == 1:
-            return self.visit(ctx.uniexpr())
-        op = str(ctx.getChild(0))
-        operand = self.visit(ctx.notexpr())
-        return UnaryOp(op, operand)
+        # expr    : binexpr ((EQ | NEQ) binexpr)? ((LT | GT | LTE | GTE) binexpr ((EQ | NEQ) binexpr)?)? ;
+        terms, rel_op = [self.visit(ctx.binexpr(0))], None
+        for i in range(1, ctx.getChildCount(), 2):
+            op, operand = self.name(ctx.getChild(i)), self.visit(ctx.getChild(i + 1))
+            if op in ("==", "!="):
+                terms[-1] = BinaryOp(terms[-1], op, operand)
+            else:
+                rel_op = op
+                terms.append(operand)
+        if rel_op is None:
+            return terms[0]
+        return BinaryOp(terms[0], rel_op, terms[1])
+
+
+    # Visit a parse tree produced by OPLangParser#binexpr.
+    def visitBinexpr(self, ctx:OPLangParser.BinexprContext):
+        # binexpr : binexpr CONCAT binexpr
+        #         | binexpr (MUL | FLTDIV | INTDIV | MOD) binexpr
+        #         | binexpr (ADD | SUB) binexpr
+        #         | binexpr (AND | OR) binexpr
+        #         | NOT* (ADD | SUB)* uniexpr
+        #         ;
+        if not ctx.uniexpr():
+            lhs, rhs = self.visit(ctx.binexpr(0)), self.visit(ctx.binexpr(1))
+            op = self.name(ctx.getChild(1))
+            return BinaryOp(lhs, op, rhs)
+        operand = self.visit(ctx.uniexpr())
+        for i in range(ctx.getChildCount() - 2, -1, -1):
+            operand = UnaryOp(self.name(ctx.getChild(i)), operand)
+        return operand
 
 
     # Visit a parse tree produced by OPLangParser#uniexpr.
-    def visitUniexpr(self, ctx:OPLangParser.UniexprContext, postfix_ops=[]):
-        # uniexpr : uniexpr LSB expr RSB | uniexpr DOT ID callargs | idxexpr ;
-        if ctx.getChildCount() == 1:
-            if not postfix_ops:
-                return self.visit(ctx.idxexpr())
-            primary = self.visit(ctx.idxexpr())
-            return PostfixExpression(primary, postfix_ops)
+    def visitUniexpr(self, ctx:OPLangParser.UniexprContext):
+        # uniexpr : primexpr postfix_op* ;
+        primary = self.visit(ctx.primexpr())
+        if not ctx.postfix_op():
+            return primary
+        postfix_ops = [self.visit(postfix_op) for postfix_op in ctx.postfix_op()]
+        return PostfixExpression(primary, postfix_ops)
+
+
+    # Visit a parse tree produced by OPLangParser#postfix_op.
+    def visitPostfix_op(self, ctx:OPLangParser.Postfix_opContext):
+        # postfix_op: LSB expr RSB | DOT ID callargs ;
         if ctx.expr():
-            idx_expr = self.visit(ctx.expr())
-            postfix_op = ArrayAccess(idx_expr)
-        if ctx.ID():
-            name = str(ctx.ID())
-            args = self.visit(ctx.callargs())
-            postfix_op = MemberAccess(name) if args is None else MethodCall(name, args)
-        postfix_ops = [postfix_op] + postfix_ops
-        return self.visitUniexpr(ctx.uniexpr(), postfix_ops)
-
-
-    # Visit a parse tree produced by OPLangParser#idxexpr.
-    def visitIdxexpr(self, ctx:OPLangParser.IdxexprContext):
-        # idxexpr : NEW ID LP cm_expr_list RP | newexpr ;
-        if ctx.getChildCount() == 1:
-            return self.visit(ctx.newexpr())
-        cls_name = str(ctx.ID())
-        args = self.visit(ctx.cm_expr_list())
-        return ObjectCreation(cls_name, args)
-
-
-    # Visit a parse tree produced by OPLangParser#newexpr.
-    def visitNewexpr(self, ctx:OPLangParser.NewexprContext):
-        # newexpr : LP expr RP | parexpr ;
-        if ctx.getChildCount() == 1:
-            return self.visit(ctx.parexpr())
-        paren_expr = self.visit(ctx.expr())
-        return ParenthesizedExpression(paren_expr)
-
-
-    # Visit a parse tree produced by OPLangParser#parexpr.
-    def visitParexpr(self, ctx:OPLangParser.ParexprContext):
-        # parexpr : lit | ID | THIS | NIL ;
+            return ArrayAccess(self.visit(ctx.expr()))
+        name = self.name(ctx.ID())
+        args = self.visit(ctx.callargs())
+        return MemberAccess(name) if args is None else MethodCall(name, args)
+
+
+    # Visit a parse tree produced by OPLangParser#primexpr.
+    def visitPrimexpr(self, ctx:OPLangParser.PrimexprContext):
+        # primexpr: NEW ID LP cm_expr_list RP | LP expr RP | lit | ID | THIS | NIL ;
+        if ctx.NEW():
+            cls_name = self.name(ctx.ID())
+            args = self.visit(ctx.cm_expr_list())
+            return ObjectCreation(cls_name, args)
+        if ctx.expr():
+            return ParenthesizedExpression(self.visit(ctx.expr()))
         if ctx.lit():
             return self.visit(ctx.lit())
         if ctx.ID():
-            return Identifier(str(ctx.ID()))
+            return Identifier(self.name(ctx.ID()))
         if ctx.THIS():
             return ThisExpression()
         return NilLiteral()
@@ -383,11 +328,8 @@ class ASTGeneration(OPLangVisitor):
 
     # Visit a parse tree produced by OPLangParser#ne_cm_expr_list.
     def visitNe_cm_expr_list(self, ctx:OPLangParser.Ne_cm_expr_listContext):
-        # ne_cm_expr_list: expr COMMA cm_expr_list | expr ;
-        expr_list = [self.visit(ctx.expr())]
-        if ctx.cm_expr_list():
-            return expr_list + self.visit(ctx.cm_expr_list())
-        return expr_list
+        # ne_cm_expr_list: expr (COMMA expr)* COMMA? ;
+        return [self.visit(expr) for expr in ctx.expr()]
 
 
     # Visit a parse tree produced by OPLangParser#lit.
@@ -425,11 +367,8 @@ class ASTGeneration(OPLangVisitor):
     
     # Visit a parse tree produced by OPLangParser#ne_cm_plit_list.
     def visitNe_cm_plit_list(self, ctx:OPLangParser.Ne_cm_plit_listContext):
-        # ne_cm_plit_list: plit COMMA ne_cm_plit_list | plit ;
-        plit_list = [self.visit(ctx.plit())]
-        if ctx.ne_cm_plit_list():
-            return plit_list + self.visit(ctx.ne_cm_plit_list())
-        return plit_list
+        # ne_cm_plit_list: plit (COMMA plit)* ;
+        return [self.visit(plit) for plit in ctx.plit()]
 
 
     # Visit a parse tree produced by OPLangParser#stmt.
@@ -455,11 +394,8 @@ class ASTGeneration(OPLangVisitor):
 
     # Visit a parse tree produced by OPLangParser#vardecl_list.
     def visitVardecl_list(self, ctx:OPLangParser.Vardecl_listContext):
-        # vardecl_list: vardecl vardecl_list |  ;
-        if not ctx.vardecl():
-            return []
-        var_list = [self.visit(ctx.vardecl())]
-        return var_list + self.visit(ctx.vardecl_list())
+        # vardecl_list: vardecl* ;
+        return [self.visit(vardecl) for vardecl in ctx.vardecl()]
 
 
     # Visit a parse tree produced by OPLangParser#vardecl.
@@ -479,11 +415,8 @@ class ASTGeneration(OPLangVisitor):
 
     # Visit a parse tree produced by OPLangParser#stmt_list.
     def visitStmt_list(self, ctx:OPLangParser.Stmt_listContext):
-        # stmt_list: stmt stmt_list |  ;
-        if not ctx.stmt():
-            return []
-        stmt_list = [self.visit(ctx.stmt())]
-        return stmt_list + self.visit(ctx.stmt_list())
+        # stmt_list: stmt* ;
+        return [self.visit(stmt) for stmt in ctx.stmt()]
 
 
     # Visit a parse tree produced by OPLangParser#asgn_stmt.
@@ -531,9 +464,9 @@ class ASTGeneration(OPLangVisitor):
     # Visit a parse tree produced by OPLangParser#for_stmt.
     def visitFor_stmt(self, ctx:OPLangParser.For_stmtContext):
         # for_stmt: FOR ID ASSIGN expr (TO | DOWNTO) expr DO stmt ;
-        var_name = str(ctx.ID())
+        var_name = self.name(ctx.ID())
         start = self.visit(ctx.expr(0))
-        dir = str(ctx.getChild(4))
+        dir = self.name(ctx.getChild(4))
         end = self.visit(ctx.expr(1))
         body = self.visit(ctx.stmt())
         return ForStatement(var_name, start, dir, end, body)
@@ -18,6 +18,20 @@ def emit(self):
         raise ErrorToken(result.text); 
     else:
         return super().emit();
+
+# Lexical errors recorded so far when recovering; None raises on the first one
+errors = None
+
+def nextToken(self):
+    while True:
+        try:
+            return super().nextToken()
+        except LexerError as error:
+            if self.errors is None:
+                raise
+            # The erroneous token has been consumed; note where it was and go on
+            error.line, error.column = self._token.line, self._token.column
+            self.errors.append(error)
 }
 
 options{
@@ -30,14 +44,14 @@ options{
 
 // Class list
 program: ne_cls_decl_list EOF;
-ne_cls_decl_list: cls_decl ne_cls_decl_list | cls_decl ;
+ne_cls_decl_list: cls_decl+ ;
 
 // Class declaration
 cls_decl: CLASS ID cls_extension LB mem_decl_list RB ;
 cls_extension: EXTENDS ID |  ;
 
 // Class member list
-mem_decl_list: mem_decl mem_decl_list |  ;
+mem_decl_list: mem_decl* ;
 
 // Class member declaration
 mem_decl: attr_decl | method_decl | constructor_decl | destructor_decl ;
@@ -45,7 +59,7 @@ mem_decl: attr_decl | method_decl | constructor_decl | destructor_decl ;
 // Class attribute declaration
 attr_decl: attr_modifier dtype ne_cm_asgn_id_list SEMI ;
 attr_modifier: FINAL | STATIC | FINAL STATIC | STATIC FINAL |  ;
-ne_cm_asgn_id_list: asgn_id COMMA ne_cm_asgn_id_list | asgn_id ;
+ne_cm_asgn_id_list: asgn_id (COMMA asgn_id)* ;
 asgn_id: ID asgn_expr ;
 asgn_expr: ASSIGN expr |  ;
 
@@ -53,9 +67,9 @@ asgn_expr: ASSIGN expr |  ;
 method_decl: method_modifier dtype ID LP sm_param_decl_list RP block_stmt ;
 method_modifier: STATIC |  ;
 sm_param_decl_list: ne_sm_param_decl_list |  ;
-ne_sm_param_decl_list: param_decl SEMI sm_param_decl_list | param_decl ;
+ne_sm_param_decl_list: param_decl (SEMI param_decl)* SEMI? ;
 param_decl: dtype ne_cm_id_list ;
-ne_cm_id_list: ID COMMA ne_cm_id_list | ID ;
+ne_cm_id_list: ID (COMMA ID)* ;
 
 // Class constructor declaration
 constructor_decl: default_constructor_decl
@@ -77,28 +91,26 @@ ctype: ID ;
 rtype: (ptype | atype | ctype) AMPERSAND ;
 
 // Expressions
-expr    : gtexpr (LT | GT | LTE | GTE) gtexpr | gtexpr ;
-gtexpr  : eqexpr (EQ | NEQ) eqexpr | eqexpr ;
-eqexpr  : eqexpr (AND | OR) lgexpr | lgexpr ;
-lgexpr  : lgexpr (ADD | SUB) addexpr | addexpr ;
-addexpr : addexpr (MUL | FLTDIV | INTDIV | MOD) mulexpr | mulexpr ;
-mulexpr : mulexpr CONCAT conexpr | conexpr ;
-conexpr : NOT conexpr | notexpr ;
-notexpr : (ADD | SUB) notexpr | uniexpr ;
-uniexpr : uniexpr LSB expr RSB | uniexpr DOT ID callargs | idxexpr ;
-idxexpr : NEW ID LP cm_expr_list RP | newexpr ;
-newexpr : LP expr RP | parexpr ;
-parexpr : lit | ID | THIS | NIL ;
+expr    : binexpr ((EQ | NEQ) binexpr)? ((LT | GT | LTE | GTE) binexpr ((EQ | NEQ) binexpr)?)? ;
+binexpr : binexpr CONCAT binexpr
+        | binexpr (MUL | FLTDIV | INTDIV | MOD) binexpr
+        | binexpr (ADD | SUB) binexpr
+        | binexpr (AND | OR) binexpr
+        | NOT* (ADD | SUB)* uniexpr
+        ;
+uniexpr : primexpr postfix_op* ;
+postfix_op: LSB expr RSB | DOT ID callargs ;
+primexpr: NEW ID LP cm_expr_list RP | LP expr RP | lit | ID | THIS | NIL ;
 
 callargs: LP cm_expr_list RP |  ;
 cm_expr_list: ne_cm_expr_list |  ;
-ne_cm_expr_list: expr COMMA cm_expr_list | expr ;
+ne_cm_expr_list: expr (COMMA expr)* COMMA? ;
 
 lit: plit | alit ;
 plit: INTLIT | FLOATLIT | BOOLLIT | STRINGLIT ;
 alit: LB cm_plit_list RB ;
 cm_plit_list: ne_cm_plit_list | ;
-ne_cm_plit_list: plit COMMA ne_cm_plit_list | plit ;
+ne_cm_plit_list: plit (COMMA plit)* ;
 
 // Statements
 stmt: match_stmt | open_stmt ;
@@ -109,11 +121,11 @@ other_stmt: block_stmt | asgn_stmt | for_stmt
 // Block statement
 block_stmt: LB vardecl_list stmt_list RB ;
 
-vardecl_list: vardecl vardecl_list |  ;
+vardecl_list: vardecl* ;
 vardecl: var_modifier dtype ne_cm_asgn_id_list SEMI ;
 var_modifier: FINAL |  ;
 
-stmt_list: stmt stmt_list |  ;
+stmt_list: stmt* ;
 
 // Assignment statement
 asgn_stmt: asgnlhs ASSIGN expr SEMI ;
@@ -0,0 +1,285 @@
+"""
+Hand-written OPLang lexer that does not depend on the ANTLR runtime.
+This module tokenizes source text directly against the lexer rules of
+OPLang.g4 and produces the same token types, lexemes and lexical errors
+as the generated OPLangLexer.
+"""
+
+import re
+
+# Share the exception classes raised by the generated lexer when build/ is
+# importable, so callers can catch either lexer's errors the same way.
+try:
+    from lexererr import ErrorToken, IllegalEscape, UncloseString
+except ImportError:
+    from .lexererr import ErrorToken, IllegalEscape, UncloseString
+
+# Only needed when an ANTLR parser reads the tokens, so optional
+try:
+    from antlr4 import Token as _TokenBase
+    from antlr4.CommonTokenFactory import CommonTokenFactory
+except ImportError:
+    _TokenBase, CommonTokenFactory = object, None
+
+
+class FastToken(_TokenBase):
+    """
+    Token produced by FastLexer, mirroring the fields of an ANTLR token.
+
+    With the ANTLR runtime installed it is an antlr4 Token, so a
+    CommonTokenStream can buffer it for an OPLangParser.
+    """
+
+    # Token declares every other field as a slot, and keeps its text in _text
+    if _TokenBase is object:
+        __slots__ = ("type", "text", "start", "stop", "line", "column", "tokenIndex")
+    else:
+        __slots__ = ("text",)
+
+    # Every token is on the default channel and has no ANTLR input stream
+    channel = 0
+    source = (None, None)
+
+    def __init__(self, type: int, text: str, start: int, stop: int, line: int, column: int):
+        self.type = type
+        self.text = text
+        self.start = start
+        self.stop = stop
+        self.line = line
+        self.column = column
+        self.tokenIndex = -1  # Set by the token stream buffering the token
+
+    def getTokenSource(self):
+        return None
+
+    def getInputStream(self):
+        return None
+
+    def __repr__(self):
+        return f"FastToken({self.type}, {self.text!r}, {self.line}:{self.column})"
+
+
+class FastLexer:
+    """
+    Regex-driven lexer equivalent to the generated OPLangLexer.
+
+    Token type numbers match build/OPLangLexer.tokens. Comments and
+    whitespace are skipped; UNCLOSE_STRING, ILLEGAL_ESCAPE and ERROR_CHAR
+    raise the corresponding lexererr exception from nextToken(), like the
+    custom emit() in OPLang.g4, or are recorded in errors when recovering.
+    """
+
+    EOF = -1
+    LINE_COMMENT = 1
+    BLOCK_COMMENT = 2
+    BOOLEAN = 3
+    BREAK = 4
+    CLASS = 5
+    CONTINUE = 6
+    DO = 7
+    ELSE = 8
+    EXTENDS = 9
+    FLOAT = 10
+    IF = 11
+    INT = 12
+    NEW = 13
+    STRING = 14
+    THEN = 15
+    FOR = 16
+    RETURN = 17
+    VOID = 18
+    NIL = 19
+    THIS = 20
+    FINAL = 21
+    STATIC = 22
+    TO = 23
+    DOWNTO = 24
+    ADD = 25
+    SUB = 26
+    MUL = 27
+    FLTDIV = 28
+    INTDIV = 29
+    MOD = 30
+    NEQ = 31
+    EQ = 32
+    LT = 33
+    GT = 34
+    LTE = 35
+    GTE = 36
+    OR = 37
+    AND = 38
+    NOT = 39
+    CONCAT = 40
+    ASSIGN = 41
+    LSB = 42
+    RSB = 43
+    LB = 44
+    RB = 45
+    LP = 46
+    RP = 47
+    SEMI = 48
+    COLON = 49
+    DOT = 50
+    COMMA = 51
+    TILDE = 52
+    AMPERSAND = 53
+    INTLIT = 54
+    FLOATLIT = 55
+    BOOLLIT = 56
+    STRINGLIT = 57
+    ID = 58
+    WS = 59
+    ILLEGAL_ESCAPE = 60
+    UNCLOSE_STRING = 61
+    ERROR_CHAR = 62
+
+    KEYWORDS = {
+        "boolean": BOOLEAN, "break": BREAK, "class": CLASS, "continue": CONTINUE,
+        "do": DO, "else": ELSE, "extends": EXTENDS, "float": FLOAT, "if": IF,
+        "int": INT, "new": NEW, "string": STRING, "then": THEN, "for": FOR,
+        "return": RETURN, "void": VOID, "nil": NIL, "this": THIS,
+        "final": FINAL, "static": STATIC, "to": TO, "downto": DOWNTO,
+        "true": BOOLLIT, "false": BOOLLIT,
+    }
+
+    OPERATORS = {
+        "+": ADD, "-": SUB, "*": MUL, "/": FLTDIV, "\\": INTDIV, "%": MOD,
+        "!=": NEQ, "==": EQ, "<": LT, ">": GT, "<=": LTE, ">=": GTE,
+        "||": OR, "&&": AND, "!": NOT, "^": CONCAT, ":=": ASSIGN,
+        "[": LSB, "]": RSB, "{": LB, "}": RB, "(": LP, ")": RP,
+        ";": SEMI, ":": COLON, ".": DOT, ",": COMMA, "~": TILDE, "&": AMPERSAND,
+    }
+
+    # Alternatives are ordered so that regex first-match agrees with ANTLR's
+    # longest-match rule; an unterminated block comment falls through to '/'.
+    PATTERN = re.compile(
+        r"""
+        (?P<WS>[ \t\r\n\f]+)
+        | (?P<LINE_COMMENT>\#[^\r\n\f]*)
+        | (?P<BLOCK_COMMENT>/\*.*?\*/)
+        | (?P<FLOATLIT>[0-9]+(?:\.[0-9]*(?:[eE][+-]?[0-9]+)?|[eE][+-]?[0-9]+))
+        | (?P<INTLIT>[0-9]+)
+        | (?P<STRING>"(?:\\[bfrnt"\\]|[^"\\\r\n\f])*)
+        | (?P<ID>[A-Za-z_][A-Za-z_0-9]*)
+        | (?P<OPERATOR>!=|==|<=|>=|\|\||&&|:=|[-+*/\\%<>!^\[\]{}();:.,~&])
+        | (?P<ERROR_CHAR>.)
+        """,
+        re.VERBOSE | re.DOTALL,
+    )
+
+    # Characters of lookahead past a match that can still change how the
+    # match is tokenized, e.g. "1e+" needs one more digit to become FLOATLIT.
+    LOOKAHEAD = 3
+
+    # Lexical errors recorded so far when recovering; None raises on the first one
+    errors = None
+
+    # Token factory of the token source, which ANTLR's error recovery uses
+    # to conjure missing tokens when a parser reads this lexer's tokens
+    _factory = CommonTokenFactory.DEFAULT if CommonTokenFactory is not None else None
+
+    def __init__(self, source: str):
+        self.source = source
+        self._tokens = self._scan(iter((source,)))
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        """Create a lexer that pulls its input lazily from an iterable of str chunks."""
+        lexer = cls.__new__(cls)
+        lexer.source = None
+        lexer._tokens = lexer._scan(iter(chunks))
+        return lexer
+
+    def nextToken(self) -> FastToken:
+        """
+        Return the next token.
+
+        A lexical error raises the matching lexererr exception, unless errors
+        has been set to a list: the error is then appended to it, with line
+        and column attributes, and tokenizing resumes after the bad token.
+        """
+        return next(self._tokens)
+
+    def __iter__(self):
+        """Iterate over the remaining tokens, excluding EOF."""
+        while True:
+            token = self.nextToken()
+            if token.type == self.EOF:
+                return
+            yield token
+
+    def _lexical_error(self, error, line: int, column: int):
+        if self.errors is None:
+            raise error
+        error.line, error.column = line, column
+        self.errors.append(error)
+
+    def _scan(self, chunks):
+        keywords = self.KEYWORDS
+        operators = self.OPERATORS
+        pattern = self.PATTERN
+        buffer = next(chunks, "")
+        final = False
+        base = 0                    # Absolute offset of buffer[0]
+        line, line_start = 1, 0     # line_start is an absolute offset
+        pos = 0
+
+        while True:
+            # Only commit to a match once enough lookahead is buffered
+            limit = len(buffer) - self.LOOKAHEAD
+            match = pattern.match(buffer, pos)
+            if not final and (
+                match is None
+                or match.end() > limit
+                or (match.lastgroup == "OPERATOR" and buffer.startswith("/*", pos))
+            ):
+                chunk = next(chunks, None)
+                if chunk is None:
+                    final = True
+                else:
+                    buffer = buffer[pos:] + chunk
+                    base += pos
+                    pos = 0
+                continue
+            if match is None:
+                break
+
+            kind = match.lastgroup
+            start, pos = match.span()
+            offset = base + start
+
+            if kind == "ID":
+                text = match.group()
+                yield FastToken(keywords.get(text, self.ID), text, offset, base + pos - 1, line, offset - line_start)
+                continue
+            if kind == "OPERATOR":
+                text = match.group()
+                yield FastToken(operators[text], text, offset, base + pos - 1, line, offset - line_start)
+                continue
+            if kind == "INTLIT" or kind == "FLOATLIT":
+                token_type = self.INTLIT if kind == "INTLIT" else self.FLOATLIT
+                yield FastToken(token_type, match.group(), offset, base + pos - 1, line, offset - line_start)
+                continue
+            if kind == "STRING":
+                # The body stops at the closing quote or at the offending character
+                next_char = buffer[pos:pos + 1]
+                if next_char == '"':
+                    pos += 1
+                    yield FastToken(self.STRINGLIT, buffer[start:pos], offset, base + pos - 1, line, offset - line_start)
+                    continue
+                if next_char == "\\" and pos + 1 < len(buffer):
+                    pos += 2
+                    self._lexical_error(IllegalEscape(buffer[start + 1:pos]), line, offset - line_start)
+                else:
+                    self._lexical_error(UncloseString(buffer[start + 1:pos]), line, offset - line_start)
+            elif kind == "ERROR_CHAR":
+                self._lexical_error(ErrorToken(match.group()), line, offset - line_start)
+
+            # Skipped tokens and recovered errors only need the line bookkeeping kept current
+            newlines = buffer.count("\n", start, pos)
+            if newlines:
+                line += newlines
+                line_start = base + buffer.rindex("\n", start, pos) + 1
+
+        end = base + pos
+        yield FastToken(self.EOF, "<EOF>", end, end - 1, line, end - line_start)
@@ -0,0 +1,58 @@
+"""
+Streaming tokenization of OPLang source files.
+This module memory-maps a source file, decodes it chunk by chunk and
+feeds the chunks to FastLexer, so tokens are produced lazily without
+ever materialising the whole file as a Python str.
+"""
+
+import codecs
+import mmap
+import os
+
+from .fast_lexer import FastLexer
+
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def read_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8"):
+    """
+    Yield the decoded contents of path in chunks of at most chunk_size bytes.
+
+    The file is memory-mapped, so only the chunk being decoded is copied
+    into Python memory. Multi-byte characters split across a chunk
+    boundary are handled by an incremental decoder.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset in range(0, len(mapped), chunk_size):
+                text = decoder.decode(mapped[offset:offset + chunk_size])
+                if text:
+                    yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def stream_tokens(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8"):
+    """
+    Lazily tokenize the OPLang source file at path.
+
+    Tokens are yielded as FastToken objects, excluding EOF; offsets are
+    character offsets into the whole file. Peak memory is bounded by the
+    chunk size plus the longest token, where an unterminated block comment
+    counts as a token up to the end of the file. Lexical errors raise the
+    same lexererr exceptions as the other lexers.
+
+    Args:
+        path (str): Path to the source file
+        chunk_size (int): Number of bytes decoded at a time
+        encoding (str): Encoding of the source file
+
+    Returns:
+        A generator of FastToken
+    """
+    return iter(FastLexer.from_chunks(read_chunks(path, chunk_size, encoding)))
@@ -0,0 +1,199 @@
+"""
+Compact token storage for OPLang source.
+This module keeps tokens in parallel array('i') columns instead of one
+CommonToken object per token, slicing lexemes from the source on demand,
+and adapts the buffer to the token stream interface of OPLangParser.
+"""
+
+from array import array
+
+from antlr4 import Token
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.error.Errors import IllegalStateException
+
+
+class TokenBuffer:
+    """
+    Column-wise token store.
+
+    Token i is described by types[i], starts[i], stops[i], lines[i] and
+    columns[i]; start and stop are inclusive character offsets into
+    source, as on ANTLR tokens. Each token costs 20 bytes plus the
+    arrays' spare capacity.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.types = array("i")
+        self.starts = array("i")
+        self.stops = array("i")
+        self.lines = array("i")
+        self.columns = array("i")
+
+    def __len__(self):
+        return len(self.types)
+
+    def append(self, token_type: int, start: int, stop: int, line: int, column: int):
+        self.types.append(token_type)
+        self.starts.append(start)
+        self.stops.append(stop)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def text(self, i: int) -> str:
+        """Return the lexeme of token i, sliced from the source."""
+        if self.types[i] == Token.EOF:
+            return "<EOF>"
+        return self.source[self.starts[i]:self.stops[i] + 1]
+
+    def nbytes(self) -> int:
+        """Return the memory held by the token columns, in bytes."""
+        return sum(
+            column.buffer_info()[1] * column.itemsize
+            for column in (self.types, self.starts, self.stops, self.lines, self.columns)
+        )
+
+
+class BufferToken:
+    """Token view over one entry of a TokenBuffer, created on demand."""
+
+    __slots__ = ("tokens", "tokenIndex")
+
+    channel = Token.DEFAULT_CHANNEL
+    source = (None, None)
+
+    def __init__(self, tokens: TokenBuffer, index: int):
+        self.tokens = tokens
+        self.tokenIndex = index
+
+    @property
+    def type(self):
+        return self.tokens.types[self.tokenIndex]
+
+    @property
+    def start(self):
+        return self.tokens.starts[self.tokenIndex]
+
+    @property
+    def stop(self):
+        return self.tokens.stops[self.tokenIndex]
+
+    @property
+    def line(self):
+        return self.tokens.lines[self.tokenIndex]
+
+    @property
+    def column(self):
+        return self.tokens.columns[self.tokenIndex]
+
+    @property
+    def text(self):
+        return self.tokens.text(self.tokenIndex)
+
+    def getTokenSource(self):
+        return None
+
+    def getInputStream(self):
+        return None
+
+    def __str__(self):
+        return f"[@{self.tokenIndex},{self.start}:{self.stop}='{self.text}',<{self.type}>,{self.line}:{self.column}]"
+
+
+class CompactTokenStream:
+    """
+    Token stream for OPLangParser backed by a TokenBuffer.
+
+    Tokens are pulled from the lexer lazily, as CommonTokenStream does, so
+    lexical errors surface at the same point of the parse. The lexer may
+    be OPLangLexer or FastLexer; neither emits off-channel tokens.
+    """
+
+    def __init__(self, lexer, source: str):
+        self.tokenSource = lexer
+        self.tokens = TokenBuffer(source)
+        self.index = 0
+        self.fetchedEOF = False
+        self._last = None
+        # Used by error recovery to conjure missing tokens
+        self._factory = CommonTokenFactory.DEFAULT
+
+    def getTokenSource(self):
+        return self
+
+    def fetch(self, i: int):
+        """Pull tokens from the lexer until token i is buffered or EOF is reached."""
+        tokens, lexer = self.tokens, self.tokenSource
+        while len(tokens) <= i and not self.fetchedEOF:
+            token = lexer.nextToken()
+            tokens.append(token.type, token.start, token.stop, token.line, token.column)
+            self.fetchedEOF = token.type == Token.EOF
+
+    def fill(self):
+        """Buffer every remaining token."""
+        while not self.fetchedEOF:
+            self.fetch(len(self.tokens))
+
+    def _position(self, k: int):
+        if k < 0:
+            i = self.index + k
+            return i if i >= 0 else None
+        i = self.index + k - 1
+        if i >= len(self.tokens):
+            self.fetch(i)
+            return min(i, len(self.tokens) - 1)
+        return i
+
+    def LA(self, k: int) -> int:
+        # Fast path for the parser's most frequent call
+        if k == 1 and self.index < len(self.tokens.types):
+            return self.tokens.types[self.index]
+        i = self._position(k)
+        return Token.INVALID_TYPE if i is None else self.tokens.types[i]
+
+    def LT(self, k: int):
+        i = self._position(k)
+        if i is None:
+            return None
+        # The parser asks for the same token several times in a row
+        token = self._last
+        if token is None or token.tokenIndex != i:
+            token = self._last = BufferToken(self.tokens, i)
+        return token
+
+    def get(self, i: int):
+        self.fetch(i)
+        return BufferToken(self.tokens, i)
+
+    def consume(self):
+        if self.LA(1) == Token.EOF:
+            raise IllegalStateException("cannot consume EOF")
+        self.index += 1
+        if self.index >= len(self.tokens):
+            self.fetch(self.index)
+
+    def mark(self) -> int:
+        return 0
+
+    def release(self, marker: int):
+        pass
+
+    def seek(self, index: int):
+        self.fetch(index)
+        self.index = min(index, len(self.tokens) - 1)
+
+    @property
+    def size(self) -> int:
+        return len(self.tokens)
+
+    def getText(self, start=None, stop=None) -> str:
+        if start is None or stop is None:
+            self.fill()
+        start = 0 if start is None else getattr(start, "tokenIndex", start)
+        stop = len(self.tokens) - 1 if stop is None else getattr(stop, "tokenIndex", stop)
+        texts = []
+        for i in range(max(start, 0), min(stop, len(self.tokens) - 1) + 1):
+            if self.tokens.types[i] == Token.EOF:
+                break
+            texts.append(self.tokens.text(i))
+        return "".join(texts)
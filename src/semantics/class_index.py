@@ -0,0 +1,73 @@
+"""
+Class index for OPLang programming language.
+This module holds the global scope of a program, its classes by name,
+together with a numbering of the inheritance forest that answers
+subclass tests in constant time, however deep the hierarchy.
+"""
+
+from ..utils.nodes import Program
+from .scope_table import ScopeTable
+
+
+class ClassIndex(ScopeTable):
+    """
+    Global scope of a program, with constant-time subclass tests.
+
+    The inheritance forest is read once from the Program's class
+    declarations and walked depth first; each class gets the interval
+    [start, end) of the positions of its subtree in that walk, so a
+    class inherits from another when its interval lies within the
+    other's. As in the checker, only the first declaration of a name
+    counts and a superclass must be declared before its subclasses;
+    classes breaking either rule are checked as errors before any test
+    involves them. Class symbols are declared as the checker reaches
+    them, like in any other scope.
+    """
+
+    __slots__ = ("intervals",)
+
+    def __init__(self, program: Program = None):
+        super().__init__()
+        # Class name -> (start, end) of its subtree in the walk
+        self.intervals = {}
+        if program is not None:
+            self.number(program)
+
+    def number(self, program: Program):
+        """
+        Number the inheritance forest of program's classes.
+
+        Args:
+            program (Program): Program whose class declarations are read
+        """
+        subclasses, roots = {}, []
+        for class_decl in program.class_decls:
+            if class_decl.name in subclasses:
+                continue
+            subclasses[class_decl.name] = []
+            if class_decl.superclass in subclasses:
+                subclasses[class_decl.superclass].append(class_decl.name)
+            else:
+                roots.append(class_decl.name)
+
+        intervals, starts, position = self.intervals, {}, 0
+        stack = [(name, False) for name in reversed(roots)]
+        while stack:
+            name, leaving = stack.pop()
+            if leaving:
+                intervals[name] = (starts[name], position)
+                continue
+            starts[name] = position
+            position += 1
+            stack.append((name, True))
+            stack.extend((subclass, False) for subclass in reversed(subclasses[name]))
+
+    def is_subclass(self, name: str, ancestor: str) -> bool:
+        """
+        Return whether class name is ancestor or inherits from it, directly
+        or through other classes.
+        """
+        if name == ancestor:
+            return True
+        inner, outer = self.intervals.get(name), self.intervals.get(ancestor)
+        return inner is not None and outer is not None and outer[0] <= inner[0] and inner[1] <= outer[1]
@@ -0,0 +1,219 @@
+"""
+Parallel static checker for OPLang programming language.
+This module checks a program in two phases: a pass over the class,
+attribute, method and constructor signatures, then the method,
+constructor and destructor bodies, which depend on the signatures only
+and are checked in a pool of worker processes.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils.ast_index import ASTIndex
+from ..utils.nodes import ASTNode, ClassMember, Program
+from .scope_table import ScopeTable
+from .static_checker import Diagnostic, StaticChecker
+from .static_error import StaticError
+
+
+class SignatureChecker(StaticChecker):
+    """
+    StaticChecker that checks everything but method, constructor and
+    destructor bodies, which it counts instead.
+
+    Bodies are numbered in the order the serial checker would check
+    them; each diagnostic collected is tagged with the number of bodies
+    met before it, so it can be merged back in the same order.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.bodies = 0
+        # Body count at each entry of errors, when collecting
+        self.positions = []
+
+    def check_body(self, node: "ClassMember", env: ScopeTable):
+        self.bodies += 1
+
+    def report(self, error: StaticError, node: ASTNode):
+        super().report(error, node)
+        self.positions.extend([self.bodies] * (len(self.errors) - len(self.positions)))
+
+
+class _Finished(Exception):
+    """Stops replaying the signatures once a worker's last body is checked."""
+
+
+class _BodyChecker(StaticChecker):
+    """
+    StaticChecker that replays the signature pass and checks the given
+    bodies only, each in the environment the serial checker would check
+    it in: the members and classes declared before it and nothing after.
+    """
+
+    def __init__(self, tasks: Tuple[int, ...], collect: bool):
+        super().__init__()
+        self.tasks = set(tasks)
+        self.last = max(tasks)
+        self.bodies = 0
+        # Body number -> the StaticError raised, or the list of
+        # diagnostics collected, checking it
+        self.results = {}
+        if collect:
+            self.errors = []
+
+    def check_body(self, node: "ClassMember", env: ScopeTable):
+        task = self.bodies
+        self.bodies += 1
+        if task in self.tasks:
+            if self.errors is None:
+                try:
+                    super().check_body(node, env)
+                    self.results[task] = None
+                except StaticError as error:
+                    self.results[task] = error
+            else:
+                # Diagnostics of the replayed signatures are the main
+                # process's to report
+                signature_errors, self.errors = self.errors, []
+                super().check_body(node, env)
+                self.results[task], self.errors = self.errors, signature_errors
+        if task == self.last:
+            raise _Finished
+
+
+# Program checked by this worker process
+_program = None
+
+
+def _init_worker(program: Program):
+    global _program
+    _program = program
+
+
+def _check_tasks(tasks: Tuple[int, ...], collect: bool) -> Dict[int, Any]:
+    return _check_bodies(_program, tasks, collect)
+
+
+def _check_bodies(program: Program, tasks: Tuple[int, ...], collect: bool) -> Dict[int, Any]:
+    """
+    Check the bodies numbered tasks of program.
+
+    Returns:
+        Body number -> None, the StaticError raised or, when collecting,
+        a list of (error, node, site), each node given by its position in
+        the ASTIndex of the program, or as (None, node) if not indexed
+    """
+    checker = _BodyChecker(tasks, collect)
+    try:
+        checker.check_program(program)
+    except _Finished:
+        pass
+    if not collect:
+        return checker.results
+
+    ordinals = None
+    results = {}
+    for task, diagnostics in checker.results.items():
+        if diagnostics and ordinals is None:
+            index = ASTIndex()
+            index.add(program)
+            ordinals = {key: ordinal for ordinal, key in enumerate(index.parents)}
+        results[task] = [
+            (error, _ordinal(node, ordinals), _ordinal(site, ordinals))
+            for error, node, site in diagnostics
+        ]
+    return results
+
+
+def _ordinal(node: ASTNode, ordinals: Dict[int, int]):
+    ordinal = ordinals.get(id(node))
+    return (None, node) if ordinal is None else ordinal
+
+
+class ParallelChecker:
+    """
+    Two-phase static checker, with the same results as StaticChecker.
+
+    The first phase runs in the calling process, checks the signatures
+    and numbers the bodies; the bodies are then dealt round robin to
+    max_workers processes. A body is checked against the classes and
+    members declared before it, as in a serial run, so each worker
+    replays the signature pass, which is cheap next to the bodies, and
+    checks its own bodies where the serial checker would.
+
+    Results are merged in the serial order: check_program raises the
+    first error StaticChecker would, and when errors is set to a list,
+    the same diagnostics are collected in the same order, with nodes
+    from the program checked. Workers are forked where the platform
+    allows it, so the program is not pickled to them.
+    """
+
+    # Diagnostics collected, set to a list before checking to collect;
+    # None raises on the first error
+    errors = None
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def check_program(self, node: "Program"):
+        signatures = SignatureChecker()
+        collect = self.errors is not None
+        if collect:
+            signatures.errors = []
+        signature_error = None
+        try:
+            signatures.check_program(node)
+        except StaticError as error:
+            signature_error = error
+
+        n_tasks = signatures.bodies
+        workers = min(self.max_workers, n_tasks)
+        jobs = [tuple(range(n_tasks))[worker::workers] for worker in range(workers)]
+        results = {}
+        if workers == 1:
+            results.update(_check_bodies(node, jobs[0], collect))
+        elif workers > 1:
+            with ProcessPoolExecutor(workers, mp_context=_pool_context(),
+                                     initializer=_init_worker, initargs=(node,)) as pool:
+                for job_results in pool.map(_check_tasks, jobs, [collect] * workers):
+                    results.update(job_results)
+
+        if not collect:
+            for task in range(n_tasks):
+                if results[task] is not None:
+                    raise results[task]
+            if signature_error is not None:
+                raise signature_error
+            return
+
+        nodes = None
+        merged = []
+        for i, (diagnostic, position) in enumerate(zip(signatures.errors, signatures.positions)):
+            merged.append(((position, 0, i), diagnostic))
+        for task in range(n_tasks):
+            if results[task] and nodes is None:
+                index = ASTIndex()
+                index.add(node)
+                nodes = [indexed for indexed, _ in index.parents.values()]
+            for j, (error, found, site) in enumerate(results[task]):
+                found = found[1] if type(found) is tuple else nodes[found]
+                site = site[1] if type(site) is tuple else nodes[site]
+                merged.append(((task, 1, j), Diagnostic(error, found, site)))
+        merged.sort(key=lambda entry: entry[0])
+
+        # An error found by two workers at the same site is reported once,
+        # as serially
+        reported = set()
+        for _, diagnostic in merged:
+            key = (id(diagnostic.site), id(diagnostic.node), str(diagnostic.error))
+            if key not in reported:
+                reported.add(key)
+                self.errors.append(diagnostic)
+
+
+def _pool_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else None)
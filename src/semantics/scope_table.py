@@ -0,0 +1,70 @@
+"""
+Scope table for OPLang programming language.
+This module holds the static checker's environment as a chain of hash
+scopes, so declaring a symbol and looking a name up cost one dictionary
+operation per enclosing scope instead of a scan of every symbol seen.
+"""
+
+from typing import Any, Iterator, Optional
+
+
+class ScopeTable:
+    """
+    One scope of an environment, linked to the scope enclosing it.
+
+    Each scope maps names to symbols in a dict. lookup() searches the
+    innermost scope first and stops at the first scope declaring the
+    name, so inner declarations shadow outer ones; within a scope, a
+    name declared again replaces the earlier symbol. The outermost
+    scope, global_scope, holds the classes of the program.
+    """
+
+    __slots__ = ("symbols", "parent", "global_scope")
+
+    def __init__(self, parent: Optional["ScopeTable"] = None):
+        self.symbols = {}
+        self.parent = parent
+        self.global_scope = parent.global_scope if parent is not None else self
+
+    def enter(self) -> "ScopeTable":
+        """Return a new, empty scope nested in this one."""
+        return ScopeTable(self)
+
+    def declare(self, symb: Any):
+        """Add symb to this scope under symb.name."""
+        self.symbols[symb.name] = symb
+
+    def lookup(self, name: str, outer: Optional["ScopeTable"] = None) -> Optional[Any]:
+        """
+        Find the symbol a name refers to from this scope.
+
+        Args:
+            name (str): Name to look up
+            outer (ScopeTable): If given, an enclosing scope at which the
+                search stops without looking into it, e.g. global_scope
+                to search the members of a class and its superclasses
+
+        Returns:
+            The symbol declared in the innermost scope that has the name,
+            or None if no enclosing scope does
+        """
+        scope = self
+        while scope is not outer:
+            symb = scope.symbols.get(name)
+            if symb is not None:
+                return symb
+            scope = scope.parent
+        return None
+
+    def lookup_local(self, name: str) -> Optional[Any]:
+        """Return the symbol declared under name in this scope only, or None."""
+        return self.symbols.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.symbols
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.symbols.values())
+
+    def __len__(self) -> int:
+        return len(self.symbols)
@@ -7,12 +7,14 @@ scope management, inheritance validation, and detects all semantic errors as
 specified in the OPLang language specification.
 """
 
-from copy import deepcopy
+from copy import copy
 from functools import reduce
 from typing import Dict, List, Set, Optional, Any, Tuple, Union, NamedTuple
 from ..utils.visitor import ASTVisitor
+from .class_index import ClassIndex
+from .scope_table import ScopeTable
 from ..utils.nodes import (
-    ASTNode, Program, ClassDecl, AttributeDecl, Attribute, MethodDecl,
+    ASTNode, Program, ClassDecl, ClassMember, AttributeDecl, Attribute, MethodDecl,
     ConstructorDecl, DestructorDecl, Parameter, VariableDecl, Variable,
     AssignmentStatement, IfStatement, ForStatement, BreakStatement,
     ContinueStatement, ReturnStatement, MethodInvocationStatement,
@@ -20,7 +22,7 @@ from ..utils.nodes import (
     IdLHS, PostfixLHS, BinaryOp, UnaryOp, PostfixExpression, PostfixOp,
     MethodCall, MemberAccess, ArrayAccess, ObjectCreation, Identifier,
     ThisExpression, ParenthesizedExpression, IntLiteral, FloatLiteral,
-    BoolLiteral, StringLiteral, ArrayLiteral, NilLiteral, Type
+    BoolLiteral, StringLiteral, ArrayLiteral, NilLiteral, Type, Statement, LHS, Expr
 )
 from .static_error import (
     StaticError, Redeclared, UndeclaredIdentifier, UndeclaredClass,
@@ -46,12 +48,11 @@ class ClassSymb(Symb):
         return f"ClassSymb({self.name} extends {self.superclass}, members: {members})"
 
 class AttributeSymb(Symb):
-    def __init__(self, is_final, is_static, type, name, is_super=False):
+    def __init__(self, is_final, is_static, type, name):
         self.is_final = is_final
         self.is_static = is_static
         self.type = type.set_final_if(is_final)
         self.name = name
-        self.is_super = is_super
 
     def __repr__(self):
         final = "final " if self.is_final else ""
@@ -68,12 +69,11 @@ class ParameterSymb(Symb):
 
 
 class MethodSymb(Symb):
-    def __init__(self, is_static, return_type, name, param_types, is_super=False):
+    def __init__(self, is_static, return_type, name, param_types):
         self.is_static = is_static
         self.return_type = return_type
         self.name = name
         self.param_types = param_types
-        self.is_super = is_super
     
     def __repr__(self):
         static = "static " if self.is_static else ""
@@ -82,10 +82,9 @@ class MethodSymb(Symb):
 
 
 class ConstructorSymb(Symb):
-    def __init__(self, name, param_types, is_super=False):
+    def __init__(self, name, param_types):
         self.name = name
         self.param_types = param_types
-        self.is_super = is_super
     
     def __repr__(self):
         params = ", ".join(self.param_types)
@@ -93,9 +92,8 @@ class ConstructorSymb(Symb):
 
 
 class DestructorSymb(Symb):
-    def __init__(self, name, is_super=False):
+    def __init__(self, name):
         self.name = name
-        self.is_super = is_super
     
     def __repr__(self):
         return f"DestructorSymb(~{self.name}())"
@@ -182,6 +180,16 @@ class Tnil(T):
         super().__init__(is_final=False)
         self.type_name = "nil"
 
+class Terror(T):
+    """Type of an expression whose check failed, when collecting errors.
+
+    It is accepted wherever a type is expected, so the failure is only
+    reported once and not again by each enclosing check.
+    """
+    def __init__(self):
+        super().__init__(is_final=False)
+        self.type_name = "error"
+
 
 class Postfix:
     pass
@@ -199,56 +207,41 @@ class MethodPostfix(Postfix):
         self.arg_types = arg_types
 
 
-def env_contains(node: Union[ASTNode, str], env: List[List[Any]]):
+def env_contains(node: Union[ASTNode, str], env: ScopeTable):
     if not isinstance(node, str):
         node = node.name
-    for scope in env:
-        for entity in scope:
-            entity = entity if isinstance(entity, str) else entity.name
-            if entity == node:
-                return True
-    return False
-
-def scope_contains(node: Union[ASTNode, str], scope: List[Any]):
+    return env.lookup(node) is not None
+
+def scope_contains(node: Union[ASTNode, str], scope: ScopeTable):
     if not isinstance(node, str):
         node = node.name
-    
-    for entity in scope:
-        entity = entity if isinstance(entity, str) else entity.name
-        if entity == node:
-            return True
-    return False
+    return node in scope
 
 
-def get_class_symb(class_name: str, class_scope: List[Any]):
-    found_class = next((symb for symb in class_scope if symb.name == class_name), None)
-    return found_class
+def get_class_symb(class_name: str, class_scope: ScopeTable):
+    return class_scope.lookup_local(class_name)
 
 def get_class_attribute(class_symb: ClassSymb, attr_name: str):
-    found_attr = next((m for m in class_symb.members if m.name == attr_name), None)
-    return found_attr
+    members = class_symb.members
+    return members.lookup(attr_name, members.global_scope)
+
+def get_symb_from_scope(name: str, scope: ScopeTable):
+    return scope.lookup_local(name)
 
-def get_symb_from_scope(name: str, scope: List[Any]):
-    found_symb = next((s for s in scope if s.name == name), None)
-    return found_symb
+def get_symb_by_id(name: str, env: ScopeTable):
+    return env.lookup(name)
 
-def get_symb_by_id(name: str, env: List[List[Any]]):
-    found_symb = next((symb for scope in env for symb in scope if symb.name == name), None)
-    return found_symb
+def get_for_signal(env: ScopeTable):
+    # Class and global scopes never declare the loop signal's name
+    return env.lookup("!LOOP")
 
-def get_for_signal(env: List[List[Any]]):
-    search_env = env[:-2]
-    found_signal = next((symb for scope in search_env for symb in scope if symb.name == "!LOOP"), None)
-    return found_signal
+def can_coerce_type(from_type: T, to_type: T, classes: ClassIndex):
+    if type(from_type) is Terror or type(to_type) is Terror:
+        return True
 
-def can_coerce_type(from_type: T, to_type: T):
-    # Class coercion
+    # Class coercion, to the class itself or any of its ancestors
     if type(from_type) is Tclass and type(to_type) is Tclass:
-        if from_type.name == to_type.name:
-            return True
-        if from_type.superclass == to_type.name:
-            return True
-        return False
+        return classes.is_subclass(from_type.name, to_type.name)
 
     # Numeric coercion
     if type(from_type) is Tint and type(to_type) is Tfloat:
@@ -269,15 +262,39 @@ def can_coerce_type(from_type: T, to_type: T):
     return type(from_type) is type(to_type)
 
 
-def can_coerce_args(arg_types, param_types):
+def can_coerce_args(arg_types, param_types, classes: ClassIndex):
     if len(arg_types) != len(param_types):
         return False
-    return all(can_coerce_type(arg, param) for arg, param in zip(arg_types, param_types))
+    return all(can_coerce_type(arg, param, classes) for arg, param in zip(arg_types, param_types))
+
+
+class Diagnostic(NamedTuple):
+    """
+    A static error recorded when collecting, the node it was found at and
+    the innermost declaration or statement holding that node. Type nodes
+    may be shared by many declarations, so site tells the uses apart.
+    """
+    error: StaticError
+    node: ASTNode
+    site: Optional[ASTNode] = None
+
+    def __str__(self):
+        return str(self.error)
 
 
 class StaticChecker(ASTVisitor):
     """
-    Stateless static semantic checker for OPLang using visitor pattern.
+    Static semantic checker for OPLang using visitor pattern.
+
+    By default check_program raises the first error found. Setting errors
+    to a list before checking switches to collecting mode: each error is
+    appended as a Diagnostic with the offending node and the innermost
+    declaration or statement being checked (site), once per node and
+    site, and checking goes on. The checker keeps per-run state, which
+    check_program resets on every call: errors is emptied in place, and
+    the set of reported (site, node, error) keys (_reported), the
+    visitor's dispatch table (_handlers, whose handlers raise or collect
+    depending on the mode) and the current site start afresh.
     
     Checks for all 10 error types specified in OPLang semantic constraints:
     1. Redeclared - Variables, constants, attributes, classes, methods, parameters
@@ -297,60 +314,160 @@ class StaticChecker(ASTVisitor):
     processing_class = None     # Current class being processed     (ClassSymb)
     processing_method = None    # Current method being processed    (MethodSymb)
     
+    # Diagnostics recorded so far when collecting, set to a list before the
+    # first check to collect; None raises on the first error
+    errors = None
+    
+    # Innermost declaration or statement being checked, when collecting
+    site = None
+    
     # Entry point
     
-    def check_program(self, node: "Program", env=[[]]):
+    def check_program(self, node: "Program", env: ClassIndex = None):
+        # Handlers collect or raise depending on errors when resolved, so
+        # resolve them again and forget earlier errors on every run
+        if self.errors is not None:
+            self.errors.clear()
+        self._handlers = {}
+        self._reported = set()
+        self.site = None
         self.visit_program(node, env)
     
     
+    def check_body(self, node: "ClassMember", env: ScopeTable):
+        """
+        Check the body of a method, constructor or destructor node in its
+        scope env, which holds the parameters.
+
+        Bodies are checked once the member's signature is, and change
+        nothing the rest of the program sees, so subclasses may check
+        them elsewhere, as ParallelChecker does.
+        """
+        self.visit(node.body, env)
+    
+    
+    # Error collection
+    
+    def report(self, error: StaticError, node: ASTNode):
+        """
+        Raise error, or record it and return when collecting errors.
+
+        Checks that can carry on after an error, such as the rest of a
+        declaration or the body of an if statement, report it this way.
+        An error recorded already for the same node of the same declaration
+        or statement is not repeated.
+        """
+        if self.errors is None:
+            raise error
+        try:
+            reported = self._reported
+        except AttributeError:
+            reported = self._reported = set()
+        key = (id(self.site), id(node), str(error))
+        if key not in reported:
+            reported.add(key)
+            self.errors.append(Diagnostic(error, node, self.site))
+    
+    def resolve_handler(self, node_class):
+        """
+        Return the visit function for node_class; when collecting errors,
+        one that records a StaticError raised by the node's own check and
+        returns what its parent can carry on with: Terror for expressions
+        and types, the environment unchanged for declarations and nothing
+        for statements. Declarations, parameters and statements are also
+        kept as the site of the errors found within them.
+        """
+        handler = super().resolve_handler(node_class)
+        if self.errors is None:
+            return handler
+        
+        if issubclass(node_class, (Expr, LHS, Type, PostfixOp)):
+            recovered = lambda node, o: Terror()
+        elif issubclass(node_class, (ClassDecl, ClassMember, VariableDecl)):
+            recovered = lambda node, o: o
+        elif issubclass(node_class, Statement):
+            recovered = lambda node, o: None
+        elif issubclass(node_class, Parameter):
+            recovered = None
+        else:
+            return handler
+        
+        if not issubclass(node_class, (ClassDecl, ClassMember, VariableDecl, Statement, Parameter)):
+            def collecting(checker, node, o):
+                try:
+                    return handler(checker, node, o)
+                except StaticError as error:
+                    checker.report(error, node)
+                    return recovered(node, o)
+        elif recovered is None:
+            def collecting(checker, node, o):
+                site, checker.site = checker.site, node
+                try:
+                    return handler(checker, node, o)
+                finally:
+                    checker.site = site
+        else:
+            def collecting(checker, node, o):
+                site, checker.site = checker.site, node
+                try:
+                    return handler(checker, node, o)
+                except StaticError as error:
+                    checker.report(error, node)
+                    return recovered(node, o)
+                finally:
+                    checker.site = site
+        
+        self._handlers[node_class] = collecting
+        return collecting
+    
+    
     # Program and class declarations
     
-    def visit_program(self, node: "Program", env=[[]]):
+    def visit_program(self, node: "Program", env: ClassIndex = None):
         return reduce(
             lambda global_env, class_decl: self.visit(class_decl, global_env),
             node.class_decls,
-            env,
+            env if env is not None else ClassIndex(node),
         )
 
 
-    def visit_class_decl(self, node: "ClassDecl", env: List[List[Any]]):
-        if env_contains(node.name, env):
-            raise Redeclared("Class", node.name)
+    def visit_class_decl(self, node: "ClassDecl", env: ScopeTable):
+        # A redeclared class is still checked when collecting errors, but
+        # the first declaration keeps the name
+        redeclared = env_contains(node.name, env)
+        if redeclared:
+            self.report(Redeclared("Class", node.name), node)
         
-        superclass_symb = get_class_symb(node.superclass, env[-1]) if node.superclass else None
+        superclass_symb = get_class_symb(node.superclass, env.global_scope) if node.superclass else None
         if node.superclass and not superclass_symb:
-            raise UndeclaredClass(node.superclass)
+            self.report(UndeclaredClass(node.superclass), node)
         
-        # Resolve superclass members
-        def copy_and_label_super_member(member):
-            member = deepcopy(member)
-            member.is_super = True
-            return member
-        class_scope = deepcopy(superclass_symb.members) if superclass_symb else []
-        class_scope = list(map(copy_and_label_super_member, class_scope))
+        # Inherited members are found through the superclass's member table,
+        # which encloses the class's own, so only overriding members shadow them
+        class_scope = ScopeTable(superclass_symb.members if superclass_symb else env)
         
         self.processing_class = ClassSymb(node.name, node.superclass, class_scope)
         
-        def process_class_member(class_env, member):
-            class_env = self.visit(member, class_env)
-            self.processing_class.members = class_env[0]
-            return class_env
+        reduce(lambda class_env, member: self.visit(member, class_env), node.members, class_scope)
         
-        class_env = reduce(process_class_member, node.members, [class_scope] + env)
-        
-        return [env[0] + [self.processing_class], *env[1:]]
+        if not redeclared:
+            env.declare(self.processing_class)
+        return env
 
 
     # Attribute declarations
     
-    def visit_attribute_decl(self, node: "AttributeDecl", env: List[List[Any]]):
-        def check_attr_redeclared(class_env, attr):
-            name, init_type = self.visit(attr, class_env)
+    def visit_attribute_decl(self, node: "AttributeDecl", env: ScopeTable):
+        # The declaration's attributes are visible to the initializers that
+        # follow them, and become members of the class once all are checked
+        def check_attr_redeclared(decl_env, attr):
+            name, init_type = self.visit(attr, decl_env)
             attr_type = self.visit(node.attr_type, env)
             
-            overlap_attr = get_symb_from_scope(name, class_env[0])
-            if overlap_attr and not overlap_attr.is_super:
-                raise Redeclared("Constant" if node.is_final else "Attribute", name)
+            overlap_attr = get_symb_from_scope(name, decl_env) or get_symb_from_scope(name, env)
+            if overlap_attr:
+                self.report(Redeclared("Constant" if node.is_final else "Attribute", name), attr)
+                return decl_env
             
             # Fill in the element type if array type is returned
             if type(attr_type) is Tarray and type(init_type) is Tarray and not init_type.element_type:
@@ -360,143 +477,157 @@ class StaticChecker(ASTVisitor):
             # Constant attribute declaration case
             if node.is_final:
                 if not init_type:
-                    raise IllegalConstantExpression(NilLiteral())
+                    self.report(IllegalConstantExpression(NilLiteral()), attr)
                 
                 # Initialization is not statically evaluable
-                if not init_type.is_final:
-                    raise IllegalConstantExpression(attr.init_value)
+                elif not init_type.is_final and type(init_type) is not Terror:
+                    self.report(IllegalConstantExpression(attr.init_value), attr)
                 
                 # Initialization doesn't match types (under coercion rules)
-                if not can_coerce_type(init_type, attr_type):
-                    raise TypeMismatchInConstant(node)
+                elif not can_coerce_type(init_type, attr_type, env.global_scope):
+                    self.report(TypeMismatchInConstant(node), attr)
 
             attr_symb = AttributeSymb(node.is_final, node.is_static, attr_type, name)
-            class_scope = [attr_symb] + class_env[0]
-            return [class_scope, *class_env[1:]]
+            decl_env.declare(attr_symb)
+            return decl_env
 
-        class_env = reduce(check_attr_redeclared, node.attributes, env)
-        return class_env
+        decl_env = reduce(check_attr_redeclared, node.attributes, env.enter())
+        for attr_symb in decl_env:
+            env.declare(attr_symb)
+        return env
 
 
-    def visit_attribute(self, node: "Attribute", env: List[List[Any]]):
+    def visit_attribute(self, node: "Attribute", env: ScopeTable):
         init_type = self.visit(node.init_value, env) if node.init_value else None
         return node.name, init_type
 
     # Method declarations
     
-    def visit_method_decl(self, node: "MethodDecl", env: List[List[Any]]):
-        overlap_method = get_symb_from_scope(node.name, env[0])
-        if overlap_method and not overlap_method.is_super:
-            raise Redeclared("Method", node.name)
+    def visit_method_decl(self, node: "MethodDecl", env: ScopeTable):
+        overlap_method = get_symb_from_scope(node.name, env)
+        if overlap_method:
+            self.report(Redeclared("Method", node.name), node)
         
         # Initialize method scope
+        param_types = []
         def check_param_redeclared(method_env, param):
             param_symb = self.visit(param, method_env)
-            if scope_contains(param_symb.name, method_env[0]):
-                raise Redeclared("Parameter", param_symb.name)
-            return [method_env[0] + [param_symb], *method_env[1:]]
+            param_types.append(param_symb.type)
+            if scope_contains(param_symb.name, method_env):
+                self.report(Redeclared("Parameter", param_symb.name), param)
+            else:
+                method_env.declare(param_symb)
+            return method_env
         
-        method_env = reduce(check_param_redeclared, node.params, [[]] + env)
+        method_env = reduce(check_param_redeclared, node.params, env.enter())
         
         method_symb = MethodSymb(
-            node.is_static, self.visit(node.return_type, env), node.name, 
-            [self.visit(param.param_type, env) for param in node.params],
+            node.is_static, self.visit(node.return_type, env), node.name, param_types,
         )
         self.processing_method = method_symb
         
         # Check the body
-        self.visit(node.body, method_env)
+        self.check_body(node, method_env)
         
-        class_env = [[method_symb] + env[0], *env[1:]]
-        return class_env
+        if not overlap_method:
+            env.declare(method_symb)
+        return env
 
 
-    def visit_constructor_decl(self, node: "ConstructorDecl", env: List[List[Any]]):
-        overlap_method = get_symb_from_scope(node.name, env[0])
-        if overlap_method and not overlap_method.is_super:
-            raise Redeclared("Method", node.name)
+    def visit_constructor_decl(self, node: "ConstructorDecl", env: ScopeTable):
+        overlap_method = get_symb_from_scope(node.name, env)
+        if overlap_method:
+            self.report(Redeclared("Method", node.name), node)
         
         # Initialize constructor scope
+        param_types = []
         def check_param_redeclared(constructor_env, param):
             param_symb = self.visit(param, constructor_env)
-            if scope_contains(param.name, constructor_env[0]):
-                raise Redeclared("Parameter", param.name)
-            return [constructor_env[0] + [param_symb], *constructor_env[1:]]
-
-        constructor_env = reduce(check_param_redeclared, node.params, [[]] + env)
+            param_types.append(param_symb.type)
+            if scope_contains(param.name, constructor_env):
+                self.report(Redeclared("Parameter", param.name), param)
+            else:
+                constructor_env.declare(param_symb)
+            return constructor_env
+
+        constructor_env = reduce(check_param_redeclared, node.params, env.enter())
         
         # Check the body
-        self.visit(node.body, constructor_env)
+        self.check_body(node, constructor_env)
         
-        constructor_symb = ConstructorSymb(
-            node.name,
-            list(map(lambda p: self.visit(p.param_type, env), node.params)),
-        )
-        return [[constructor_symb] + env[0], *env[1:]]
+        constructor_symb = ConstructorSymb(node.name, param_types)
+        if not overlap_method:
+            env.declare(constructor_symb)
+        return env
 
 
-    def visit_destructor_decl(self, node: "DestructorDecl", env: List[List[Any]]):
+    def visit_destructor_decl(self, node: "DestructorDecl", env: ScopeTable):
         name = f"~{node.name}"
-        overlap_method = get_symb_from_scope(name, env[0])
-        if overlap_method and not overlap_method.is_super:
-            raise Redeclared("Method", name)
+        overlap_method = get_symb_from_scope(name, env)
+        if overlap_method:
+            self.report(Redeclared("Method", name), node)
         
         # Initialize destructor scope and check the body
-        destructor_env = [[]] + env
-        self.visit(node.body, destructor_env)
+        destructor_env = env.enter()
+        self.check_body(node, destructor_env)
         
         destructor_symb = DestructorSymb(name)
-        return [[destructor_symb] + env[0], *env[1:]]
+        if not overlap_method:
+            env.declare(destructor_symb)
+        return env
 
 
-    def visit_parameter(self, node: "Parameter", env: List[List[Any]]):
+    def visit_parameter(self, node: "Parameter", env: ScopeTable):
         param_type = self.visit(node.param_type, env)
         return ParameterSymb(param_type, node.name)
 
     # Type system
 
-    def visit_primitive_type(self, node: "PrimitiveType", env: List[List[Any]]):
+    def visit_primitive_type(self, node: "PrimitiveType", env: ScopeTable):
         prim_map = {"int": Tint(), "float": Tfloat(), "boolean": Tboolean(), "string": Tstring(), "void": Tvoid(), "nil": Tnil()}
         return prim_map[node.type_name]
 
 
-    def visit_array_type(self, node: "ArrayType", env: List[List[Any]]):
+    def visit_array_type(self, node: "ArrayType", env: ScopeTable):
         element_type = self.visit(node.element_type, env)
         return Tarray(element_type, node.size)
 
 
-    def visit_class_type(self, node: "ClassType", env: List[List[Any]]):
-        target_class = get_class_symb(node.class_name, env[-1])
+    def visit_class_type(self, node: "ClassType", env: ScopeTable):
+        target_class = get_class_symb(node.class_name, env.global_scope)
         if not target_class:
             raise UndeclaredClass(node.class_name)
         return Tclass(target_class.name, target_class.superclass)
 
 
-    def visit_reference_type(self, node: "ReferenceType", env: List[List[Any]]):
+    def visit_reference_type(self, node: "ReferenceType", env: ScopeTable):
         referenced_type = self.visit(node.referenced_type, env)
         return Treference(referenced_type)
 
     # Statements
 
-    def visit_block_statement(self, node: "BlockStatement", env: List[List[Any]]):
+    def visit_block_statement(self, node: "BlockStatement", env: ScopeTable):
         block_env = reduce(
             lambda block_env, var_decl: self.visit(var_decl, block_env),
             node.var_decls,
             env,
         )
         for stmt in node.statements:
-            stmt_env = [[]] + block_env if type(stmt) is BlockStatement else block_env
+            stmt_env = block_env.enter() if isinstance(stmt, BlockStatement) else block_env
             self.visit(stmt, stmt_env)
 
 
-    def visit_variable_decl(self, node: "VariableDecl", env: List[List[Any]]):
+    def visit_variable_decl(self, node: "VariableDecl", env: ScopeTable):
+        # Initializers see the variables of earlier declarations only, so
+        # this declaration's variables are added to the scope at the end
         def check_var_redeclared(var_list, var):
             name, init_type = self.visit(var, env)
             var_type = self.visit(node.var_type, env)
             
             var_symb = VariableSymb(node.is_final, var_type, name)
-            if scope_contains(var_symb.name, var_list):
-                raise Redeclared("Constant", var_symb.name) if node.is_final else Redeclared("Variable", var_symb.name)
+            if scope_contains(var_symb.name, env) or var_symb.name in var_list:
+                self.report(Redeclared("Constant" if node.is_final else "Variable", var_symb.name), var)
+                return var_list
             
             # Fill in the element type if array type is returned
             if type(var_type) is Tarray and type(init_type) is Tarray and not init_type.element_type:
@@ -504,34 +635,37 @@ class StaticChecker(ASTVisitor):
             
             # Non-constant variable declaration case is not specified for type checking
             if not node.is_final:
-                if init_type and type(init_type) is not Tnil and not can_coerce_type(init_type, var_type):
-                    raise TypeMismatchInStatement(node)
+                if init_type and type(init_type) is not Tnil and not can_coerce_type(init_type, var_type, env.global_scope):
+                    self.report(TypeMismatchInStatement(node), var)
             
             # Constant variable declaration case
             if node.is_final:
                 if not init_type:
-                    raise IllegalConstantExpression(NilLiteral())
+                    self.report(IllegalConstantExpression(NilLiteral()), var)
                 
                 # Initialization is not statically evaluable
-                if not init_type.is_final:
-                    raise IllegalConstantExpression(var.init_value)
+                elif not init_type.is_final and type(init_type) is not Terror:
+                    self.report(IllegalConstantExpression(var.init_value), var)
                 
                 # Initialization doesn't match types (under coercion rules)
-                if not can_coerce_type(init_type, var_type):
-                    raise TypeMismatchInConstant(node)
+                elif not can_coerce_type(init_type, var_type, env.global_scope):
+                    self.report(TypeMismatchInConstant(node), var)
             
-            return var_list + [var_symb]
+            var_list[var_symb.name] = var_symb
+            return var_list
 
-        block_scope = reduce(check_var_redeclared, node.variables, env[0])
-        return [block_scope, *env[1:]]
+        var_list = reduce(check_var_redeclared, node.variables, {})
+        for var_symb in var_list.values():
+            env.declare(var_symb)
+        return env
 
 
-    def visit_variable(self, node: "Variable", env: List[List[Any]]):
+    def visit_variable(self, node: "Variable", env: ScopeTable):
         init_type = self.visit(node.init_value, env) if node.init_value else None
         return node.name, init_type
 
 
-    def visit_assignment_statement(self, node: "AssignmentStatement", env: List[List[Any]]):
+    def visit_assignment_statement(self, node: "AssignmentStatement", env: ScopeTable):
         lhs_type = self.visit(node.lhs, env)
         rhs_type = self.visit(node.rhs, env)
         
@@ -539,70 +673,72 @@ class StaticChecker(ASTVisitor):
         if lhs_type.is_final:
             raise CannotAssignToConstant(node)
         
-        if not can_coerce_type(rhs_type, lhs_type):
+        if not can_coerce_type(rhs_type, lhs_type, env.global_scope):
             raise TypeMismatchInStatement(node)
 
 
-    def visit_if_statement(self, node: "IfStatement", env: List[List[Any]]):
+    def visit_if_statement(self, node: "IfStatement", env: ScopeTable):
         condition_type = self.visit(node.condition, env)
-        if type(condition_type) is not Tboolean:
-            raise TypeMismatchInStatement(node)
+        if type(condition_type) not in [Tboolean, Terror]:
+            self.report(TypeMismatchInStatement(node), node)
         
-        then_env = [[]] + env
+        then_env = env.enter()
         self.visit(node.then_stmt, then_env)
         
         if node.else_stmt:
-            else_env = [[]] + env
+            else_env = env.enter()
             self.visit(node.else_stmt, else_env)
 
 
-    def visit_for_statement(self, node: "ForStatement", env: List[List[Any]]):
+    def visit_for_statement(self, node: "ForStatement", env: ScopeTable):
         idx_symb = get_symb_by_id(node.variable, env)
-        if idx_symb and type(idx_symb) in [AttributeSymb, ParameterSymb, VariableSymb] and type(idx_symb.type) is not Tint:
-            raise TypeMismatchInStatement(node)
+        if idx_symb and type(idx_symb) in [AttributeSymb, ParameterSymb, VariableSymb] and type(idx_symb.type) not in [Tint, Terror]:
+            self.report(TypeMismatchInStatement(node), node)
         
         if not idx_symb or type(idx_symb) not in [AttributeSymb, ParameterSymb, VariableSymb]:
             idx_symb = VariableSymb(False, Tint(), node.variable)
         
         start_type = self.visit(node.start_expr, env)
         end_type = self.visit(node.end_expr, env)
-        if type(start_type) is not Tint or type(end_type) is not Tint:
-            raise TypeMismatchInStatement(node)
+        if type(start_type) not in [Tint, Terror] or type(end_type) not in [Tint, Terror]:
+            self.report(TypeMismatchInStatement(node), node)
         
-        for_signal = ForSignal()
-        self.visit(node.body, [[for_signal, idx_symb]] + env)
+        loop_env = env.enter()
+        loop_env.declare(ForSignal())
+        loop_env.declare(idx_symb)
+        self.visit(node.body, loop_env)
 
 
-    def visit_break_statement(self, node: "BreakStatement", env: List[List[Any]]):
+    def visit_break_statement(self, node: "BreakStatement", env: ScopeTable):
         for_signal = get_for_signal(env)
         if not for_signal:
             raise MustInLoop(node)
 
 
-    def visit_continue_statement(self, node: "ContinueStatement", env: List[List[Any]]):
+    def visit_continue_statement(self, node: "ContinueStatement", env: ScopeTable):
         for_signal = get_for_signal(env)
         if not for_signal:
             raise MustInLoop(node)
 
 
-    def visit_return_statement(self, node: "ReturnStatement", env: List[List[Any]]):
+    def visit_return_statement(self, node: "ReturnStatement", env: ScopeTable):
         return_type = self.processing_method.return_type
         if type(return_type) in [Tnil, Tvoid]:
             raise TypeMismatchInStatement(node)
         
         value_type = self.visit(node.value, env)
-        if type(value_type) is not type(return_type):
+        if type(value_type) is not type(return_type) and Terror not in [type(value_type), type(return_type)]:
             raise TypeMismatchInStatement(node)
 
 
-    def visit_method_invocation_statement(self, node: "MethodInvocationStatement", env: List[List[Any]]):
+    def visit_method_invocation_statement(self, node: "MethodInvocationStatement", env: ScopeTable):
         return_type = self.visit(node.method_call, env)
-        if type(return_type) not in [Tnil, Tvoid]:
+        if type(return_type) not in [Tnil, Tvoid, Terror]:
             raise TypeMismatchInStatement(node)
 
     # Left-hand side (LHS)
 
-    def visit_id_lhs(self, node: "IdLHS", env: List[List[Any]]):
+    def visit_id_lhs(self, node: "IdLHS", env: ScopeTable):
         found_symb = get_symb_by_id(node.name, env)
         if not found_symb:
             raise UndeclaredIdentifier(node.name)
@@ -611,15 +747,17 @@ class StaticChecker(ASTVisitor):
         return found_symb.type
 
 
-    def visit_postfix_lhs(self, node: "PostfixLHS", env: List[List[Any]]):
+    def visit_postfix_lhs(self, node: "PostfixLHS", env: ScopeTable):
         postfix_type = self.visit(node.postfix_expr, env)
         return postfix_type
 
     # Expressions
 
-    def visit_binary_op(self, node: "BinaryOp", env: List[List[Any]]):
+    def visit_binary_op(self, node: "BinaryOp", env: ScopeTable):
         left_type = self.visit(node.left, env)
         right_type = self.visit(node.right, env)
+        if type(left_type) is Terror or type(right_type) is Terror:
+            return Terror()
         
         # Arithmetic operations
         if node.operator in ["+", "-", "*", "/"]:
@@ -664,8 +802,10 @@ class StaticChecker(ASTVisitor):
         raise TypeMismatchInExpression(node)
 
 
-    def visit_unary_op(self, node: "UnaryOp", env: List[List[Any]]):
+    def visit_unary_op(self, node: "UnaryOp", env: ScopeTable):
         operand_type = self.visit(node.operand, env)
+        if type(operand_type) is Terror:
+            return operand_type
 
         # Arithmetic operators
         if node.operator in ["+", "-"]:
@@ -682,11 +822,13 @@ class StaticChecker(ASTVisitor):
         raise TypeMismatchInExpression(node)
 
 
-    def visit_postfix_expression(self, node: "PostfixExpression", env: List[List[Any]]):
+    def visit_postfix_expression(self, node: "PostfixExpression", env: ScopeTable):
         primary_type = self.visit(node.primary, env)
         
         def evaluate_postfix_expressions(current_type, postfix_op):
             postfix_type = self.visit(postfix_op, env)
+            if type(current_type) is Terror or type(postfix_type) is Terror:
+                return Terror()
             
             # Method call
             if type(postfix_type) is MethodPostfix:
@@ -700,7 +842,7 @@ class StaticChecker(ASTVisitor):
                     if type(method_symb.return_type) in [Tnil, Tvoid]:
                         raise TypeMismatchInExpression(node)
                     
-                    if not can_coerce_args(postfix_type.arg_types, method_symb.param_types):
+                    if not can_coerce_args(postfix_type.arg_types, method_symb.param_types, env.global_scope):
                         raise TypeMismatchInExpression(node)
                     
                     if not method_symb.is_static:
@@ -710,7 +852,7 @@ class StaticChecker(ASTVisitor):
                 
                 # Instance method call
                 if type(current_type) is Tclass:
-                    class_symb = current_type.symb if current_type.symb else get_class_symb(current_type.name, env[-1])
+                    class_symb = current_type.symb if current_type.symb else get_class_symb(current_type.name, env.global_scope)
                     if not class_symb:
                         raise UndeclaredClass(current_type.name)
                     
@@ -721,7 +863,7 @@ class StaticChecker(ASTVisitor):
                     if type(method_symb.return_type) in [Tnil, Tvoid]:
                         raise TypeMismatchInExpression(node)
                     
-                    if not can_coerce_args(postfix_type.arg_types, method_symb.param_types):
+                    if not can_coerce_args(postfix_type.arg_types, method_symb.param_types, env.global_scope):
                         raise TypeMismatchInExpression(node)
                     
                     if method_symb.is_static:
@@ -743,11 +885,13 @@ class StaticChecker(ASTVisitor):
                     if not attr_symb.is_static:
                         raise IllegalMemberAccess(node)
                     
-                    return attr_symb.type.set_final_if(False)
+                    # A copy, so the attribute's own type, which subclasses
+                    # share, stays final
+                    return copy(attr_symb.type).set_final_if(False)
                 
                 # Instance member access
                 if type(current_type) is Tclass:
-                    class_symb = current_type.symb if current_type.symb else get_class_symb(current_type.name, env[-1])
+                    class_symb = current_type.symb if current_type.symb else get_class_symb(current_type.name, env.global_scope)
                     if not class_symb:
                         raise UndeclaredClass(current_type.name)
                     
@@ -758,7 +902,7 @@ class StaticChecker(ASTVisitor):
                     if attr_symb.is_static:
                         raise IllegalMemberAccess(node)
                     
-                    return attr_symb.type.set_final_if(False)
+                    return copy(attr_symb.type).set_final_if(False)
                 
                 raise TypeMismatchInExpression(node)
             
@@ -774,30 +918,30 @@ class StaticChecker(ASTVisitor):
         return output_type.set_final_if(False)
 
 
-    def visit_method_call(self, node: "MethodCall", env: List[List[Any]]):
+    def visit_method_call(self, node: "MethodCall", env: ScopeTable):
         arg_types = list(map(lambda arg: self.visit(arg, env), node.args))
         return MethodPostfix(node.method_name, arg_types)
 
 
-    def visit_member_access(self, node: "MemberAccess", env: List[List[Any]]):
+    def visit_member_access(self, node: "MemberAccess", env: ScopeTable):
         return MemberPostfix(node.member_name)
 
 
-    def visit_array_access(self, node: "ArrayAccess", env: List[List[Any]]):
+    def visit_array_access(self, node: "ArrayAccess", env: ScopeTable):
         index_type = self.visit(node.index, env)
-        if type(index_type) is not Tint:
+        if type(index_type) not in [Tint, Terror]:
             raise TypeMismatchInExpression(node)
         return ArrayPostfix()
 
 
-    def visit_object_creation(self, node: "ObjectCreation", env: List[List[Any]]):
-        class_symb = get_class_symb(node.class_name, env[-1])
+    def visit_object_creation(self, node: "ObjectCreation", env: ScopeTable):
+        class_symb = get_class_symb(node.class_name, env.global_scope)
         if not class_symb:
             raise UndeclaredClass(node.class_name)
         return Tclass(class_symb.name, class_symb.superclass)
 
 
-    def visit_identifier(self, node: "Identifier", env: List[List[Any]]):
+    def visit_identifier(self, node: "Identifier", env: ScopeTable):
         cls = self.processing_class
         found_symb = cls if cls.name == node.name else get_symb_by_id(node.name, env)
         if not found_symb:
@@ -808,35 +952,37 @@ class StaticChecker(ASTVisitor):
         return found_symb
 
 
-    def visit_this_expression(self, node: "ThisExpression", env: List[List[Any]]):
+    def visit_this_expression(self, node: "ThisExpression", env: ScopeTable):
         cls = self.processing_class
         return Tclass(cls.name, cls.superclass, cls)
 
 
-    def visit_parenthesized_expression(self, node: "ParenthesizedExpression", env: List[List[Any]]):
+    def visit_parenthesized_expression(self, node: "ParenthesizedExpression", env: ScopeTable):
         return self.visit(node.expr, env)
 
     # Literals
 
-    def visit_int_literal(self, node: "IntLiteral", env: List[List[Any]]):
+    def visit_int_literal(self, node: "IntLiteral", env: ScopeTable):
         return Tint(is_final=True)
 
 
-    def visit_float_literal(self, node: "FloatLiteral", env: List[List[Any]]):
+    def visit_float_literal(self, node: "FloatLiteral", env: ScopeTable):
         return Tfloat(is_final=True)
 
 
-    def visit_bool_literal(self, node: "BoolLiteral", env: List[List[Any]]):
+    def visit_bool_literal(self, node: "BoolLiteral", env: ScopeTable):
         return Tboolean(is_final=True)
 
 
-    def visit_string_literal(self, node: "StringLiteral", env: List[List[Any]]):
+    def visit_string_literal(self, node: "StringLiteral", env: ScopeTable):
         return Tstring(is_final=True)
 
 
-    def visit_array_literal(self, node: "ArrayLiteral", env: List[List[Any]]):
+    def visit_array_literal(self, node: "ArrayLiteral", env: ScopeTable):
         def check_same_type_literal(types, element):
             element_type = self.visit(element, env)
+            if type(element_type) is Terror:
+                return types
             if type(element_type) in [Tvoid, Tnil, Tarray]:
                     raise IllegalArrayLiteral(node)
             
@@ -848,6 +994,8 @@ class StaticChecker(ASTVisitor):
             return types + [element_type]
         
         type_list = reduce(check_same_type_literal, node.value, [])
+        if len(type_list) < len(node.value):
+            return Terror()
         element_type = type_list[0] if type_list else None
         
         array_type = Tarray(element_type, len(type_list))
@@ -855,7 +1003,7 @@ class StaticChecker(ASTVisitor):
         return array_type
 
 
-    def visit_nil_literal(self, node: "NilLiteral", env: List[List[Any]]):
+    def visit_nil_literal(self, node: "NilLiteral", env: ScopeTable):
         return Tnil()
     
     def visit_static_method_invocation(
@@ -8,7 +8,17 @@ static semantic checking of OPLang programs according to the language specificat
 
 class StaticError(Exception):
     """Base class for all static semantic errors in OPLang"""
-    pass
+
+    def __reduce__(self):
+        # Subclasses take their own arguments, so rebuild errors from the
+        # message and attributes, e.g. when returned by a worker process
+        return _restore_error, (type(self), self.args, self.__dict__)
+
+
+def _restore_error(error_class, args, state):
+    error = error_class.__new__(error_class, *args)
+    error.__dict__.update(state)
+    return error
 
 
 class Redeclared(StaticError):
@@ -0,0 +1,302 @@
+"""
+Struct-of-arrays AST storage for OPLang programming language.
+This module stores AST nodes in flat array buffers indexed by integer
+node id, converts between that form and the node classes of nodes.py,
+and exposes read-only views that visitors can walk like ordinary nodes.
+"""
+
+from array import array
+from typing import Any
+
+from .nodes import *
+
+
+# Field kinds: "node" is a child id (-1 for None), "nodes" an offset into
+# ASTArena.lists, "str" an index into the string table (-1 for None),
+# "op" an index into OPERATORS, "float" an index into ASTArena.floats,
+# "bool" the value itself, "int" the value shifted left by one bit, or for
+# values too wide for that, the index of their decimal text in the string
+# table shifted left with the low bit set, and "none" a placeholder for nil
+LAYOUTS = {
+    Program: (("class_decls", "nodes"),),
+    ClassDecl: (("name", "str"), ("superclass", "str"), ("members", "nodes")),
+    AttributeDecl: (
+        ("is_static", "bool"),
+        ("is_final", "bool"),
+        ("attr_type", "node"),
+        ("attributes", "nodes"),
+    ),
+    Attribute: (("name", "str"), ("init_value", "node")),
+    MethodDecl: (
+        ("is_static", "bool"),
+        ("return_type", "node"),
+        ("name", "str"),
+        ("params", "nodes"),
+        ("body", "node"),
+    ),
+    ConstructorDecl: (("name", "str"), ("params", "nodes"), ("body", "node")),
+    DestructorDecl: (("name", "str"), ("body", "node")),
+    Parameter: (("param_type", "node"), ("name", "str")),
+    PrimitiveType: (("type_name", "str"),),
+    ArrayType: (("element_type", "node"), ("size", "int")),
+    ClassType: (("class_name", "str"),),
+    ReferenceType: (("referenced_type", "node"),),
+    BlockStatement: (("var_decls", "nodes"), ("statements", "nodes")),
+    VariableDecl: (("is_final", "bool"), ("var_type", "node"), ("variables", "nodes")),
+    Variable: (("name", "str"), ("init_value", "node")),
+    AssignmentStatement: (("lhs", "node"), ("rhs", "node")),
+    IfStatement: (("condition", "node"), ("then_stmt", "node"), ("else_stmt", "node")),
+    ForStatement: (
+        ("variable", "str"),
+        ("start_expr", "node"),
+        ("direction", "str"),
+        ("end_expr", "node"),
+        ("body", "node"),
+    ),
+    BreakStatement: (),
+    ContinueStatement: (),
+    ReturnStatement: (("value", "node"),),
+    MethodInvocationStatement: (("method_call", "node"),),
+    IdLHS: (("name", "str"),),
+    PostfixLHS: (("postfix_expr", "node"),),
+    BinaryOp: (("left", "node"), ("operator", "op"), ("right", "node")),
+    UnaryOp: (("operator", "op"), ("operand", "node")),
+    PostfixExpression: (("primary", "node"), ("postfix_ops", "nodes")),
+    MethodCall: (("method_name", "str"), ("args", "nodes")),
+    MemberAccess: (("member_name", "str"),),
+    ArrayAccess: (("index", "node"),),
+    ObjectCreation: (("class_name", "str"), ("args", "nodes")),
+    Identifier: (("name", "str"),),
+    ThisExpression: (),
+    ParenthesizedExpression: (("expr", "node"),),
+    IntLiteral: (("value", "int"),),
+    FloatLiteral: (("value", "float"),),
+    BoolLiteral: (("value", "bool"),),
+    StringLiteral: (("value", "str"),),
+    ArrayLiteral: (("value", "nodes"),),
+    NilLiteral: (("value", "none"),),
+}
+
+KINDS = tuple(LAYOUTS)
+_KIND_CODES = {node_class: code for code, node_class in enumerate(KINDS)}
+
+OPERATORS = (
+    "+", "-", "*", "/", "\\", "%", "^",
+    "&&", "||", "!",
+    "==", "!=", "<", ">", "<=", ">=",
+)
+_OPERATOR_CODES = {operator: code for code, operator in enumerate(OPERATORS)}
+
+# Range of the int values stored inline, shifted, in a signed 64-bit slot
+_INLINE_INT_MIN, _INLINE_INT_MAX = -(1 << 62), (1 << 62) - 1
+
+
+class ASTArena:
+    """
+    Column-wise store for any number of ASTs.
+
+    Node i has kind KINDS[kinds[i]], position lines[i]/columns[i] (-1
+    for None), and its fields, laid out as in LAYOUTS, at data[offsets[i]:].
+    A list field points at lists[j] = n, followed by the n child ids.
+    Children are stored before their parent, so a root is always the
+    last node added for its tree.
+    """
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.offsets = array("i")
+        self.lines = array("i")
+        self.columns = array("i")
+        self.data = array("q")
+        self.lists = array("i")
+        self.floats = array("d")
+        self.strings = []
+        self._string_ids = {}
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def add(self, node: ASTNode) -> int:
+        """
+        Store node and its whole subtree in the arena.
+
+        Args:
+            node (ASTNode): Root of the tree to store
+
+        Returns:
+            The id of node in the arena
+        """
+        layout = LAYOUTS[type(node)]
+        fields = [self._encode(kind, getattr(node, name)) for name, kind in layout]
+        node_id = len(self.kinds)
+        self.kinds.append(_KIND_CODES[type(node)])
+        self.offsets.append(len(self.data))
+        self.data.extend(fields)
+        self.lines.append(-1 if node.line is None else node.line)
+        self.columns.append(-1 if node.column is None else node.column)
+        return node_id
+
+    def _encode(self, kind: str, value) -> int:
+        if kind == "node":
+            return -1 if value is None else self.add(value)
+        if kind == "nodes":
+            ids = [self.add(item) for item in value]
+            start = len(self.lists)
+            self.lists.append(len(ids))
+            self.lists.extend(ids)
+            return start
+        if kind == "str":
+            if value is None:
+                return -1
+            string_id = self._string_ids.get(value)
+            if string_id is None:
+                string_id = self._string_ids[value] = len(self.strings)
+                self.strings.append(value)
+            return string_id
+        if kind == "op":
+            return _OPERATOR_CODES[value]
+        if kind == "float":
+            self.floats.append(value)
+            return len(self.floats) - 1
+        if kind == "none":
+            return 0
+        if kind == "int":
+            if _INLINE_INT_MIN <= value <= _INLINE_INT_MAX:
+                return value << 1
+            return self._encode("str", str(value)) << 1 | 1
+        return int(value)
+
+    def decode(self, node_id: int, index: int, make):
+        """
+        Return field index of node node_id, building child nodes with make.
+
+        Args:
+            node_id (int): Id of the node
+            index (int): Position of the field in the node's layout
+            make: Either view or to_node, applied to child ids
+
+        Returns:
+            The field value, as found on the equivalent nodes.py object
+        """
+        kind = LAYOUTS[KINDS[self.kinds[node_id]]][index][1]
+        value = self.data[self.offsets[node_id] + index]
+        if kind == "node":
+            return None if value < 0 else make(value)
+        if kind == "nodes":
+            count = self.lists[value]
+            return [make(child) for child in self.lists[value + 1:value + 1 + count]]
+        if kind == "str":
+            return None if value < 0 else self.strings[value]
+        if kind == "op":
+            return OPERATORS[value]
+        if kind == "float":
+            return self.floats[value]
+        if kind == "bool":
+            return bool(value)
+        if kind == "int":
+            return int(self.strings[value >> 1]) if value & 1 else value >> 1
+        return None
+
+    def position(self, node_id: int):
+        """Return the (line, column) of node node_id, None where unset."""
+        line, column = self.lines[node_id], self.columns[node_id]
+        return (None if line < 0 else line), (None if column < 0 else column)
+
+    def view(self, node_id: int) -> "NodeView":
+        """Return a read-only node view over node node_id."""
+        return VIEW_CLASSES[self.kinds[node_id]](self, node_id)
+
+    def to_node(self, node_id: int) -> ASTNode:
+        """Rebuild node node_id and its subtree as nodes.py objects."""
+        node_class = KINDS[self.kinds[node_id]]
+        # A fresh node is not hashed, so its fields are set without going
+        # through ASTNode's frozen-node check
+        set_field = object.__setattr__
+        node = node_class.__new__(node_class)
+        set_field(node, "_hash_cache", None)
+        for index, (name, _) in enumerate(LAYOUTS[node_class]):
+            set_field(node, name, self.decode(node_id, index, self.to_node))
+        line, column = self.position(node_id)
+        set_field(node, "line", line)
+        set_field(node, "column", column)
+        return node
+
+    def accept(self, node_id: int, visitor, o: Any = None):
+        """
+        Run visitor over node node_id through its view.
+
+        Any ASTVisitor works unchanged, since a view dispatches to the
+        same visit method as the node it stands for.
+
+        Args:
+            node_id (int): Id of the node to visit
+            visitor (ASTVisitor): The visitor, e.g. a StaticChecker
+            o: Visitor argument
+
+        Returns:
+            The visitor's result
+        """
+        return self.view(node_id).accept(visitor, o)
+
+    def nbytes(self) -> int:
+        """Return the memory held by the arena's array buffers, in bytes."""
+        return sum(
+            column.buffer_info()[1] * column.itemsize
+            for column in (
+                self.kinds, self.offsets, self.lines, self.columns,
+                self.data, self.lists, self.floats,
+            )
+        )
+
+
+class NodeView:
+    """
+    Mixin for the read-only view classes, one per node class.
+
+    Each view class subclasses the node class it stands for, so
+    isinstance checks, accept and __str__ behave as on real nodes, while
+    every field is read from the arena on access. A view pickles as its
+    arena and node id.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, arena: ASTArena, node_id: int):
+        self.arena = arena
+        self.node_id = node_id
+        self._hash_cache = None
+
+    @property
+    def line(self):
+        return self.arena.position(self.node_id)[0]
+
+    @property
+    def column(self):
+        return self.arena.position(self.node_id)[1]
+
+    def __reduce__(self):
+        return self.arena.view, (self.node_id,)
+
+
+def _field_property(index: int):
+    def read(self):
+        return self.arena.decode(self.node_id, index, self.arena.view)
+    return property(read)
+
+
+def _view_class(node_class):
+    # Named as the node class, which printing and hashing rely on, but
+    # bound in this module as <name>View, so the class pickles by name
+    namespace = {
+        "__slots__": ("arena", "node_id"),
+        "__module__": __name__,
+        "__qualname__": node_class.__name__ + "View",
+    }
+    for index, (name, _) in enumerate(LAYOUTS[node_class]):
+        namespace[name] = _field_property(index)
+    return type(node_class)(node_class.__name__, (NodeView, node_class), namespace)
+
+
+# View class of each node class, in the order of KINDS
+VIEW_CLASSES = tuple(_view_class(node_class) for node_class in KINDS)
+globals().update((view.__qualname__, view) for view in VIEW_CLASSES)
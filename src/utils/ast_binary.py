@@ -0,0 +1,248 @@
+"""
+Binary serialization of OPLang ASTs.
+This module writes a Program, or any other AST node, to a compact
+versioned byte format and reads it back, so later jobs can reuse an
+AST without lexing and parsing the source again.
+"""
+
+import struct
+import sys
+
+from .ast_arena import KINDS, LAYOUTS, OPERATORS
+from .interning import InternTable
+from .nodes import ASTNode, ClassType, PrimitiveType
+
+
+MAGIC = b"OPAST"
+
+# Bump whenever LAYOUTS, KINDS or OPERATORS change, as tags and operator
+# codes are their indices
+FORMAT_VERSION = 1
+
+_KIND_TAGS = {node_class: tag for tag, node_class in enumerate(KINDS, 1)}
+_OPERATOR_CODES = {operator: code for code, operator in enumerate(OPERATORS)}
+_FLOAT = struct.Struct("<d")
+
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Writer:
+    """Encodes nodes in pre-order, collecting the string table on the way."""
+
+    def __init__(self):
+        self.out = bytearray()
+        self.strings = {}
+
+    def string(self, value: str):
+        if value is None:
+            self.out.append(0)
+            return
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        _write_varint(self.out, index + 1)
+
+    def node(self, node: ASTNode):
+        out = self.out
+        if node is None:
+            out.append(0)
+            return
+        node_class = type(node)
+        _write_varint(out, _KIND_TAGS[node_class])
+        _write_varint(out, 0 if node.line is None else node.line + 1)
+        _write_varint(out, 0 if node.column is None else node.column + 1)
+        for name, kind in LAYOUTS[node_class]:
+            value = getattr(node, name)
+            if kind == "node":
+                self.node(value)
+            elif kind == "nodes":
+                _write_varint(out, len(value))
+                for item in value:
+                    self.node(item)
+            elif kind == "str":
+                self.string(value)
+            elif kind == "op":
+                out.append(_OPERATOR_CODES[value])
+            elif kind == "int":
+                # Zigzag, so small negative sizes stay short
+                _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+            elif kind == "float":
+                out += _FLOAT.pack(value)
+            elif kind == "bool":
+                out.append(1 if value else 0)
+
+
+def dumps(node: ASTNode) -> bytes:
+    """
+    Serialize an AST to bytes.
+
+    The format is MAGIC, the format version, the string table (count,
+    then each string as length and UTF-8 bytes) and the nodes in
+    pre-order. Each node is its varint kind tag, line and column,
+    followed by its fields as laid out in ast_arena.LAYOUTS; absent
+    nodes and strings are written as 0.
+
+    Args:
+        node (ASTNode): Root of the tree, usually a Program
+
+    Returns:
+        The encoded tree
+    """
+    writer = _Writer()
+    writer.node(node)
+    header = bytearray(MAGIC)
+    _write_varint(header, FORMAT_VERSION)
+    _write_varint(header, len(writer.strings))
+    for value in writer.strings:
+        encoded = value.encode("utf-8")
+        _write_varint(header, len(encoded))
+        header += encoded
+    return bytes(header + writer.out)
+
+
+def loads(data: bytes, intern_table: InternTable = None) -> ASTNode:
+    """
+    Rebuild an AST from bytes written by dumps.
+
+    PrimitiveType and ClassType nodes are taken from intern_table, one
+    per type name and without a source position, as ASTGeneration
+    builds them.
+
+    Args:
+        data (bytes): The encoded tree
+        intern_table (InternTable): Table sharing names and type nodes,
+            such as the one of the compilation loading the tree; a new
+            table by default
+
+    Returns:
+        The root node
+
+    Raises:
+        ValueError: If data is not an encoded AST, was written with
+            another format version or is truncated
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not an OPLang AST file")
+    try:
+        return _decode(data, intern_table if intern_table is not None else InternTable())
+    except (IndexError, struct.error):
+        raise ValueError("truncated AST data") from None
+
+
+def _decode(data: bytes, intern_table: InternTable) -> ASTNode:
+    # Reads past the end raise IndexError or struct.error, which loads
+    # reports as truncated data
+    pos = len(MAGIC)
+
+    def varint():
+        nonlocal pos
+        byte = data[pos]
+        pos += 1
+        if byte < 0x80:
+            return byte
+        value, shift = byte & 0x7F, 7
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    version = varint()
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported AST format version {version}, expected {FORMAT_VERSION}")
+
+    strings = [None]
+    for _ in range(varint()):
+        length = varint()
+        if pos + length > len(data):
+            raise IndexError(pos + length)
+        strings.append(sys.intern(str(data[pos:pos + length], "utf-8")))
+        pos += length
+
+    shared_types = {
+        PrimitiveType: intern_table.primitive_type,
+        ClassType: intern_table.class_type,
+    }
+
+    set_field = object.__setattr__
+
+    def node():
+        nonlocal pos
+        tag = varint()
+        if tag == 0:
+            return None
+        node_class = KINDS[tag - 1]
+        line, column = varint(), varint()
+        shared_type = shared_types.get(node_class)
+        if shared_type is not None:
+            return shared_type(strings[varint()])
+        # A fresh node is not hashed, so its fields are set without going
+        # through ASTNode's frozen-node check
+        result = node_class.__new__(node_class)
+        set_field(result, "_hash_cache", None)
+        set_field(result, "line", line - 1 if line else None)
+        set_field(result, "column", column - 1 if column else None)
+        for name, kind in LAYOUTS[node_class]:
+            if kind == "node":
+                value = node()
+            elif kind == "nodes":
+                value = [node() for _ in range(varint())]
+            elif kind == "str":
+                value = strings[varint()]
+            elif kind == "op":
+                value = OPERATORS[data[pos]]
+                pos += 1
+            elif kind == "int":
+                value = varint()
+                value = value >> 1 if not value & 1 else -((value + 1) >> 1)
+            elif kind == "float":
+                value = _FLOAT.unpack_from(data, pos)[0]
+                pos += 8
+            elif kind == "bool":
+                value = data[pos] == 1
+                pos += 1
+            else:
+                value = None
+            set_field(result, name, value)
+        return result
+
+    return node()
+
+
+def dump(node: ASTNode, path: str):
+    """
+    Serialize an AST to the file at path.
+
+    Args:
+        node (ASTNode): Root of the tree, usually a Program
+        path (str): Destination file
+    """
+    with open(path, "wb") as f:
+        f.write(dumps(node))
+
+
+def load(path: str, intern_table: InternTable = None) -> ASTNode:
+    """
+    Read an AST from a file written by dump.
+
+    Args:
+        path (str): File written by dump
+        intern_table (InternTable): Table sharing names and type nodes,
+            see loads
+
+    Returns:
+        The root node
+
+    Raises:
+        ValueError: If the file is not an encoded AST, was written with
+            another format version or is truncated
+    """
+    with open(path, "rb") as f:
+        return loads(f.read(), intern_table)
@@ -0,0 +1,119 @@
+"""
+AST index for OPLang programming language.
+This module maps node kinds, and the names of named nodes, to the nodes
+of one or more Programs, and keeps parent pointers in a side table, so
+tools can answer repeated queries without walking the tree each time.
+"""
+
+from typing import Iterator, List, Optional
+
+from .nodes import *
+from .traversal import CHILD_FIELDS
+
+
+# Field holding the name of each named node class
+NAME_FIELDS = {
+    ClassDecl: "name",
+    Attribute: "name",
+    MethodDecl: "name",
+    ConstructorDecl: "name",
+    DestructorDecl: "name",
+    Parameter: "name",
+    PrimitiveType: "type_name",
+    ClassType: "class_name",
+    Variable: "name",
+    ForStatement: "variable",
+    IdLHS: "name",
+    MethodCall: "method_name",
+    MemberAccess: "member_name",
+    ObjectCreation: "class_name",
+    Identifier: "name",
+}
+
+
+class ASTIndex:
+    """
+    Kind and name index over Programs, with parent pointers.
+
+    Pass an index to ASTGeneration, or to build_ast, to fill it with
+    every Program generated, or call add() on a finished tree. Nodes
+    are listed in pre-order, which is source order, once each: type
+    nodes shared through an InternTable are listed once and have no
+    single parent. Parents are looked up by node identity, since nodes
+    compare structurally. The index is not updated when the tree is
+    modified.
+    """
+
+    def __init__(self):
+        self.by_kind = {}
+        self.by_name = {}
+        # id(node) -> (node, parent), parent None for roots and shared nodes
+        self.parents = {}
+
+    def add(self, root: ASTNode):
+        """
+        Index root and its subtree.
+
+        Args:
+            root (ASTNode): Root of the tree, usually a Program
+        """
+        by_kind, by_name, parents = self.by_kind, self.by_name, self.parents
+        stack = [(root, None)]
+        pop, push = stack.pop, stack.append
+        while stack:
+            node, parent = pop()
+            entry = parents.get(id(node))
+            if entry is not None:
+                # Seen under another parent, so the node is shared
+                parents[id(node)] = (node, None)
+                continue
+            parents[id(node)] = (node, parent)
+            node_class = type(node)
+            by_kind.setdefault(node_class, []).append(node)
+            name_field = NAME_FIELDS.get(node_class)
+            if name_field is not None:
+                by_name.setdefault((node_class, getattr(node, name_field)), []).append(node)
+            children = []
+            for name, is_list in CHILD_FIELDS[node_class]:
+                child = getattr(node, name)
+                if is_list:
+                    children.extend(child)
+                elif child is not None:
+                    children.append(child)
+            for child in reversed(children):
+                push((child, node))
+
+    def find(self, kind: type, name: Optional[str] = None) -> List[ASTNode]:
+        """
+        Return the indexed nodes of class kind, in source order.
+
+        Args:
+            kind (type): Node class, matched exactly, e.g. ObjectCreation
+            name (str): If given, only nodes with this name, as stored in
+                the kind's NAME_FIELDS field, e.g. the class name of an
+                ObjectCreation or the method name of a MethodCall
+
+        Returns:
+            A new list of the matching nodes
+        """
+        if name is None:
+            return list(self.by_kind.get(kind, ()))
+        return list(self.by_name.get((kind, name), ()))
+
+    def parent(self, node: ASTNode) -> Optional[ASTNode]:
+        """
+        Return the node whose field holds node.
+
+        Returns:
+            The parent, or None for a root, a shared type node or a node
+            that is not indexed
+        """
+        entry = self.parents.get(id(node))
+        return entry[1] if entry is not None and entry[0] is node else None
+
+    def ancestors(self, node: ASTNode) -> Iterator[ASTNode]:
+        """Yield the parent of node, its parent and so on up to the root."""
+        node = self.parent(node)
+        while node is not None:
+            yield node
+            node = self.parent(node)
@@ -0,0 +1,168 @@
+"""
+Streaming AST printer for OPLang programming language.
+This module writes the textual form of an AST, the one str(node)
+returns, to any text stream in a single pass, without building the
+string of each subtree first.
+"""
+
+from typing import TextIO, Union
+
+from .nodes import *
+
+
+def _joined(items, separator: str = ", ") -> list:
+    pieces = []
+    for item in items:
+        pieces.append(item)
+        pieces.append(separator)
+    if pieces:
+        pieces.pop()
+    return pieces
+
+
+def _block_statement(node):
+    pieces = ["BlockStatement("]
+    if node.var_decls:
+        pieces += ["vars=[", *_joined(node.var_decls), "], "]
+    return pieces + ["stmts=[", *_joined(node.statements), "])"]
+
+
+# Textual form of each node class: the whole text for nodes without
+# children, else a list of pieces in which strings are written as they
+# are, nodes are expanded in their place and any other value is written
+# as str(value). Fields that are not nodes are formatted into the
+# neighbouring strings, so there are few pieces to walk.
+PIECES = {
+    Program: lambda node: ["Program([", *_joined(node.class_decls), "])"],
+    ClassDecl: lambda node: [
+        f"ClassDecl({node.name}, extends {node.superclass}, [" if node.superclass else f"ClassDecl({node.name}, [",
+        *_joined(node.members), "])",
+    ],
+    AttributeDecl: lambda node: [
+        f"AttributeDecl({'static ' if node.is_static else ''}{'final ' if node.is_final else ''}",
+        node.attr_type, ", [", *_joined(node.attributes), "])",
+    ],
+    Attribute: lambda node: (
+        [f"Attribute({node.name} = ", node.init_value, ")"] if node.init_value else f"Attribute({node.name})"
+    ),
+    MethodDecl: lambda node: [
+        "MethodDecl(static " if node.is_static else "MethodDecl(", node.return_type,
+        f" {node.name}([", *_joined(node.params), "]), ", node.body, ")",
+    ],
+    ConstructorDecl: lambda node: [
+        f"ConstructorDecl({node.name}([", *_joined(node.params), "]), ", node.body, ")",
+    ],
+    DestructorDecl: lambda node: [f"DestructorDecl(~{node.name}(), ", node.body, ")"],
+    Parameter: lambda node: ["Parameter(", node.param_type, f" {node.name})"],
+    PrimitiveType: lambda node: f"PrimitiveType({node.type_name})",
+    ArrayType: lambda node: ["ArrayType(", node.element_type, f"[{node.size}])"],
+    ClassType: lambda node: f"ClassType({node.class_name})",
+    ReferenceType: lambda node: ["ReferenceType(", node.referenced_type, " &)"],
+    BlockStatement: _block_statement,
+    VariableDecl: lambda node: [
+        "VariableDecl(final " if node.is_final else "VariableDecl(", node.var_type,
+        ", [", *_joined(node.variables), "])",
+    ],
+    Variable: lambda node: (
+        [f"Variable({node.name} = ", node.init_value, ")"] if node.init_value else f"Variable({node.name})"
+    ),
+    AssignmentStatement: lambda node: ["AssignmentStatement(", node.lhs, " := ", node.rhs, ")"],
+    IfStatement: lambda node: [
+        "IfStatement(if ", node.condition, " then ", node.then_stmt,
+        *((", else ", node.else_stmt) if node.else_stmt else ()), ")",
+    ],
+    ForStatement: lambda node: [
+        f"ForStatement(for {node.variable} := ", node.start_expr, f" {node.direction} ", node.end_expr,
+        " do ", node.body, ")",
+    ],
+    BreakStatement: lambda node: "BreakStatement()",
+    ContinueStatement: lambda node: "ContinueStatement()",
+    ReturnStatement: lambda node: ["ReturnStatement(return ", node.value, ")"],
+    MethodInvocationStatement: lambda node: ["MethodInvocationStatement(", node.method_call, ")"],
+    IdLHS: lambda node: f"IdLHS({node.name})",
+    PostfixLHS: lambda node: ["PostfixLHS(", node.postfix_expr, ")"],
+    BinaryOp: lambda node: ["BinaryOp(", node.left, f", {node.operator}, ", node.right, ")"],
+    UnaryOp: lambda node: [f"UnaryOp({node.operator}, ", node.operand, ")"],
+    PostfixExpression: lambda node: ["PostfixExpression(", node.primary, *node.postfix_ops, ")"],
+    MethodCall: lambda node: [f".{node.method_name}(", *_joined(node.args), ")"],
+    MemberAccess: lambda node: f".{node.member_name}",
+    ArrayAccess: lambda node: ["[", node.index, "]"],
+    ObjectCreation: lambda node: [f"ObjectCreation(new {node.class_name}(", *_joined(node.args), "))"],
+    Identifier: lambda node: f"Identifier({node.name})",
+    ThisExpression: lambda node: "ThisExpression(this)",
+    ParenthesizedExpression: lambda node: ["ParenthesizedExpression((", node.expr, "))"],
+    IntLiteral: lambda node: f"IntLiteral({node.value})",
+    FloatLiteral: lambda node: f"FloatLiteral({node.value})",
+    BoolLiteral: lambda node: f"BoolLiteral({node.value})",
+    StringLiteral: lambda node: f"StringLiteral({node.value!r})",
+    ArrayLiteral: lambda node: ["ArrayLiteral({", *_joined(node.value), "})"],
+    NilLiteral: lambda node: "NilLiteral(nil)",
+}
+
+# Number of pieces gathered before each write to the stream
+_CHUNK = 4096
+
+
+def pieces(node: ASTNode) -> Union[str, list]:
+    """
+    Return node's textual form or its pieces, see PIECES.
+
+    Subclasses, such as arena views, use the form of the nearest node
+    class they derive from; classes without one print as Name().
+    """
+    try:
+        return PIECES[type(node)](node)
+    except KeyError:
+        for node_class in type(node).__mro__:
+            if node_class in PIECES:
+                PIECES[type(node)] = PIECES[node_class]
+                return PIECES[node_class](node)
+        return f"{type(node).__name__}()"
+
+
+def write_ast(node: ASTNode, stream: TextIO):
+    """
+    Write the textual form of an AST to a text stream.
+
+    The tree is walked with an explicit stack, so every character is
+    produced once and trees of any depth can be printed. Output is
+    written in chunks as it is produced.
+
+    Args:
+        node (ASTNode): Root of the tree to print
+        stream (TextIO): Destination, e.g. io.StringIO, an open file or
+            sys.stdout
+    """
+    _write(node, stream.write)
+
+
+def format_ast(node: ASTNode) -> str:
+    """Return the textual form of an AST, as written by write_ast."""
+    chunks = []
+    _write(node, chunks.append)
+    return "".join(chunks)
+
+
+def _write(node: ASTNode, write):
+    out, stack = [], [node]
+    append, pop, extend, form_of = out.append, stack.pop, stack.extend, PIECES.get
+    while stack:
+        piece = pop()
+        if type(piece) is not str:
+            # Looked up by exact class first, as isinstance checks against
+            # the abstract ASTNode are slow
+            form = form_of(type(piece))
+            if form is not None:
+                piece = form(piece)
+            elif isinstance(piece, ASTNode):
+                piece = pieces(piece)
+            else:
+                piece = str(piece)
+            if type(piece) is not str:
+                extend(reversed(piece))
+                if len(out) >= _CHUNK:
+                    write("".join(out))
+                    out.clear()
+                continue
+        append(piece)
+    write("".join(out))
@@ -0,0 +1,158 @@
+"""
+Persistent prediction DFA cache for the generated OPLang recognizers.
+This module warms the DFAs shared by every OPLangLexer and OPLangParser
+instance from a corpus of sources, saves them to disk and restores them
+in a fresh process, so the first parse does not pay for ATN simulation.
+"""
+
+import hashlib
+import pickle
+
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.ATNState import ATNState
+from antlr4.atn.LexerAction import LexerMoreAction, LexerPopModeAction, LexerSkipAction
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.dfa.DFA import DFA
+from antlr4.PredictionContext import PredictionContext
+
+import build.OPLangLexer as lexer_module
+import build.OPLangParser as parser_module
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from .error_listener import NewErrorListener
+from .parse_strategy import parse_with_mode
+
+
+CACHE_FORMAT = 1
+
+# Runtime singletons compared by identity; they must be restored as the
+# live objects rather than as copies
+_SINGLETONS = {
+    "error": ATNSimulator.ERROR,
+    "empty": PredictionContext.EMPTY,
+    "none": SemanticContext.NONE,
+    "skip": LexerSkipAction.INSTANCE,
+    "more": LexerMoreAction.INSTANCE,
+    "popmode": LexerPopModeAction.INSTANCE,
+}
+
+_ATNS = {"lexer": OPLangLexer.atn, "parser": OPLangParser.atn}
+
+
+def grammar_fingerprint() -> str:
+    """
+    Return a digest of the serialized lexer and parser ATNs.
+
+    A saved cache is only valid for the grammar it was built from, so the
+    digest is stored with the cache and checked on load.
+    """
+    digest = hashlib.sha256()
+    digest.update(repr(lexer_module.serializedATN()).encode())
+    digest.update(repr(parser_module.serializedATN()).encode())
+    return digest.hexdigest()
+
+
+class _DFAPickler(pickle.Pickler):
+    """Pickler that stores ATN states and runtime singletons by reference."""
+
+    _singleton_ids = {id(obj): name for name, obj in _SINGLETONS.items()}
+    _atn_ids = {id(atn): name for name, atn in _ATNS.items()}
+
+    def persistent_id(self, obj):
+        if isinstance(obj, ATNState):
+            return ("state", self._atn_ids[id(obj.atn)], obj.stateNumber)
+        name = self._singleton_ids.get(id(obj))
+        if name is not None:
+            return ("singleton", name)
+        return None
+
+
+class _DFAUnpickler(pickle.Unpickler):
+    """Unpickler resolving the references written by _DFAPickler."""
+
+    def persistent_load(self, pid):
+        if pid[0] == "state":
+            return _ATNS[pid[1]].states[pid[2]]
+        return _SINGLETONS[pid[1]]
+
+
+def warm_dfa_cache(sources, mode: str = "sll-ll"):
+    """
+    Populate the shared lexer and parser DFAs by parsing sources.
+
+    Sources with syntax or lexical errors are skipped; they still leave
+    the DFA states explored up to the error.
+
+    Args:
+        sources: An iterable of OPLang source strings
+        mode (str): Parse mode, as accepted by parse_with_mode; use the
+            mode of the later parses so the matching DFA states are built
+
+    Returns:
+        The number of sources that parsed without error
+    """
+    parsed = 0
+    for source in sources:
+        parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        try:
+            parse_with_mode(parser, mode)
+        except Exception:
+            continue
+        parsed += 1
+    return parsed
+
+
+def dfa_state_count() -> int:
+    """Return the total number of DFA states held by the lexer and parser."""
+    return sum(len(dfa.states) for dfa in OPLangLexer.decisionsToDFA + OPLangParser.decisionsToDFA)
+
+
+def clear_dfa_cache():
+    """Reset the lexer and parser DFAs to the empty state of a fresh process."""
+    for recognizer in (OPLangLexer, OPLangParser):
+        recognizer.decisionsToDFA[:] = [
+            DFA(state, i) for i, state in enumerate(recognizer.atn.decisionToState)
+        ]
+
+
+def save_dfa_cache(path: str):
+    """
+    Write the current lexer and parser DFAs to path.
+
+    Args:
+        path (str): Destination file
+    """
+    payload = {
+        "format": CACHE_FORMAT,
+        "fingerprint": grammar_fingerprint(),
+        "lexer": OPLangLexer.decisionsToDFA,
+        "parser": OPLangParser.decisionsToDFA,
+    }
+    with open(path, "wb") as f:
+        _DFAPickler(f, pickle.HIGHEST_PROTOCOL).dump(payload)
+
+
+def load_dfa_cache(path: str) -> bool:
+    """
+    Replace the lexer and parser DFAs with the ones saved at path.
+
+    The DFA lists are updated in place, so recognizers that already exist
+    pick up the restored states too. A cache written for another grammar
+    or cache format is ignored.
+
+    Args:
+        path (str): File written by save_dfa_cache
+
+    Returns:
+        True if the cache was restored, False if it was stale
+    """
+    with open(path, "rb") as f:
+        payload = _DFAUnpickler(f).load()
+    if payload["format"] != CACHE_FORMAT or payload["fingerprint"] != grammar_fingerprint():
+        return False
+    OPLangLexer.decisionsToDFA[:] = payload["lexer"]
+    OPLangParser.decisionsToDFA[:] = payload["parser"]
+    return True
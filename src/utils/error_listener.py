@@ -1,9 +1,13 @@
-from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.error.ErrorListener import ConsoleErrorListener, ErrorListener
+from antlr4.error.Errors import ParseCancellationException
 
 
 class SyntaxException(Exception):
-    def __init__(self, msg):
+    def __init__(self, msg, line=None, column=None, token=None):
         self.message = msg
+        self.line = line
+        self.column = column
+        self.token = token
         super().__init__(msg)
 
 
@@ -16,3 +20,24 @@ class NewErrorListener(ConsoleErrorListener):
 
 
 NewErrorListener.INSTANCE = NewErrorListener()
+
+
+class CollectingErrorListener(ErrorListener):
+    """
+    Error listener that records syntax errors instead of raising.
+
+    Each error is stored as a SyntaxException carrying the same message
+    NewErrorListener would raise, plus line, column and offending token
+    text. Once max_errors have been recorded the parse is cancelled with
+    ParseCancellationException.
+    """
+
+    def __init__(self, max_errors=100):
+        self.max_errors = max_errors
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        text = getattr(offendingSymbol, "text", str(offendingSymbol))
+        self.errors.append(SyntaxException(f"Error on line {line} col {column}: {text}", line, column, text))
+        if len(self.errors) >= self.max_errors:
+            raise ParseCancellationException(f"Stopped after {self.max_errors} syntax errors")
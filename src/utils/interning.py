@@ -0,0 +1,44 @@
+"""
+Interning table for OPLang ASTs.
+This module shares identifier and operator strings, and the immutable
+type nodes built from them, across every AST of one compilation, so
+equal names are the same object and compare by identity first.
+"""
+
+import sys
+
+from .nodes import ClassType, PrimitiveType
+
+
+class InternTable:
+    """
+    Names and type nodes shared across one compilation.
+
+    Names go through sys.intern, so they are also shared with the
+    string constants of the checker. PrimitiveType and ClassType nodes
+    are kept one per type name; they are shared by every declaration
+    that mentions the type, so they never carry a source position and
+    must not be modified.
+    """
+
+    def __init__(self):
+        self.primitive_types = {}
+        self.class_types = {}
+
+    def name(self, text: str) -> str:
+        """Return the shared copy of an identifier, keyword or operator."""
+        return sys.intern(text)
+
+    def primitive_type(self, type_name: str) -> PrimitiveType:
+        """Return the shared PrimitiveType for type_name."""
+        node = self.primitive_types.get(type_name)
+        if node is None:
+            node = self.primitive_types[type_name] = PrimitiveType(self.name(type_name))
+        return node
+
+    def class_type(self, class_name: str) -> ClassType:
+        """Return the shared ClassType for class_name."""
+        node = self.class_types.get(class_name)
+        if node is None:
+            node = self.class_types[class_name] = ClassType(self.name(class_name))
+        return node
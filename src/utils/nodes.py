@@ -5,18 +5,149 @@ the abstract syntax tree for OPLang programs.
 """
 
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import Any, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .visitor import ASTVisitor
 
 
+# Attributes that are not part of a node's structure
+_POSITION_ATTRIBUTES = frozenset(("line", "column", "_hash_cache"))
+
+# Node class and structural field reader of each class, see _layout()
+_LAYOUTS = {}
+
+# Sets an attribute without ASTNode's frozen-node check
+_set_field = object.__setattr__
+
+
+def invalidate_hashes(root: "ASTNode"):
+    """
+    Discard the structural hashes cached on root and its subtree, so its
+    nodes can be modified again.
+
+    Call it on the root of the tree before assigning a field of a hashed
+    node, and after changing a list of child nodes in place.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node._hash_cache is None:
+            # Hashing caches a node's children before the node itself
+            continue
+        _set_field(node, "_hash_cache", None)
+        _, read, several = _LAYOUTS.get(type(node)) or _layout(type(node))
+        for field in (read(node) if several else (read(node),)):
+            if isinstance(field, ASTNode):
+                stack.append(field)
+            elif type(field) is list:
+                stack.extend(item for item in field if isinstance(item, ASTNode))
+
+
+def _layout(cls):
+    """
+    Return the node class cls stands for, a reader of its structural
+    fields and whether the reader returns a tuple of several fields.
+    """
+    try:
+        return _LAYOUTS[cls]
+    except KeyError:
+        # Only the classes of this module count, so that arena views
+        # compare as the node class they subclass
+        classes = [c for c in reversed(cls.__mro__) if c.__module__ == __name__ and issubclass(c, ASTNode)]
+        fields = [f for c in classes[1:] for f in c.__dict__.get("__slots__", ())]
+        # Reads all fields in one call, so comparing two nodes' fields is
+        # a single tuple comparison
+        read = attrgetter(*fields) if fields else _no_fields
+        layout = _LAYOUTS[cls] = (classes[-1], read, len(fields) != 1)
+        return layout
+
+
+def _no_fields(node):
+    return ()
+
+
 class ASTNode(ABC):
-    """Base class for all AST nodes."""
+    """
+    Base class for all AST nodes.
+
+    Nodes compare equal when they are of the same class and their fields
+    are equal, child nodes compared the same way; positions are ignored,
+    as in the string form. The hash follows the same rule and is cached
+    on every node of the subtree it covers, so hashing a tree again, or
+    any of its subtrees, is O(1). A hashed node is frozen: assigning one
+    of its fields raises AttributeError until invalidate_hashes() is
+    called on a tree holding it. Cached hashes are not copied or pickled.
+    """
+
+    # Every subclass lists its own fields in __slots__, abstract ones an
+    # empty tuple, so that nodes carry no per-instance __dict__
+    __slots__ = ("line", "column", "_hash_cache")
+    # Name of the ASTVisitor method that visits the node class, set on
+    # every concrete class next to the accept() calling it
+    visit_method = None
 
     def __init__(self):
-        self.line = None
-        self.column = None
+        _set_field(self, "line", None)
+        _set_field(self, "column", None)
+        # Structural hash, once the node is hashed
+        _set_field(self, "_hash_cache", None)
+
+    def __setattr__(self, name, value):
+        if name not in _POSITION_ATTRIBUTES:
+            try:
+                hashed = self._hash_cache is not None
+            except AttributeError:  # Not initialized yet
+                hashed = False
+            if hashed:
+                raise AttributeError(
+                    f"cannot assign {name} of a hashed {type(self).__name__}; "
+                    "call invalidate_hashes() on its tree first"
+                )
+        _set_field(self, name, value)
+
+    def __getstate__(self):
+        # Hashes of strings differ between processes, so leave them out
+        return None, {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if name != "_hash_cache" and hasattr(self, name)
+        }
+
+    def __setstate__(self, state):
+        _set_field(self, "_hash_cache", None)
+        for name, value in state[1].items():
+            _set_field(self, name, value)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        node_class = type(self)
+        if type(other) is not node_class:
+            if not isinstance(other, ASTNode):
+                return NotImplemented
+            if _layout(type(other))[0] is not _layout(node_class)[0]:
+                return False
+        read = (_LAYOUTS.get(node_class) or _layout(node_class))[1]
+        mine, theirs = self._hash_cache, other._hash_cache
+        # Different hashes prove inequality
+        if mine is not None and theirs is not None and mine != theirs:
+            return False
+        return read(self) == read(other)
+
+    def __hash__(self):
+        cache = self._hash_cache
+        if cache is not None:
+            return cache
+        node_class, read, several = _LAYOUTS.get(type(self)) or _layout(type(self))
+        fields = read(self) if several else (read(self),)
+        if list in map(type, fields):
+            fields = [tuple(field) if type(field) is list else field for field in fields]
+        value = hash((node_class.__name__, *fields))
+        _set_field(self, "_hash_cache", value)
+        return value
 
     @abstractmethod
     def accept(self, visitor: "ASTVisitor", o: Any = None):
@@ -24,8 +155,10 @@ class ASTNode(ABC):
         pass
 
     def __str__(self):
-        """Default string representation."""
-        return f"{self.__class__.__name__}()"
+        """Render the subtree in one pass, see ast_printer.write_ast."""
+        from .ast_printer import format_ast
+
+        return format_ast(self)
 
 
 # ============================================================================
@@ -36,6 +169,9 @@ class ASTNode(ABC):
 class Program(ASTNode):
     """Root node representing the entire OPLang program."""
 
+    __slots__ = ("class_decls",)
+    visit_method = "visit_program"
+
     def __init__(self, class_decls: List["ClassDecl"]):
         super().__init__()
         self.class_decls = class_decls
@@ -43,17 +179,13 @@ class Program(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_program(self, o)
 
-    def __str__(self):
-        classes_str = (
-            ", ".join(str(c) for c in self.class_decls) if self.class_decls else ""
-        )
-        classes_part = f"[{classes_str}]" if classes_str else "[]"
-        return f"Program({classes_part})"
-
 
 class ClassDecl(ASTNode):
     """Class declaration node."""
 
+    __slots__ = ("name", "superclass", "members")
+    visit_method = "visit_class_decl"
+
     def __init__(
         self, name: str, superclass: Optional[str], members: List["ClassMember"]
     ):
@@ -65,17 +197,11 @@ class ClassDecl(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_class_decl(self, o)
 
-    def __str__(self):
-        super_str = f", extends {self.superclass}" if self.superclass else ""
-        members_str = ", ".join(str(m) for m in self.members) if self.members else ""
-        members_part = f"[{members_str}]" if members_str else "[]"
-        return f"ClassDecl({self.name}{super_str}, {members_part})"
-
 
 class ClassMember(ASTNode):
     """Base class for class members (attributes, methods, constructors, destructors)."""
 
-    pass
+    __slots__ = ()
 
 
 # ============================================================================
@@ -86,6 +212,9 @@ class ClassMember(ASTNode):
 class AttributeDecl(ClassMember):
     """Attribute declaration node."""
 
+    __slots__ = ("is_static", "is_final", "attr_type", "attributes")
+    visit_method = "visit_attribute_decl"
+
     def __init__(
         self,
         is_static: bool,
@@ -102,16 +231,13 @@ class AttributeDecl(ClassMember):
     def accept(self, visitor, o=None):
         return visitor.visit_attribute_decl(self, o)
 
-    def __str__(self):
-        static_str = "static " if self.is_static else ""
-        final_str = "final " if self.is_final else ""
-        attrs_str = ", ".join(str(a) for a in self.attributes)
-        return f"AttributeDecl({static_str}{final_str}{self.attr_type}, [{attrs_str}])"
-
 
 class Attribute(ASTNode):
     """Individual attribute node."""
 
+    __slots__ = ("name", "init_value")
+    visit_method = "visit_attribute"
+
     def __init__(self, name: str, init_value: Optional["Expr"] = None):
         super().__init__()
         self.name = name
@@ -120,10 +246,6 @@ class Attribute(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_attribute(self, o)
 
-    def __str__(self):
-        init_str = f" = {self.init_value}" if self.init_value else ""
-        return f"Attribute({self.name}{init_str})"
-
 
 # ============================================================================
 # Method Declarations
@@ -133,6 +255,9 @@ class Attribute(ASTNode):
 class MethodDecl(ClassMember):
     """Method declaration node."""
 
+    __slots__ = ("is_static", "return_type", "name", "params", "body")
+    visit_method = "visit_method_decl"
+
     def __init__(
         self,
         is_static: bool,
@@ -151,16 +276,13 @@ class MethodDecl(ClassMember):
     def accept(self, visitor, o=None):
         return visitor.visit_method_decl(self, o)
 
-    def __str__(self):
-        static_str = "static " if self.is_static else ""
-        params_str = ", ".join(str(p) for p in self.params) if self.params else ""
-        params_part = f"[{params_str}]" if params_str else "[]"
-        return f"MethodDecl({static_str}{self.return_type} {self.name}({params_part}), {self.body})"
-
 
 class ConstructorDecl(ClassMember):
     """Constructor declaration node."""
 
+    __slots__ = ("name", "params", "body")
+    visit_method = "visit_constructor_decl"
+
     def __init__(self, name: str, params: List["Parameter"], body: "BlockStatement"):
         super().__init__()
         self.name = name
@@ -170,15 +292,13 @@ class ConstructorDecl(ClassMember):
     def accept(self, visitor, o=None):
         return visitor.visit_constructor_decl(self, o)
 
-    def __str__(self):
-        params_str = ", ".join(str(p) for p in self.params) if self.params else ""
-        params_part = f"[{params_str}]" if params_str else "[]"
-        return f"ConstructorDecl({self.name}({params_part}), {self.body})"
-
 
 class DestructorDecl(ClassMember):
     """Destructor declaration node."""
 
+    __slots__ = ("name", "body")
+    visit_method = "visit_destructor_decl"
+
     def __init__(self, name: str, body: "BlockStatement"):
         super().__init__()
         self.name = name
@@ -187,13 +307,13 @@ class DestructorDecl(ClassMember):
     def accept(self, visitor, o=None):
         return visitor.visit_destructor_decl(self, o)
 
-    def __str__(self):
-        return f"DestructorDecl(~{self.name}(), {self.body})"
-
 
 class Parameter(ASTNode):
     """Method/Constructor parameter node."""
 
+    __slots__ = ("param_type", "name")
+    visit_method = "visit_parameter"
+
     def __init__(self, param_type: "Type", name: str):
         super().__init__()
         self.param_type = param_type
@@ -202,9 +322,6 @@ class Parameter(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_parameter(self, o)
 
-    def __str__(self):
-        return f"Parameter({self.param_type} {self.name})"
-
 
 # ============================================================================
 # Type System
@@ -214,12 +331,15 @@ class Parameter(ASTNode):
 class Type(ASTNode):
     """Base class for type annotations."""
 
-    pass
+    __slots__ = ()
 
 
 class PrimitiveType(Type):
     """Primitive type node."""
 
+    __slots__ = ("type_name",)
+    visit_method = "visit_primitive_type"
+
     def __init__(self, type_name: str):
         super().__init__()
         self.type_name = type_name  # "int", "float", "boolean", "string", "void"
@@ -227,13 +347,13 @@ class PrimitiveType(Type):
     def accept(self, visitor, o=None):
         return visitor.visit_primitive_type(self, o)
 
-    def __str__(self):
-        return f"PrimitiveType({self.type_name})"
-
 
 class ArrayType(Type):
     """Array type node."""
 
+    __slots__ = ("element_type", "size")
+    visit_method = "visit_array_type"
+
     def __init__(self, element_type: Type, size: int):
         super().__init__()
         self.element_type = element_type
@@ -242,13 +362,13 @@ class ArrayType(Type):
     def accept(self, visitor, o=None):
         return visitor.visit_array_type(self, o)
 
-    def __str__(self):
-        return f"ArrayType({self.element_type}[{self.size}])"
-
 
 class ClassType(Type):
     """Class type node."""
 
+    __slots__ = ("class_name",)
+    visit_method = "visit_class_type"
+
     def __init__(self, class_name: str):
         super().__init__()
         self.class_name = class_name
@@ -256,13 +376,13 @@ class ClassType(Type):
     def accept(self, visitor, o=None):
         return visitor.visit_class_type(self, o)
 
-    def __str__(self):
-        return f"ClassType({self.class_name})"
-
 
 class ReferenceType(Type):
     """Reference type node."""
 
+    __slots__ = ("referenced_type",)
+    visit_method = "visit_reference_type"
+
     def __init__(self, referenced_type: Type):
         super().__init__()
         self.referenced_type = referenced_type
@@ -270,9 +390,6 @@ class ReferenceType(Type):
     def accept(self, visitor, o=None):
         return visitor.visit_reference_type(self, o)
 
-    def __str__(self):
-        return f"ReferenceType({self.referenced_type} &)"
-
 
 # ============================================================================
 # Statements
@@ -282,12 +399,15 @@ class ReferenceType(Type):
 class Statement(ASTNode):
     """Base class for all statement nodes."""
 
-    pass
+    __slots__ = ()
 
 
 class BlockStatement(Statement):
     """Block statement containing variable declarations and statements."""
 
+    __slots__ = ("var_decls", "statements")
+    visit_method = "visit_block_statement"
+
     def __init__(self, var_decls: List["VariableDecl"], statements: List[Statement]):
         super().__init__()
         self.var_decls = var_decls
@@ -296,19 +416,13 @@ class BlockStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_block_statement(self, o)
 
-    def __str__(self):
-        vars_str = ", ".join(str(v) for v in self.var_decls) if self.var_decls else ""
-        vars_part = f"vars=[{vars_str}], " if vars_str else ""
-        stmts_str = (
-            ", ".join(str(s) for s in self.statements) if self.statements else ""
-        )
-        stmts_part = f"stmts=[{stmts_str}]" if stmts_str else "stmts=[]"
-        return f"BlockStatement({vars_part}{stmts_part})"
-
 
 class VariableDecl(ASTNode):
     """Variable declaration node."""
 
+    __slots__ = ("is_final", "var_type", "variables")
+    visit_method = "visit_variable_decl"
+
     def __init__(self, is_final: bool, var_type: Type, variables: List["Variable"]):
         super().__init__()
         self.is_final = is_final
@@ -318,15 +432,13 @@ class VariableDecl(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_variable_decl(self, o)
 
-    def __str__(self):
-        final_str = "final " if self.is_final else ""
-        vars_str = ", ".join(str(v) for v in self.variables)
-        return f"VariableDecl({final_str}{self.var_type}, [{vars_str}])"
-
 
 class Variable(ASTNode):
     """Individual variable node."""
 
+    __slots__ = ("name", "init_value")
+    visit_method = "visit_variable"
+
     def __init__(self, name: str, init_value: Optional["Expr"] = None):
         super().__init__()
         self.name = name
@@ -335,14 +447,13 @@ class Variable(ASTNode):
     def accept(self, visitor, o=None):
         return visitor.visit_variable(self, o)
 
-    def __str__(self):
-        init_str = f" = {self.init_value}" if self.init_value else ""
-        return f"Variable({self.name}{init_str})"
-
 
 class AssignmentStatement(Statement):
     """Assignment statement."""
 
+    __slots__ = ("lhs", "rhs")
+    visit_method = "visit_assignment_statement"
+
     def __init__(self, lhs: "LHS", rhs: "Expr"):
         super().__init__()
         self.lhs = lhs
@@ -351,13 +462,13 @@ class AssignmentStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_assignment_statement(self, o)
 
-    def __str__(self):
-        return f"AssignmentStatement({self.lhs} := {self.rhs})"
-
 
 class IfStatement(Statement):
     """If statement."""
 
+    __slots__ = ("condition", "then_stmt", "else_stmt")
+    visit_method = "visit_if_statement"
+
     def __init__(
         self,
         condition: "Expr",
@@ -372,14 +483,13 @@ class IfStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_if_statement(self, o)
 
-    def __str__(self):
-        else_str = f", else {self.else_stmt}" if self.else_stmt else ""
-        return f"IfStatement(if {self.condition} then {self.then_stmt}{else_str})"
-
 
 class ForStatement(Statement):
     """For statement."""
 
+    __slots__ = ("variable", "start_expr", "direction", "end_expr", "body")
+    visit_method = "visit_for_statement"
+
     def __init__(
         self,
         variable: str,
@@ -398,39 +508,39 @@ class ForStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_for_statement(self, o)
 
-    def __str__(self):
-        return f"ForStatement(for {self.variable} := {self.start_expr} {self.direction} {self.end_expr} do {self.body})"
-
 
 class BreakStatement(Statement):
     """Break statement."""
 
+    __slots__ = ()
+    visit_method = "visit_break_statement"
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_break_statement(self, o)
 
-    def __str__(self):
-        return "BreakStatement()"
-
 
 class ContinueStatement(Statement):
     """Continue statement."""
 
+    __slots__ = ()
+    visit_method = "visit_continue_statement"
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_continue_statement(self, o)
 
-    def __str__(self):
-        return "ContinueStatement()"
-
 
 class ReturnStatement(Statement):
     """Return statement."""
 
+    __slots__ = ("value",)
+    visit_method = "visit_return_statement"
+
     def __init__(self, value: "Expr"):
         super().__init__()
         self.value = value
@@ -438,13 +548,13 @@ class ReturnStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_return_statement(self, o)
 
-    def __str__(self):
-        return f"ReturnStatement(return {self.value})"
-
 
 class MethodInvocationStatement(Statement):
     """Method invocation statement."""
 
+    __slots__ = ("method_call",)
+    visit_method = "visit_method_invocation_statement"
+
     def __init__(self, method_call: "PostfixExpression"):
         super().__init__()
         self.method_call = method_call
@@ -452,9 +562,6 @@ class MethodInvocationStatement(Statement):
     def accept(self, visitor, o=None):
         return visitor.visit_method_invocation_statement(self, o)
 
-    def __str__(self):
-        return f"MethodInvocationStatement({self.method_call})"
-
 
 # ============================================================================
 # Left-hand Side (LHS) for Assignment
@@ -464,12 +571,15 @@ class MethodInvocationStatement(Statement):
 class LHS(ASTNode):
     """Base class for left-hand side expressions in assignment."""
 
-    pass
+    __slots__ = ()
 
 
 class IdLHS(LHS):
     """Identifier left-hand side."""
 
+    __slots__ = ("name",)
+    visit_method = "visit_id_lhs"
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
@@ -477,13 +587,13 @@ class IdLHS(LHS):
     def accept(self, visitor, o=None):
         return visitor.visit_id_lhs(self, o)
 
-    def __str__(self):
-        return f"IdLHS({self.name})"
-
 
 class PostfixLHS(LHS):
     """Postfix expression left-hand side (for member access, array access)."""
 
+    __slots__ = ("postfix_expr",)
+    visit_method = "visit_postfix_lhs"
+
     def __init__(self, postfix_expr: "PostfixExpression"):
         super().__init__()
         self.postfix_expr = postfix_expr
@@ -491,9 +601,6 @@ class PostfixLHS(LHS):
     def accept(self, visitor, o=None):
         return visitor.visit_postfix_lhs(self, o)
 
-    def __str__(self):
-        return f"PostfixLHS({self.postfix_expr})"
-
 
 # ============================================================================
 # Expressions
@@ -503,12 +610,15 @@ class PostfixLHS(LHS):
 class Expr(ASTNode):
     """Base class for all expression nodes."""
 
-    pass
+    __slots__ = ()
 
 
 class BinaryOp(Expr):
     """Binary operation expression."""
 
+    __slots__ = ("left", "operator", "right")
+    visit_method = "visit_binary_op"
+
     def __init__(self, left: Expr, operator: str, right: Expr):
         super().__init__()
         self.left = left
@@ -518,13 +628,13 @@ class BinaryOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_binary_op(self, o)
 
-    def __str__(self):
-        return f"BinaryOp({self.left}, {self.operator}, {self.right})"
-
 
 class UnaryOp(Expr):
     """Unary operation expression."""
 
+    __slots__ = ("operator", "operand")
+    visit_method = "visit_unary_op"
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '+', '-', '!'
@@ -533,13 +643,13 @@ class UnaryOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_unary_op(self, o)
 
-    def __str__(self):
-        return f"UnaryOp({self.operator}, {self.operand})"
-
 
 class PostfixExpression(Expr):
     """Postfix expression for method calls, member access, array access."""
 
+    __slots__ = ("primary", "postfix_ops")
+    visit_method = "visit_postfix_expression"
+
     def __init__(self, primary: Expr, postfix_ops: List["PostfixOp"]):
         super().__init__()
         self.primary = primary
@@ -548,20 +658,19 @@ class PostfixExpression(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_postfix_expression(self, o)
 
-    def __str__(self):
-        ops_str = "".join(str(op) for op in self.postfix_ops)
-        return f"PostfixExpression({self.primary}{ops_str})"
-
 
 class PostfixOp(ASTNode):
     """Base class for postfix operations."""
 
-    pass
+    __slots__ = ()
 
 
 class MethodCall(PostfixOp):
     """Method invocation postfix operation."""
 
+    __slots__ = ("method_name", "args")
+    visit_method = "visit_method_call"
+
     def __init__(self, method_name: str, args: List[Expr]):
         super().__init__()
         self.method_name = method_name
@@ -570,14 +679,13 @@ class MethodCall(PostfixOp):
     def accept(self, visitor, o=None):
         return visitor.visit_method_call(self, o)
 
-    def __str__(self):
-        args_str = ", ".join(str(arg) for arg in self.args) if self.args else ""
-        return f".{self.method_name}({args_str})"
-
 
 class MemberAccess(PostfixOp):
     """Member access postfix operation."""
 
+    __slots__ = ("member_name",)
+    visit_method = "visit_member_access"
+
     def __init__(self, member_name: str):
         super().__init__()
         self.member_name = member_name
@@ -585,13 +693,13 @@ class MemberAccess(PostfixOp):
     def accept(self, visitor, o=None):
         return visitor.visit_member_access(self, o)
 
-    def __str__(self):
-        return f".{self.member_name}"
-
 
 class ArrayAccess(PostfixOp):
     """Array access postfix operation."""
 
+    __slots__ = ("index",)
+    visit_method = "visit_array_access"
+
     def __init__(self, index: Expr):
         super().__init__()
         self.index = index
@@ -599,13 +707,13 @@ class ArrayAccess(PostfixOp):
     def accept(self, visitor, o=None):
         return visitor.visit_array_access(self, o)
 
-    def __str__(self):
-        return f"[{self.index}]"
-
 
 class ObjectCreation(Expr):
     """Object creation expression."""
 
+    __slots__ = ("class_name", "args")
+    visit_method = "visit_object_creation"
+
     def __init__(self, class_name: str, args: List[Expr]):
         super().__init__()
         self.class_name = class_name
@@ -614,14 +722,13 @@ class ObjectCreation(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_object_creation(self, o)
 
-    def __str__(self):
-        args_str = ", ".join(str(arg) for arg in self.args) if self.args else ""
-        return f"ObjectCreation(new {self.class_name}({args_str}))"
-
 
 class Identifier(Expr):
     """Identifier expression."""
 
+    __slots__ = ("name",)
+    visit_method = "visit_identifier"
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
@@ -629,26 +736,26 @@ class Identifier(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_identifier(self, o)
 
-    def __str__(self):
-        return f"Identifier({self.name})"
-
 
 class ThisExpression(Expr):
     """This expression."""
 
+    __slots__ = ()
+    visit_method = "visit_this_expression"
+
     def __init__(self):
         super().__init__()
 
     def accept(self, visitor, o=None):
         return visitor.visit_this_expression(self, o)
 
-    def __str__(self):
-        return "ThisExpression(this)"
-
 
 class ParenthesizedExpression(Expr):
     """Parenthesized expression."""
 
+    __slots__ = ("expr",)
+    visit_method = "visit_parenthesized_expression"
+
     def __init__(self, expr: Expr):
         super().__init__()
         self.expr = expr
@@ -656,9 +763,6 @@ class ParenthesizedExpression(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_parenthesized_expression(self, o)
 
-    def __str__(self):
-        return f"ParenthesizedExpression(({self.expr}))"
-
 
 # ============================================================================
 # Literal Expressions
@@ -668,6 +772,8 @@ class ParenthesizedExpression(Expr):
 class Literal(Expr):
     """Base class for literal expressions."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
@@ -676,77 +782,76 @@ class Literal(Expr):
 class IntLiteral(Literal):
     """Integer literal expression."""
 
+    __slots__ = ()
+    visit_method = "visit_int_literal"
+
     def __init__(self, value: int):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_int_literal(self, o)
 
-    def __str__(self):
-        return f"IntLiteral({self.value})"
-
 
 class FloatLiteral(Literal):
     """Float literal expression."""
 
+    __slots__ = ()
+    visit_method = "visit_float_literal"
+
     def __init__(self, value: float):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_float_literal(self, o)
 
-    def __str__(self):
-        return f"FloatLiteral({self.value})"
-
 
 class BoolLiteral(Literal):
     """Boolean literal expression."""
 
+    __slots__ = ()
+    visit_method = "visit_bool_literal"
+
     def __init__(self, value: bool):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_bool_literal(self, o)
 
-    def __str__(self):
-        return f"BoolLiteral({self.value})"
-
 
 class StringLiteral(Literal):
     """String literal expression."""
 
+    __slots__ = ()
+    visit_method = "visit_string_literal"
+
     def __init__(self, value: str):
         super().__init__(value)
 
     def accept(self, visitor, o=None):
         return visitor.visit_string_literal(self, o)
 
-    def __str__(self):
-        return f"StringLiteral({self.value!r})"
-
 
 class ArrayLiteral(Literal):
     """Array literal expression."""
 
+    __slots__ = ()
+    visit_method = "visit_array_literal"
+
     def __init__(self, elements: List[Expr]):
         super().__init__(elements)
 
     def accept(self, visitor, o=None):
         return visitor.visit_array_literal(self, o)
 
-    def __str__(self):
-        elements_str = ", ".join(str(elem) for elem in self.value) if self.value else ""
-        return f"ArrayLiteral({{{elements_str}}})"
-
 
 class NilLiteral(Literal):
     """Nil literal expression."""
 
+    __slots__ = ()
+    visit_method = "visit_nil_literal"
+
     def __init__(self):
         super().__init__(None)
 
     def accept(self, visitor, o=None):
         return visitor.visit_nil_literal(self, o)
-
-    def __str__(self):
-        return "NilLiteral(nil)"
@@ -0,0 +1,180 @@
+"""
+Parsing strategies for the generated OPLang parser.
+This module provides the two-stage SLL-then-LL parse used by the
+pipeline wrappers to avoid full-context prediction on well-formed input,
+and a recovering parse that reports every syntax error in one pass.
+"""
+
+from antlr4 import Token
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+from build.OPLangParser import OPLangParser
+from .error_listener import CollectingErrorListener, NewErrorListener
+
+
+PARSE_MODES = ("ll", "sll-ll")
+
+DEFAULT_MAX_ERRORS = 100
+
+
+def parse_two_stage(parser, entry: str = "program"):
+    """
+    Parse with SLL prediction first and fall back to full LL on failure.
+
+    The first stage runs the parser with SLL prediction and a
+    BailErrorStrategy, which is enough for every syntactically valid
+    program that the grammar predicts without full context. If it bails,
+    the token stream is rewound and the input is parsed again in LL mode
+    with NewErrorListener, so syntax errors are reported exactly as in the
+    single-stage parse.
+
+    Args:
+        parser: An OPLangParser instance over a fresh token stream
+        entry (str): Name of the start rule to invoke
+
+    Returns:
+        The parse tree produced by the start rule
+    """
+    start_rule = getattr(parser, entry)
+
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        return start_rule()
+    except ParseCancellationException:
+        pass
+
+    # Parser.reset() tries to remove a tracer that was never added, which
+    # fails once any parse listener is installed; keep them aside meanwhile
+    parse_listeners, parser._parseListeners = parser._parseListeners, None
+    parser.reset()
+    parser._parseListeners = parse_listeners
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    parser._errHandler = DefaultErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.LL
+    return start_rule()
+
+
+def parse_with_mode(parser, mode: str = "ll", entry: str = "program"):
+    """
+    Invoke the start rule of parser using the given parse mode.
+
+    Args:
+        parser: An OPLangParser instance with its error listeners installed
+        mode (str): "ll" for a single full-LL parse, "sll-ll" for the
+            two-stage parse
+        entry (str): Name of the start rule to invoke
+
+    Returns:
+        The parse tree produced by the start rule
+    """
+    if mode == "ll":
+        return getattr(parser, entry)()
+    if mode == "sll-ll":
+        return parse_two_stage(parser, entry)
+    raise ValueError(f"Unknown parse mode: {mode}")
+
+
+class BoundaryErrorStrategy(DefaultErrorStrategy):
+    """
+    Error strategy that resynchronizes at class and member boundaries.
+
+    Inside a class member, a syntax error skips the rest of that member,
+    tracking braces so a method body is skipped whole, and the parse
+    resumes with the next member. Inside a class header it skips to the
+    next class. Errors outside any class use ANTLR's default recovery.
+    Single-token insertion and deletion still repair simple mistakes
+    in place, before any resynchronization, except that the ';' or '}'
+    ending a statement is never deleted: the statement would run on into
+    the next one and report it as a second error.
+    """
+
+    # Tokens ending a statement or block, kept by single-token deletion
+    BOUNDARY_TOKENS = (OPLangParser.SEMI, OPLangParser.RB)
+
+    def __init__(self):
+        super().__init__()
+        self.synced = None  # Error whose tokens have already been skipped
+
+    def reset(self, recognizer):
+        super().reset(recognizer)
+        self.synced = None
+
+    def singleTokenDeletion(self, recognizer):
+        if recognizer.getTokenStream().LA(1) in self.BOUNDARY_TOKENS:
+            return None
+        return super().singleTokenDeletion(recognizer)
+
+    def recover(self, recognizer, e):
+        boundary = recognizer._ctx
+        while boundary is not None and not isinstance(
+            boundary, (OPLangParser.Mem_declContext, OPLangParser.Cls_declContext)
+        ):
+            boundary = boundary.parentCtx
+        if boundary is None:
+            return super().recover(recognizer, e)
+
+        if self.synced is not e:
+            self.synced = e
+            if isinstance(boundary, OPLangParser.Cls_declContext):
+                self.skip_class(recognizer)
+            else:
+                self.skip_member(recognizer, boundary)
+        # Unwind the rules nested inside the boundary; each one catches the
+        # error again and lands back here until the boundary rule returns
+        if recognizer._ctx is not boundary:
+            raise e
+
+    def skip_class(self, recognizer):
+        stream = recognizer.getTokenStream()
+        while stream.LA(1) not in (Token.EOF, OPLangParser.CLASS):
+            recognizer.consume()
+
+    def skip_member(self, recognizer, member):
+        stream = recognizer.getTokenStream()
+        depth = 0
+        for i in range(member.start.tokenIndex, stream.index):
+            token_type = stream.get(i).type
+            depth += (token_type == OPLangParser.LB) - (token_type == OPLangParser.RB)
+        while True:
+            token_type = stream.LA(1)
+            if token_type in (Token.EOF, OPLangParser.CLASS):
+                return
+            if token_type == OPLangParser.RB and depth <= 0:
+                return  # Closing brace of the class
+            recognizer.consume()
+            depth += (token_type == OPLangParser.LB) - (token_type == OPLangParser.RB)
+            if depth <= 0 and token_type in (OPLangParser.SEMI, OPLangParser.RB):
+                return
+
+
+def parse_recovering(parser, max_errors: int = DEFAULT_MAX_ERRORS, entry: str = "program"):
+    """
+    Parse with error recovery, collecting every syntax error.
+
+    Errors are recorded by a CollectingErrorListener instead of raising,
+    and BoundaryErrorStrategy resumes the parse at the next class member
+    or class. Parsing stops early once max_errors have been recorded.
+
+    Args:
+        parser: An OPLangParser instance over a fresh token stream
+        max_errors (int): Maximum number of errors to collect
+        entry (str): Name of the start rule to invoke
+
+    Returns:
+        A (tree, errors) pair: the parse tree, or None if the parse was
+        stopped at max_errors, and the list of SyntaxException records
+        in input order
+    """
+    listener = CollectingErrorListener(max_errors)
+    parser.removeErrorListeners()
+    parser.addErrorListener(listener)
+    parser._errHandler = BoundaryErrorStrategy()
+    try:
+        tree = getattr(parser, entry)()
+    except ParseCancellationException:
+        tree = None
+    return tree, listener.errors
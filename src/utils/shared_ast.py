@@ -0,0 +1,157 @@
+"""
+Shared-memory AST handoff for OPLang programming language.
+This module lays an AST out once, in ASTArena form, in a
+multiprocessing.shared_memory block, so worker processes can attach
+read-only node views to it instead of unpickling their own copy.
+"""
+
+import sys
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from typing import NamedTuple, Tuple
+
+from .ast_arena import ASTArena, NodeView
+from .nodes import ASTNode
+
+
+# Array columns of ASTArena, in the order they are laid out
+_COLUMNS = ("kinds", "offsets", "lines", "columns", "data", "lists", "floats")
+
+# Every column starts on a multiple of this, the largest item size
+_ALIGNMENT = 8
+
+
+class SharedASTHandle(NamedTuple):
+    """
+    Everything a worker needs to attach to a shared AST; small and cheap
+    to pickle.
+
+    columns holds (start, typecode, length) for each of the arena's
+    array columns and for the string offsets, which delimit the UTF-8
+    encoded strings of the string table at strings_start.
+    """
+
+    name: str
+    root: int
+    columns: Tuple[Tuple[int, str, int], ...]
+    strings_start: int
+
+
+def _aligned(size: int) -> int:
+    return -size // _ALIGNMENT * -_ALIGNMENT
+
+
+class SharedAST:
+    """
+    Owner of a shared memory block holding one AST.
+
+    The block lives until unlink() is called, or the with block using
+    the SharedAST ends; pass handle to the workers that read it.
+    """
+
+    def __init__(self, node: ASTNode):
+        arena = ASTArena()
+        root = arena.add(node)
+        encoded = [value.encode("utf-8") for value in arena.strings]
+        string_offsets = array("q", [0])
+        for value in encoded:
+            string_offsets.append(string_offsets[-1] + len(value))
+
+        arrays = [getattr(arena, name) for name in _COLUMNS] + [string_offsets]
+        columns, size = [], 0
+        for column in arrays:
+            columns.append((size, column.typecode, len(column)))
+            size = _aligned(size + len(column) * column.itemsize)
+        blob = b"".join(encoded)
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, size + len(blob)))
+        for (start, _, _), column in zip(columns, arrays):
+            data = column.tobytes()
+            self.shm.buf[start:start + len(data)] = data
+        self.shm.buf[size:size + len(blob)] = blob
+        self.handle = SharedASTHandle(self.shm.name, root, tuple(columns), size)
+
+    def close(self):
+        """Release this process's mapping of the block."""
+        self.shm.close()
+
+    def unlink(self):
+        """Free the block once every process has closed it."""
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        self.unlink()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Attaching registers the block with the resource tracker, which then
+    # unlinks it when the attaching process exits; only the SharedAST
+    # that created it may do that
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class SharedArena(ASTArena):
+    """
+    Read-only ASTArena over a block created by SharedAST.
+
+    The array columns are memoryviews of the shared block, so attaching
+    copies nothing but the string table, which is decoded once. Nodes
+    cannot be added. Call close() once the views are no longer needed;
+    they cannot be read afterwards.
+    """
+
+    def __init__(self, handle: SharedASTHandle):
+        self.handle = handle
+        self.shm = _attach(handle.name)
+        buffer = self.shm.buf.toreadonly()
+        views = []
+        for start, typecode, length in handle.columns:
+            item_size = array(typecode).itemsize
+            views.append(buffer[start:start + length * item_size].cast(typecode))
+        self._buffers = [buffer] + views
+        for name, view in zip(_COLUMNS, views):
+            setattr(self, name, view)
+        string_offsets = views[-1]
+        blob = bytes(buffer[handle.strings_start:handle.strings_start + string_offsets[-1]])
+        self.strings = [
+            sys.intern(str(blob[string_offsets[i]:string_offsets[i + 1]], "utf-8"))
+            for i in range(len(string_offsets) - 1)
+        ]
+
+    def add(self, node: ASTNode) -> int:
+        raise TypeError("SharedArena is read-only")
+
+    def __reduce__(self):
+        raise TypeError("SharedArena cannot be pickled; pass its handle to other processes")
+
+    def root(self) -> NodeView:
+        """Return a view of the shared AST's root node."""
+        return self.view(self.handle.root)
+
+    def nbytes(self) -> int:
+        """Return the size of the array columns in the shared block, in bytes."""
+        return sum(getattr(self, name).nbytes for name in _COLUMNS)
+
+    def close(self):
+        """Release the memoryviews and this process's mapping of the block."""
+        for view in reversed(self._buffers):
+            view.release()
+        self._buffers = []
+        self.shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,156 @@
+"""
+Iterative AST traversal for OPLang programming language.
+This module walks ASTs with an explicit work stack instead of recursion
+through accept(), so trees of any depth can be analysed, and lets
+post-order hooks return values up the tree.
+"""
+
+from .ast_arena import KINDS, LAYOUTS, VIEW_CLASSES
+
+
+# Child fields of each node class, in evaluation order: (name, is_list)
+CHILD_FIELDS = {
+    node_class: tuple((name, kind == "nodes") for name, kind in layout if kind in ("node", "nodes"))
+    for node_class, layout in LAYOUTS.items()
+}
+
+
+# Hook suffix of each node class, the same as its visit method's
+KIND_NAMES = {node_class: node_class.visit_method[len("visit_"):] for node_class in LAYOUTS}
+
+# Arena views are walked as the node class they stand for
+CHILD_FIELDS.update((view, CHILD_FIELDS[node_class]) for node_class, view in zip(KINDS, VIEW_CLASSES))
+KIND_NAMES.update((view, KIND_NAMES[node_class]) for node_class, view in zip(KINDS, VIEW_CLASSES))
+
+# Returned by an enter hook to skip the node's subtree
+SKIP = object()
+
+
+class IterativeVisitor:
+    """
+    Base class for analyses driven by an explicit work stack.
+
+    For a node of kind k (the suffix of its visit_k method), traverse()
+    calls enter_k(node) before the node's children and leave_k(node,
+    results) after them, falling back to enter_node and leave_node.
+    results holds one entry per child field, in the order fields are
+    evaluated: a child's result, None for an absent child, or a list of
+    results for a list field. The value returned by leave_k is the
+    node's result. If enter_k returns SKIP, the subtree is not visited,
+    leave_k is not called and the node's result is None.
+
+    The hooks are resolved once per instance, so visiting a node costs
+    one dictionary lookup per hook instead of a double dispatch.
+    """
+
+    def __init__(self):
+        # None marks a hook left to the default, so it is not called
+        self.enter_hooks = {}
+        self.leave_hooks = {}
+        for node_class, kind in KIND_NAMES.items():
+            enter = getattr(self, "enter_" + kind, self.enter_node)
+            leave = getattr(self, "leave_" + kind, self.leave_node)
+            self.enter_hooks[node_class] = None if _is_default(enter, "enter_node") else enter
+            self.leave_hooks[node_class] = None if _is_default(leave, "leave_node") else leave
+
+    def enter_node(self, node):
+        return None
+
+    def leave_node(self, node, results):
+        return None
+
+    def traverse(self, root):
+        """
+        Visit root and its subtree in depth-first order.
+
+        Args:
+            root (ASTNode): Node to start from
+
+        Returns:
+            The result of root's leave hook
+        """
+        enter_hooks, leave_hooks = self.enter_hooks, self.leave_hooks
+        values = []
+        # Frames are (node, wanted, None) before the children and (node,
+        # wanted, shape) after them. wanted tells whether the parent reads
+        # the node's result; shape holds -1 per single child field and the
+        # length of each list field. Nodes without a leave hook get no
+        # second frame, their result is None.
+        stack = [(root, True, None)]
+        pop, push = stack.pop, stack.append
+        while stack:
+            node, wanted, shape = pop()
+            if shape is not None:
+                i = start = len(values) - sum(1 if n < 0 else n for n in shape)
+                results = []
+                for n in shape:
+                    if n < 0:
+                        results.append(values[i])
+                        i += 1
+                    else:
+                        results.append(values[i:i + n])
+                        i += n
+                del values[start:]
+                result = leave_hooks[type(node)](node, results)
+                if wanted:
+                    values.append(result)
+                continue
+
+            if node is None:
+                if wanted:
+                    values.append(None)
+                continue
+            node_class = type(node)
+            enter = enter_hooks[node_class]
+            if enter is not None and enter(node) is SKIP:
+                if wanted:
+                    values.append(None)
+                continue
+
+            if leave_hooks[node_class] is None:
+                if wanted:
+                    values.append(None)
+                children = []
+                for name, is_list in CHILD_FIELDS[node_class]:
+                    child = getattr(node, name)
+                    if is_list:
+                        children.extend(child)
+                    elif child is not None:
+                        children.append(child)
+                for child in reversed(children):
+                    push((child, False, None))
+                continue
+
+            shape, children = [], []
+            for name, is_list in CHILD_FIELDS[node_class]:
+                child = getattr(node, name)
+                if is_list:
+                    shape.append(len(child))
+                    children.extend(child)
+                else:
+                    shape.append(-1)
+                    children.append(child)
+            push((node, wanted, shape))
+            for child in reversed(children):
+                push((child, True, None))
+        return values[0] if values else None
+
+
+def _is_default(hook, name: str) -> bool:
+    return hook.__func__ is getattr(IterativeVisitor, name)
+
+
+class _Height(IterativeVisitor):
+    def leave_node(self, node, results):
+        height = 0
+        for result in results:
+            if type(result) is list:
+                height = max(height, *result) if result else height
+            elif result is not None:
+                height = max(height, result)
+        return height + 1
+
+
+def tree_height(node) -> int:
+    """Return the number of nodes on the longest root-to-leaf path."""
+    return _Height().traverse(node)
@@ -15,8 +15,30 @@ class ASTVisitor(ABC):
     """Abstract base class for AST visitors."""
 
     def visit(self, node: "ASTNode", o: Any = None):
-        """Visit a node using the visitor pattern."""
-        return node.accept(self, o)
+        """
+        Visit a node by calling the visit method for its class directly.
+
+        The visit method for each node class is looked up once per
+        visitor instance, on the first visit of that class, and kept in
+        a table, instead of going through node.accept() on every visit.
+        The lookup goes through the visitor's class, so overrides of
+        visit_* methods in subclasses are honoured.
+        """
+        try:
+            handler = self._handlers[type(node)]
+        except (AttributeError, KeyError):
+            handler = self.resolve_handler(type(node))
+        return handler(self, node, o)
+
+    def resolve_handler(self, node_class):
+        """Return the visit function for node_class and record it in the table."""
+        try:
+            handlers = self._handlers
+        except AttributeError:
+            handlers = self._handlers = {}
+        # Plain functions are called faster than bound methods
+        handler = handlers[node_class] = getattr(type(self), node_class.visit_method)
+        return handler
 
     # Program and class declarations
     @abstractmethod
@@ -0,0 +1,108 @@
+import pickle
+
+import pytest
+
+import test_checker  # before tests.utils, which puts src/utils first on sys.path
+import test_ast_gen
+from src.utils.ast_arena import ASTArena
+from src.utils.nodes import BlockStatement, Program
+from tests.utils import ASTGenerator, Checker
+
+
+AST_GEN_CASES = sorted(
+    (name, case) for name, case in vars(test_ast_gen).items() if name.startswith("test_")
+)
+CHECKER_CASES = sorted(
+    (name, case) for name, case in vars(test_checker).items() if name.startswith("test_")
+)
+
+
+class RoundTripASTGenerator:
+    """ASTGenerator stand-in that stores each AST in an arena and reads it back."""
+
+    def __init__(self, input_string):
+        self.input_string = input_string
+
+    def generate(self):
+        ast = ASTGenerator(self.input_string).generate()
+        if isinstance(ast, str):
+            return ast
+        arena = ASTArena()
+        root = arena.add(ast)
+        assert str(arena.view(root)) == str(ast)
+        return arena.to_node(root)
+
+
+class ArenaChecker:
+    """Checker stand-in that checks the arena view and compares with the nodes."""
+
+    def __init__(self, source):
+        self.source = source
+
+    def check_from_source(self):
+        expected = Checker(self.source).check_from_source()
+        ast = ASTGenerator(self.source).generate()
+        if isinstance(ast, str):
+            return expected
+        arena = ASTArena()
+        result = Checker(ast=arena.view(arena.add(ast))).check_from_ast()
+        assert result == expected
+        return result
+
+
+@pytest.mark.parametrize("name, case", AST_GEN_CASES, ids=[name for name, _ in AST_GEN_CASES])
+def test_replay_ast_gen_case(name, case, monkeypatch):
+    """Replay a test_ast_gen case through an arena round trip"""
+    monkeypatch.setattr(test_ast_gen, "ASTGenerator", RoundTripASTGenerator)
+    case()
+
+
+@pytest.mark.parametrize("name, case", CHECKER_CASES, ids=[name for name, _ in CHECKER_CASES])
+def test_replay_checker_case(name, case, monkeypatch):
+    """Replay a test_checker case with StaticChecker running over arena views"""
+    monkeypatch.setattr(test_checker, "Checker", ArenaChecker)
+    case()
+
+
+def test_001():
+    """Test several programs share one arena and views keep node types"""
+    arena = ASTArena()
+    roots = [
+        arena.add(ASTGenerator(f"class A{i} {{ void m() {{ {{ }} }} }}").generate())
+        for i in range(3)
+    ]
+    view = arena.view(roots[2])
+    assert isinstance(view, Program)
+    assert view.class_decls[0].name == "A2"
+    assert isinstance(view.class_decls[0].members[0].body.statements[0], BlockStatement)
+    assert arena.strings.count("m") == 1
+
+
+def test_002():
+    """Test views are read-only"""
+    arena = ASTArena()
+    view = arena.view(arena.add(ASTGenerator("class A { }").generate()))
+    with pytest.raises(AttributeError):
+        view.class_decls = []
+
+
+def test_003():
+    """Test views and view classes pickle"""
+    ast = ASTGenerator("class A { int x := 1; void m() { x := x + 1; } }").generate()
+    arena = ASTArena()
+    view = arena.view(arena.add(ast))
+    loaded = pickle.loads(pickle.dumps(view))
+    assert type(loaded) is type(view) and loaded == ast and str(loaded) == str(ast)
+    member = view.class_decls[0].members[1]
+    assert pickle.loads(pickle.dumps(member)) == ast.class_decls[0].members[1]
+    assert pickle.loads(pickle.dumps(type(view))) is type(view)
+
+
+def test_004():
+    """Test integers wider than 64 bits round-trip"""
+    source = "class A { int x := 99999999999999999999999; int[4611686018427387904] a; int y := 4611686018427387903; }"
+    ast = ASTGenerator(source).generate()
+    arena = ASTArena()
+    root = arena.add(ast)
+    assert arena.to_node(root) == ast and arena.view(root) == ast
+    assert arena.view(root).class_decls[0].members[0].attributes[0].init_value.value == 99999999999999999999999
@@ -0,0 +1,85 @@
+import pytest
+
+import test_ast_gen
+from src.utils.ast_binary import FORMAT_VERSION, MAGIC, dump, dumps, load, loads
+from src.utils.interning import InternTable
+from src.utils.nodes import ClassType, PrimitiveType
+from tests.utils import ASTGenerator
+
+
+AST_GEN_CASES = sorted(
+    (name, case) for name, case in vars(test_ast_gen).items() if name.startswith("test_")
+)
+
+
+class RoundTripASTGenerator:
+    """ASTGenerator stand-in that serializes each AST and loads it back."""
+
+    def __init__(self, input_string):
+        self.input_string = input_string
+
+    def generate(self):
+        ast = ASTGenerator(self.input_string).generate()
+        if isinstance(ast, str):
+            return ast
+        return loads(dumps(ast))
+
+
+@pytest.mark.parametrize("name, case", AST_GEN_CASES, ids=[name for name, _ in AST_GEN_CASES])
+def test_replay_ast_gen_case(name, case, monkeypatch):
+    """Replay a test_ast_gen case through a binary round trip"""
+    monkeypatch.setattr(test_ast_gen, "ASTGenerator", RoundTripASTGenerator)
+    case()
+
+
+def test_001():
+    """Test positions, negative sizes and large literals survive a round trip"""
+    source = 'class A { int[3] a := {1, 2, 3}; static void main() { a[0] := 2147483647; } }'
+    ast = ASTGenerator(source).generate()
+    ast.line, ast.column = 1, 0
+    ast.class_decls[0].members[0].attr_type.size = -3
+    result = loads(dumps(ast))
+    assert str(result) == str(ast)
+    assert (result.line, result.column) == (1, 0)
+    assert result.class_decls[0].line is None
+
+
+def test_002(tmp_path):
+    """Test the file API and that repeated names share one string table entry"""
+    ast = ASTGenerator("class A { int x; void m() { x := x + x; } }").generate()
+    data = dumps(ast)
+    assert data.count(b"x") == 1
+    path = tmp_path / "ast.opast"
+    dump(ast, path)
+    assert str(load(path)) == str(ast)
+
+
+def test_003():
+    """Test data from another format version or not in the format is rejected"""
+    data = dumps(ASTGenerator("class A { }").generate())
+    with pytest.raises(ValueError, match="version"):
+        loads(MAGIC + bytes([FORMAT_VERSION + 1]) + data[len(MAGIC) + 1:])
+    with pytest.raises(ValueError, match="Not an OPLang AST"):
+        loads(b"class A { }")
+
+
+def test_004():
+    """Test every truncation of the data raises ValueError"""
+    data = dumps(ASTGenerator('class A { float f := 1.5; string s := "abc"; int[2] a; }').generate())
+    for end in range(len(MAGIC), len(data)):
+        with pytest.raises(ValueError, match="truncated AST data"):
+            loads(data[:end])
+
+
+def test_005():
+    """Test loaded type nodes are shared through the intern table"""
+    source = "class A { int x; B b; void m(int p; B q) { int y; } }"
+    table = InternTable()
+    ast = loads(dumps(ASTGenerator(source).generate()), table)
+    x, b, m = ast.class_decls[0].members
+    assert x.attr_type is m.params[0].param_type is m.body.var_decls[0].var_type
+    assert x.attr_type is table.primitive_type("int") and x.attr_type.line is None
+    assert b.attr_type is m.params[1].param_type is table.class_type("B")
+    assert type(b.attr_type) is ClassType and type(x.attr_type) is PrimitiveType
+    other = loads(dumps(ast))
+    assert other.class_decls[0].members[0].attr_type is not x.attr_type
@@ -0,0 +1,55 @@
+import pytest
+
+import test_ast_gen
+from tests.utils import ASTGenerator
+
+
+AST_GEN_CASES = sorted(
+    (name, case) for name, case in vars(test_ast_gen).items() if name.startswith("test_")
+)
+
+
+class ComparingASTGenerator:
+    """ASTGenerator stand-in that checks direct construction matches the tree walk."""
+
+    def __init__(self, input_string):
+        self.input_string = input_string
+
+    def generate(self):
+        expected = ASTGenerator(self.input_string).generate()
+        for mode in ("ll", "sll-ll"):
+            ast = ASTGenerator(self.input_string, mode=mode, direct=True).generate()
+            assert str(ast) == str(expected)
+        return ast
+
+
+@pytest.mark.parametrize("name, case", AST_GEN_CASES, ids=[name for name, _ in AST_GEN_CASES])
+def test_replay_ast_gen_case(name, case, monkeypatch):
+    """Replay a test_ast_gen case with direct AST construction, comparing with the tree walk"""
+    monkeypatch.setattr(test_ast_gen, "ASTGenerator", ComparingASTGenerator)
+    case()
+
+
+def test_001():
+    """Test syntax errors are reported the same way during direct construction"""
+    source = "class A { void m() { x := ; } }"
+    expected = "AST Generation Error: Error on line 1 col 26: ;"
+    assert ASTGenerator(source, mode="sll-ll", direct=True).generate() == expected
+
+
+def test_002():
+    """Test long left-associative chains keep their grouping"""
+    source = "class A { void m() { x := 1 - 2 - 3 * 4 ^ \"s\" && b || c; } }"
+    expected = ASTGenerator(source).generate()
+    assert str(ASTGenerator(source, direct=True).generate()) == str(expected)
+    assert "BinaryOp(BinaryOp(BinaryOp(IntLiteral(1), -, IntLiteral(2)), -, " in str(expected)
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("class { }", "Error on line 1 col 6: {"),
+    ("class A extends { }", "Error on line 1 col 16: {"),
+    ("class A { void m() { x := a.; } }", "Error on line 1 col 28: ;"),
+])
+def test_003(source, expected):
+    """Test a bailed SLL stage falls back to LL, which reports the syntax error"""
+    assert ASTGenerator(source, mode="sll-ll", direct=True).generate() == "AST Generation Error: " + expected
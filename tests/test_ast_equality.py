@@ -0,0 +1,95 @@
+import copy
+import pickle
+
+import pytest
+
+import test_ast_gen
+from src.utils.ast_arena import ASTArena
+from src.utils.ast_binary import dumps, loads
+from src.utils.nodes import *
+from src.utils.nodes import invalidate_hashes
+from tests.utils import ASTGenerator
+
+
+AST_GEN_CASES = sorted(
+    (name, case) for name, case in vars(test_ast_gen).items() if name.startswith("test_")
+)
+
+
+class ComparingASTGenerator:
+    """ASTGenerator stand-in that checks equality and hashing agree with the string form."""
+
+    def __init__(self, input_string):
+        self.input_string = input_string
+
+    def generate(self):
+        ast = ASTGenerator(self.input_string).generate()
+        if isinstance(ast, str):
+            return ast
+        again = ASTGenerator(self.input_string).generate()
+        assert ast == again and hash(ast) == hash(again)
+        arena = ASTArena()
+        view = arena.view(arena.add(ast))
+        assert view == ast and ast == view and hash(view) == hash(ast)
+        assert loads(dumps(ast)) == ast
+        return ast
+
+
+@pytest.mark.parametrize("name, case", AST_GEN_CASES, ids=[name for name, _ in AST_GEN_CASES])
+def test_replay_ast_gen_case(name, case, monkeypatch):
+    """Replay a test_ast_gen case, comparing the AST with copies built other ways"""
+    monkeypatch.setattr(test_ast_gen, "ASTGenerator", ComparingASTGenerator)
+    case()
+
+
+def test_001():
+    """Test equality compares classes and fields but not positions"""
+    a = BinaryOp(IntLiteral(1), "+", Identifier("x"))
+    b = BinaryOp(IntLiteral(1), "+", Identifier("x"))
+    b.line, b.column = 3, 7
+    assert a == b and hash(a) == hash(b)
+    assert a != BinaryOp(IntLiteral(1), "-", Identifier("x"))
+    assert a != BinaryOp(FloatLiteral(1), "+", Identifier("x"))
+    assert IntLiteral(1) != BoolLiteral(True)
+    assert BreakStatement() == BreakStatement() and BreakStatement() != ContinueStatement()
+    assert a != str(a)
+    assert len({a, b, BinaryOp(IntLiteral(2), "+", Identifier("x"))}) == 2
+
+
+def test_002():
+    """Test hashed nodes are frozen until their tree's hashes are discarded"""
+    ast = ASTGenerator("class A { void m() { x := y + 1; } }").generate()
+    other = ASTGenerator("class A { void m() { x := y + 2; } }").generate()
+    hash(ast), hash(other)
+    assert ast != other
+    ast.line = 5
+    literal = ast.class_decls[0].members[0].body.statements[0].rhs.right
+    with pytest.raises(AttributeError):
+        literal.value = 2
+    invalidate_hashes(ast)
+    literal.value = 2
+    assert ast == other and hash(ast) == hash(other)
+    invalidate_hashes(ast)
+    ast.class_decls[0].members[0].body.statements.append(BreakStatement())
+    assert ast != other
+    other.class_decls[0].members[0].body.statements.append(BreakStatement())
+    invalidate_hashes(other)
+    assert ast == other and hash(ast) == hash(other)
+
+
+def test_003():
+    """Test equal subtrees share memo entries and copies do not reuse stale hashes"""
+    ast = ASTGenerator("class A { int m() { return 1 + 2; } int n() { return 1 + 2; } }").generate()
+    methods = ast.class_decls[0].members
+    memo = {}
+    for method in methods:
+        memo.setdefault(method.body, method.name)
+    assert memo == {methods[0].body: "m"}
+    assert copy.copy(ast) == ast
+    for clone in [copy.deepcopy(ast), pickle.loads(pickle.dumps(ast))]:
+        assert clone.class_decls[0]._hash_cache is None
+        clone.class_decls[0].name = "B"
+        assert clone != ast and hash(clone) != hash(ast)
+        invalidate_hashes(clone)
+        clone.class_decls[0].name = "A"
+        assert clone == ast and hash(clone) == hash(ast)
@@ -1311,3 +1311,34 @@ def test_030():
 #     }"""
 #     expected = "Program([ClassDecl(TestClass, [AttributeDecl(ArrayType(ClassType(Shape)[5]), [Attribute(shapes)]), AttributeDecl(ClassType(Node), [Attribute(root)]), MethodDecl(PrimitiveType(void) test([]), BlockStatement(stmts=[MethodInvocationStatement(PostfixExpression(PostfixExpression(PostfixExpression(Identifier(shapes)[PostfixExpression(Identifier(root).getIndex())].getData())[IntLiteral(0)].process())), AssignmentStatement(PostfixLHS(PostfixExpression(ParenthesizedExpression(BinaryOp(PostfixExpression(PostfixExpression(Identifier(root).getLeft()).getData()), +, PostfixExpression(PostfixExpression(Identifier(root).getRight()).getData())))[IntLiteral(0)])) := PostfixExpression(PostfixExpression(Identifier(shapes)[IntLiteral(0)].getValues())[PostfixExpression(Identifier(root).getHeight())])), MethodInvocationStatement(PostfixExpression(PostfixExpression(Identifier(root).getChildren())[PostfixExpression(Identifier(shapes)[IntLiteral(0)].getIndex())].setNext(PostfixExpression(Identifier(shapes)[PostfixExpression(Identifier(root).getValue())].getCurrent()))))]))])])"
 #     assert str(ASTGenerator(source).generate()) == expected
+
+
+def test_071():
+    """Test long statement and declaration lists are built flat"""
+    n = 3000
+    stmts = "\n".join(f"x := {i};" for i in range(n))
+    params = "; ".join(f"int p{i}" for i in range(50))
+    source = f"""class Long {{
+        void run({params};) {{
+            int x;
+            {stmts}
+        }}
+    }}"""
+    ast = ASTGenerator(source).generate()
+    method = ast.class_decls[0].members[0]
+    assert [p.name for p in method.params] == [f"p{i}" for i in range(50)]
+    assert len(method.body.statements) == n
+    assert str(method.body.statements[-1]) == f"AssignmentStatement(IdLHS(x) := IntLiteral({n - 1}))"
+
+
+def test_072():
+    """Test precedence and grouping of mixed operators in the flat expression rule"""
+    source = """class A {
+        void m() {
+            v := a == b < c != d;
+            v := !-x.y[1] ^ s;
+            v := 1 + 2 * 3 && new B().c;
+        }
+    }"""
+    expected = "Program([ClassDecl(A, [MethodDecl(PrimitiveType(void) m([]), BlockStatement(stmts=[AssignmentStatement(IdLHS(v) := BinaryOp(BinaryOp(Identifier(a), ==, Identifier(b)), <, BinaryOp(Identifier(c), !=, Identifier(d)))), AssignmentStatement(IdLHS(v) := BinaryOp(UnaryOp(!, UnaryOp(-, PostfixExpression(Identifier(x).y[IntLiteral(1)]))), ^, Identifier(s))), AssignmentStatement(IdLHS(v) := BinaryOp(BinaryOp(IntLiteral(1), +, BinaryOp(IntLiteral(2), *, IntLiteral(3))), &&, PostfixExpression(ObjectCreation(new B()).c)))]))])])"
+    assert str(ASTGenerator(source).generate()) == expected
@@ -0,0 +1,98 @@
+import pytest
+
+import test_ast_gen
+from src.astgen.ast_generation import ASTGeneration
+from src.utils.ast_index import NAME_FIELDS, ASTIndex
+from src.utils.nodes import *
+from src.utils.traversal import CHILD_FIELDS, IterativeVisitor
+from tests.utils import ASTGenerator
+
+
+AST_GEN_CASES = sorted(
+    (name, case) for name, case in vars(test_ast_gen).items() if name.startswith("test_")
+)
+
+SOURCE = """
+class Foo { }
+class Bar extends Foo {
+    Foo f := new Foo();
+    void bar(Foo x) { this.bar(new Foo()); }
+    void baz() { this.f.bar(new Bar()); x := y; }
+}
+"""
+
+
+class Occurrences(IterativeVisitor):
+    """Collects (node, parent) pairs in pre-order by walking the tree."""
+
+    def __init__(self):
+        super().__init__()
+        self.pairs = []
+        self.parents = [None]
+
+    def enter_node(self, node):
+        self.pairs.append((node, self.parents[-1]))
+        self.parents.append(node)
+
+    def leave_node(self, node, results):
+        self.parents.pop()
+
+
+class IndexingASTGenerator:
+    """ASTGenerator stand-in that checks the index against a walk of the AST."""
+
+    def __init__(self, input_string):
+        self.input_string = input_string
+
+    def generate(self):
+        index = ASTIndex()
+        ast = ASTGenerator(self.input_string, index=index).generate()
+        if isinstance(ast, str):
+            return ast
+        walk = Occurrences()
+        walk.traverse(ast)
+        seen = {}
+        for node, parent in walk.pairs:
+            seen.setdefault(id(node), (node, []))[1].append(parent)
+        for node, parents in seen.values():
+            assert index.parent(node) is (parents[0] if len(parents) == 1 else None)
+        for kind in CHILD_FIELDS:
+            nodes = [node for node, _ in seen.values() if type(node) is kind]
+            assert [id(n) for n in index.find(kind)] == [id(n) for n in nodes]
+            if kind in NAME_FIELDS:
+                for node in nodes:
+                    assert any(n is node for n in index.find(kind, getattr(node, NAME_FIELDS[kind])))
+        return ast
+
+
+@pytest.mark.parametrize("name, case", AST_GEN_CASES, ids=[name for name, _ in AST_GEN_CASES])
+def test_replay_ast_gen_case(name, case, monkeypatch):
+    """Replay a test_ast_gen case, checking the index built during generation"""
+    monkeypatch.setattr(test_ast_gen, "ASTGenerator", IndexingASTGenerator)
+    case()
+
+
+def test_001():
+    """Test kind and name queries return nodes in source order with their parents"""
+    index = ASTIndex()
+    ast = ASTGenerator(SOURCE, index=index).generate()
+    bar = ast.class_decls[1]
+    creations = index.find(ObjectCreation, "Foo")
+    assert [str(c) for c in creations] == ["ObjectCreation(new Foo())"] * 2
+    assert index.parent(creations[0]) is bar.members[0].attributes[0]
+    calls = index.find(MethodCall, "bar")
+    assert len(calls) == 2 and index.find(MethodCall, "baz") == []
+    assert list(index.ancestors(calls[1]))[-3:] == [bar.members[2], bar, ast]
+    assert index.find(IdLHS) == [IdLHS("x")]
+    assert index.parent(ast) is None and index.parent(IdLHS("x")) is None
+
+
+def test_002():
+    """Test the direct builder fills the index and shared type nodes have no parent"""
+    index = ASTIndex()
+    ASTGenerator(SOURCE, mode="sll-ll", direct=True, index=index).generate()
+    assert len(index.find(ClassDecl)) == 2
+    [foo_type] = index.find(ClassType, "Foo")
+    assert index.parent(foo_type) is None
+    generation = ASTGeneration(index=index)
+    assert generation.index is index
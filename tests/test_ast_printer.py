@@ -0,0 +1,66 @@
+import io
+
+from src.utils.ast_arena import ASTArena
+from src.utils.ast_printer import format_ast, write_ast
+from src.utils.nodes import *
+from tests.utils import ASTGenerator
+
+
+DEPTH = 100_000
+
+SOURCE = """
+class A extends B {
+    static final int[2] xs := {1, 2};
+    string s := "a\\tb";
+    A(float f; B & r) { this.m(f, nil).n[0] := -f; }
+    ~A() { }
+    boolean m() {
+        int i;
+        for i := 10 downto 0 do if i > 5 then break; else continue;
+        return new B().k && !(true);
+    }
+}
+"""
+
+
+def test_001():
+    """Test write_ast writes what str() returns, to a buffer and to a file"""
+    ast = ASTGenerator(SOURCE).generate()
+    stream = io.StringIO()
+    write_ast(ast, stream)
+    assert stream.getvalue() == str(ast) == format_ast(ast)
+    big = Program([ClassDecl(f"C{i}", None, []) for i in range(5000)])
+    stream = io.StringIO()
+    write_ast(big, stream)
+    assert stream.getvalue() == "Program([" + ", ".join(f"ClassDecl(C{i}, [])" for i in range(5000)) + "])"
+
+
+def test_002(tmp_path):
+    """Test 100k nested parentheses are printed without recursion"""
+    expr = Identifier("x")
+    for _ in range(DEPTH):
+        expr = ParenthesizedExpression(expr)
+    path = tmp_path / "ast.txt"
+    with open(path, "w") as f:
+        write_ast(ReturnStatement(expr), f)
+    text = path.read_text()
+    assert text == "ReturnStatement(return " + "ParenthesizedExpression((" * DEPTH + "Identifier(x)" + "))" * DEPTH + ")"
+
+
+def test_003():
+    """Test subclasses and arena views print as the node class they derive from"""
+
+    class Name(Identifier):
+        __slots__ = ()
+
+    class Marker(Statement):
+        __slots__ = ()
+
+        def accept(self, visitor, o=None):
+            return None
+
+    ast = ASTGenerator(SOURCE).generate()
+    arena = ASTArena()
+    assert str(arena.view(arena.add(ast))) == str(ast)
+    assert str(UnaryOp("-", Name("y"))) == "UnaryOp(-, Identifier(y))"
+    assert str(BlockStatement([], [Marker()])) == "BlockStatement(stmts=[Marker()])"
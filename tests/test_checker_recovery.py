@@ -0,0 +1,120 @@
+import pytest
+
+import test_checker  # before tests.utils, which puts src/utils first on sys.path
+from src.semantics.static_checker import Diagnostic, StaticChecker
+from src.semantics.static_error import UndeclaredIdentifier
+from src.utils.nodes import Identifier
+from tests.utils import ASTGenerator, Checker
+
+
+CHECKER_CASES = sorted(
+    (name, case) for name, case in vars(test_checker).items() if name.startswith("test_")
+)
+
+
+class CollectingChecker:
+    """Checker stand-in that also collects, and compares the first error found."""
+
+    def __init__(self, source):
+        self.source = source
+
+    def check_from_source(self):
+        expected = Checker(self.source).check_from_source()
+        collected = Checker(self.source, recover=True).check_from_source()
+        assert collected.split("\n")[0] == expected
+        return expected
+
+
+@pytest.mark.parametrize("name, case", CHECKER_CASES, ids=[name for name, _ in CHECKER_CASES])
+def test_replay_checker_case(name, case, monkeypatch):
+    """Replay a test_checker case and check collecting finds its error first"""
+    monkeypatch.setattr(test_checker, "Checker", CollectingChecker)
+    case()
+
+
+def test_001():
+    """Test independent errors are all reported, each once"""
+    source = """
+class A extends Missing {
+    int a, a;
+    final int K := x;
+    int f(int p; float p) {
+        int y := undeclared + 1 * 2;
+        boolean b := y > 1 && nothing;
+        if 1 then y := 2.5;
+        for y := 1.5 to 2 do break;
+        return y;
+    }
+    int f() { return z; }
+}
+class A { }
+class Program {
+    void g() { break; }
+    static void main() { }
+}
+"""
+    expected = [
+        "UndeclaredClass(Missing)",
+        "Redeclared(Attribute, a)",
+        "UndeclaredIdentifier(x)",
+        "Redeclared(Parameter, p)",
+        "UndeclaredIdentifier(undeclared)",
+        "UndeclaredIdentifier(nothing)",
+        "TypeMismatchInStatement(IfStatement(if IntLiteral(1) then AssignmentStatement(IdLHS(y) := FloatLiteral(2.5))))",
+        "TypeMismatchInStatement(AssignmentStatement(IdLHS(y) := FloatLiteral(2.5)))",
+        "TypeMismatchInStatement(ForStatement(for y := FloatLiteral(1.5) to IntLiteral(2) do BreakStatement()))",
+        "Redeclared(Method, f)",
+        "UndeclaredIdentifier(z)",
+        "Redeclared(Class, A)",
+        "MustInLoop(BreakStatement())",
+    ]
+    assert Checker(source, recover=True).check_from_source().split("\n") == expected
+
+
+def test_002():
+    """Test errors are recorded with the node they were found at"""
+    ast = ASTGenerator("class A { static void main() { int x := y; x := y; } }").generate()
+    checker = StaticChecker()
+    checker.errors = []
+    checker.check_program(ast)
+    assert [type(d.error) for d in checker.errors] == [UndeclaredIdentifier, UndeclaredIdentifier]
+    assert all(type(d) is Diagnostic and d.node == Identifier("y") for d in checker.errors)
+    assert checker.errors[0].node is not checker.errors[1].node
+    with pytest.raises(UndeclaredIdentifier):
+        StaticChecker().check_program(ast)
+
+
+def test_003():
+    """Test a checker run again collects the same errors, whatever the mode of earlier runs"""
+    ast = ASTGenerator("class A { static void main() { int x := y; } }").generate()
+    checker = StaticChecker()
+    with pytest.raises(UndeclaredIdentifier):
+        checker.check_program(ast)
+    for _ in range(2):
+        checker.errors = []
+        checker.check_program(ast)
+        assert [str(d) for d in checker.errors] == ["UndeclaredIdentifier(y)"]
+    errors = checker.errors
+    checker.check_program(ast)
+    assert checker.errors is errors and [str(d) for d in errors] == ["UndeclaredIdentifier(y)"]
+
+
+def test_004():
+    """Test a shared type node is reported once per declaration using it, with that declaration"""
+    source = """
+class A {
+    void f(Missing p; Missing q) { Missing m := nil; }
+    void g() { Missing m := nil; }
+    static void main() { }
+}
+"""
+    ast = ASTGenerator(source).generate()
+    checker = StaticChecker()
+    checker.errors = []
+    checker.check_program(ast)
+    assert [str(d) for d in checker.errors] == ["UndeclaredClass(Missing)"] * 4
+    assert len({id(d.node) for d in checker.errors}) == 1
+    f, g = ast.class_decls[0].members[:2]
+    sites = [d.site for d in checker.errors]
+    assert sites[0] is f.params[0] and sites[1] is f.params[1]
+    assert sites[2] is f.body.var_decls[0] and sites[3] is g.body.var_decls[0]
@@ -0,0 +1,42 @@
+from src.semantics.class_index import ClassIndex
+from src.utils.nodes import ClassDecl, Program
+from tests.utils import Checker
+
+
+def test_001():
+    """Test subclass tests follow the inheritance forest transitively"""
+    program = Program([
+        ClassDecl("A", None, []), ClassDecl("B", "A", []), ClassDecl("C", "B", []),
+        ClassDecl("D", "A", []), ClassDecl("E", None, []), ClassDecl("F", "G", []),
+        ClassDecl("G", "E", []), ClassDecl("B", "E", []),
+    ])
+    index = ClassIndex(program)
+    assert index.is_subclass("C", "A") and index.is_subclass("C", "B") and index.is_subclass("D", "A")
+    assert index.is_subclass("C", "C") and index.is_subclass("G", "E")
+    assert not index.is_subclass("A", "C") and not index.is_subclass("C", "D")
+    # Only the first B counts, and F extends a class declared after it
+    assert not index.is_subclass("B", "E") and not index.is_subclass("F", "E")
+    assert not index.is_subclass("X", "A") and index.is_subclass("X", "X")
+
+
+def test_002():
+    """Test objects coerce to every ancestor class, and not the other way"""
+    source = """
+class A { }
+class B extends A { }
+class C extends B { }
+class Program {
+    int f(A a) { return 1; }
+    void g() { A a := new C(); int x := this.f(new C()); a := new B(); }
+    static void main() { }
+}
+"""
+    assert Checker(source).check_from_source() == "Static checking passed"
+    source = """
+class A { }
+class B extends A { }
+class C extends B { }
+class Program { void g() { C c := new A(); } static void main() { } }
+"""
+    expected = "TypeMismatchInStatement(VariableDecl(ClassType(C), [Variable(c = ObjectCreation(new A()))]))"
+    assert Checker(source).check_from_source() == expected
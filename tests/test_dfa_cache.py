@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+
+from tests.utils import ASTGenerator
+from src.utils import dfa_cache
+from src.utils.dfa_cache import (
+    clear_dfa_cache, dfa_state_count, load_dfa_cache, save_dfa_cache, warm_dfa_cache,
+)
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOURCES = [
+    """class Shape {
+        float area() { return 0.0; }
+    }
+    class Rect extends Shape {
+        int w, h;
+        Rect(int w; int h) { this.w := w; this.h := h; }
+        float area() { return this.w * this.h / 1.0; }
+        static void main() {
+            Rect r := new Rect(2, 3);
+            for i := 1 to 10 do { if r.area() > 5 then io.writeFloat(r.area()); }
+        }
+    }""",
+    "class A { int[3] xs := {1, 2, 3}; void m() { xs[0] := -xs[1] + !b; s := \"x\" ^ \"y\"; } }",
+]
+
+
+def test_001(tmp_path):
+    """Test a saved cache restores every DFA state and leaves parses unchanged"""
+    path = tmp_path / "dfa.cache"
+    warm_dfa_cache(SOURCES)
+    expected = [str(ASTGenerator(source).generate()) for source in SOURCES]
+    n_states = dfa_state_count()
+    save_dfa_cache(path)
+    clear_dfa_cache()
+    assert dfa_state_count() == 0
+    assert load_dfa_cache(path)
+    assert dfa_state_count() == n_states
+    assert [str(ASTGenerator(source).generate()) for source in SOURCES] == expected
+
+
+def test_002(tmp_path):
+    """Test a cache written for another grammar is ignored"""
+    path = tmp_path / "dfa.cache"
+    save_dfa_cache(path)
+    with open(path, "rb") as f:
+        payload = dfa_cache._DFAUnpickler(f).load()
+    payload["fingerprint"] = "stale"
+    with open(path, "wb") as f:
+        dfa_cache._DFAPickler(f).dump(payload)
+    n_states = dfa_state_count()
+    assert not load_dfa_cache(path)
+    assert dfa_state_count() == n_states
+
+
+def test_003(tmp_path):
+    """Test a restored cache needs no new DFA states in a fresh process"""
+    path = tmp_path / "dfa.cache"
+    clear_dfa_cache()
+    warm_dfa_cache(SOURCES)
+    save_dfa_cache(path)
+    script = (
+        "import sys\n"
+        "from tests.test_dfa_cache import SOURCES\n"
+        "from src.utils.dfa_cache import dfa_state_count, load_dfa_cache, warm_dfa_cache\n"
+        "assert load_dfa_cache(sys.argv[1])\n"
+        "n_states = dfa_state_count()\n"
+        "assert warm_dfa_cache(SOURCES) == len(SOURCES)\n"
+        "assert dfa_state_count() == n_states, (n_states, dfa_state_count())\n"
+    )
+    env = dict(os.environ, PYTHONHASHSEED="12345", PYTHONPATH=os.pathsep.join([ROOT_DIR, os.path.join(ROOT_DIR, "build")]))
+    result = subprocess.run([sys.executable, "-c", script, str(path)], cwd=ROOT_DIR, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_004():
+    """Test syntax errors in the warm-up corpus are skipped"""
+    assert warm_dfa_cache(SOURCES + ["class A { void m() { x := ; } }"]) == len(SOURCES)
@@ -0,0 +1,149 @@
+import functools
+
+import pytest
+
+import test_lexer
+import test_parser
+from utils import Parser, Tokenizer
+from src.grammar.fast_lexer import FastLexer
+from src.grammar.stream_lexer import read_chunks, stream_tokens
+
+
+LEXER_CASES = sorted(
+    (name, case) for name, case in vars(test_lexer).items() if name.startswith("test_")
+)
+
+PARSER_CASES = sorted(
+    (name, case) for name, case in vars(test_parser).items() if name.startswith("test_")
+)
+
+
+def token_trace(lexer):
+    """Drain lexer into (type, text, line, column) tuples plus the errors, raised or recorded."""
+    trace = []
+    try:
+        while True:
+            token = lexer.nextToken()
+            trace.append((token.type, token.text, token.line, token.column))
+            if token.type == -1:
+                break
+    except Exception as e:
+        trace.append((type(e).__name__, str(e)))
+    for e in lexer.errors or []:
+        trace.append((type(e).__name__, str(e), e.line, e.column))
+    return trace
+
+
+def comparing_tokenizer(source, recover=False):
+    """Tokenizer factory that checks both lexers agree before handing out the fast one."""
+    antlr_trace = token_trace(Tokenizer(source, lexer="antlr", recover=recover).lexer)
+    fast_trace = token_trace(Tokenizer(source, lexer="fast", recover=recover).lexer)
+    assert fast_trace == antlr_trace
+    return Tokenizer(source, lexer="fast", recover=recover)
+
+
+def streaming_tokenizer(source, path, chunk_size, recover=False):
+    """Tokenizer factory that checks file streaming agrees with ANTLR at a tiny chunk size."""
+    path.write_text(source, encoding="utf-8")
+    antlr_trace = token_trace(Tokenizer(source, lexer="antlr", recover=recover).lexer)
+    stream_lexer = FastLexer.from_chunks(read_chunks(path, chunk_size))
+    if recover:
+        stream_lexer.errors = []
+    stream_trace = token_trace(stream_lexer)
+    assert stream_trace == antlr_trace
+    return Tokenizer(source, lexer="fast", recover=recover)
+
+
+def fast_parser(source, **kwargs):
+    """Parser factory that checks parsing the fast lexer's tokens agrees with ANTLR's."""
+    expected = Parser(source, **kwargs).parse()
+    assert Parser(source, lexer="fast", **kwargs).parse() == expected
+    return Parser(source, lexer="fast", **kwargs)
+
+
+@pytest.mark.parametrize("name, case", LEXER_CASES, ids=[name for name, _ in LEXER_CASES])
+def test_replay_lexer_case(name, case, monkeypatch):
+    """Replay a test_lexer case through the fast lexer, comparing every token with ANTLR"""
+    monkeypatch.setattr(test_lexer, "Tokenizer", comparing_tokenizer)
+    case()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5])
+@pytest.mark.parametrize("name, case", LEXER_CASES, ids=[name for name, _ in LEXER_CASES])
+def test_replay_lexer_case_streaming(name, case, chunk_size, monkeypatch, tmp_path):
+    """Replay a test_lexer case through the chunked file lexer, comparing every token with ANTLR"""
+    path = tmp_path / "case.op"
+    factory = functools.partial(streaming_tokenizer, path=path, chunk_size=chunk_size)
+    monkeypatch.setattr(test_lexer, "Tokenizer", factory)
+    case()
+
+
+@pytest.mark.parametrize("name, case", PARSER_CASES, ids=[name for name, _ in PARSER_CASES])
+def test_replay_parser_case(name, case, monkeypatch):
+    """Replay a test_parser case on the fast lexer's tokens through CommonTokenStream"""
+    monkeypatch.setattr(test_parser, "Parser", fast_parser)
+    case()
+
+
+def test_001():
+    """Test unterminated block comment falls back to operators"""
+    source = "/* never closed"
+    expected = "/,*,never,closed,EOF"
+    assert comparing_tokenizer(source).get_tokens_as_string() == expected
+
+
+def test_002():
+    """Test illegal escape at a line break"""
+    source = '"abc\\\nrest'
+    expected = "Illegal Escape In String: abc\\\n"
+    assert comparing_tokenizer(source).get_tokens_as_string() == expected
+
+
+def test_003():
+    """Test lone backslash at end of input inside a string"""
+    source = '"abc\\'
+    expected = "Unclosed String: abc"
+    assert comparing_tokenizer(source).get_tokens_as_string() == expected
+
+
+def test_004():
+    """Test float and exponent boundaries against ANTLR"""
+    source = "1e 1e+ 1.e 1.5e- 1e5.3 00.E+0 7.e7"
+    tokens = comparing_tokenizer(source).get_tokens_as_string()
+    assert tokens == "1,e,1,e,+,1.,e,1.5,e,-,1e5,.,3,00.E+0,7.e7,EOF"
+
+
+def test_005():
+    """Test positions across comments and multi-line input"""
+    source = "class A {\n  # note\n  /* a\n b */ int x; }\n"
+    lexer = Tokenizer(source, lexer="fast").lexer
+    positions = [(t.text, t.line, t.column) for t in lexer]
+    assert positions == [
+        ("class", 1, 0), ("A", 1, 6), ("{", 1, 8),
+        ("int", 4, 6), ("x", 4, 10), (";", 4, 11), ("}", 4, 13),
+    ]
+
+
+def test_006(tmp_path):
+    """Test streaming a file yields tokens lazily with absolute offsets"""
+    source = "class Big {\n    string s := \"\u00e9t\u00e9\";\n}\n" * 3
+    path = tmp_path / "big.op"
+    path.write_text(source, encoding="utf-8")
+    tokens = stream_tokens(path, chunk_size=4)
+    first = next(tokens)
+    assert (first.text, first.line, first.column) == ("class", 1, 0)
+    rest = list(tokens)
+    assert len(rest) + 1 == 3 * 9
+    assert all(source[t.start:t.stop + 1] == t.text for t in rest)
+    assert (rest[-1].text, rest[-1].line) == ("}", 9)
+
+
+def test_007():
+    """Test recovering after an escaped line break keeps positions in step with ANTLR"""
+    source = 'x := "ab\\\ny @ "q\n  z'
+    tokenizer = comparing_tokenizer(source, recover=True)
+    assert tokenizer.get_errors() == [
+        "Error on line 1 col 5: Illegal Escape In String: ab\\\n",
+        "Error on line 2 col 2: Error Token @",
+        "Error on line 2 col 4: Unclosed String: q",
+    ]
@@ -0,0 +1,34 @@
+from src.astgen.ast_generation import ASTGeneration
+from src.utils.interning import InternTable
+from tests.utils import ASTGenerator, Parser
+
+
+def test_001():
+    """Test equal names, operators and type nodes are shared within an AST"""
+    source = """class Point {
+    int x, y;
+    Point next;
+    Point move(int dx; float k) { x := x + dx; return this.next; }
+}"""
+    ast = ASTGenerator(source).generate()
+    cls = ast.class_decls[0]
+    ints, point = cls.members[0].attr_type, cls.members[1].attr_type
+    method = cls.members[2]
+    assert method.params[0].param_type is ints
+    assert method.return_type is point
+    assert point.class_name is cls.name
+    assignment = method.body.statements[0]
+    assert assignment.lhs.name is assignment.rhs.left.name is cls.members[0].attributes[0].name
+
+
+def test_002():
+    """Test ASTs generated with the same table share names and type nodes"""
+    table = InternTable()
+    trees = [
+        Parser(f"class A{i} {{ int counter; }}").parser.program() for i in range(2)
+    ]
+    first, second = (ASTGeneration(table).visit(tree) for tree in trees)
+    assert first.class_decls[0].members[0].attr_type is second.class_decls[0].members[0].attr_type
+    assert ASTGeneration().visit(trees[0]).class_decls[0].members[0].attr_type is not (
+        first.class_decls[0].members[0].attr_type
+    )
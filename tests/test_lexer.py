@@ -1051,4 +1051,28 @@ def test_100():
     }
     '''
     expected = 'class,Final,{,static,final,int,MAX,:=,100,;,int,[,5,],data,:=,{,0,,,1,,,2,,,3,,,4,},;,Final,(,),{,for,i,:=,0,to,4,do,{,this,.,data,[,i,],:=,i,*,2,;,},},int,sum,(,),{,int,s,:=,0,;,for,i,:=,0,to,4,do,{,s,:=,s,+,this,.,data,[,i,],;,},return,s,;,},},EOF'
-    assert Tokenizer(source).get_tokens_as_string() == expected
\ No newline at end of file
+    assert Tokenizer(source).get_tokens_as_string() == expected
+
+def test_101():
+    """Recovering mode reports every lexical error with its position"""
+    source = 'int a := 1 $ 2;\nstring s := "ok\\q\nstring t := "open\nb @ c;'
+    expected = [
+        "Error on line 1 col 11: Error Token $",
+        "Error on line 2 col 12: Illegal Escape In String: ok\\q",
+        "Error on line 3 col 12: Unclosed String: open",
+        "Error on line 4 col 2: Error Token @",
+    ]
+    assert Tokenizer(source, recover=True).get_errors() == expected
+
+
+def test_102():
+    """Recovering mode keeps tokenizing past the bad tokens"""
+    source = 'a ? b "x\\z c "unterminated'
+    expected = "a,b,c,EOF"
+    assert Tokenizer(source, recover=True).get_tokens_as_string() == expected
+
+
+def test_103():
+    """Recovering mode on clean input records no errors"""
+    source = "class A { int x := 1; }"
+    assert Tokenizer(source, recover=True).get_errors() == []
@@ -0,0 +1,90 @@
+import pytest
+
+import test_checker  # before tests.utils, which puts src/utils first on sys.path
+from src.semantics.parallel_checker import ParallelChecker
+from src.semantics.static_checker import StaticChecker
+from src.semantics.static_error import UndeclaredIdentifier
+from tests.utils import ASTGenerator, Checker
+
+
+CHECKER_CASES = sorted(
+    (name, case) for name, case in vars(test_checker).items() if name.startswith("test_")
+)
+
+
+def check(checker, ast):
+    try:
+        checker.check_program(ast)
+    except Exception as e:
+        return str(e)
+    return [str(diagnostic) for diagnostic in checker.errors or []]
+
+
+class ParallelCheckerCase:
+    """Checker stand-in that also checks with two workers, raising and collecting."""
+
+    def __init__(self, source):
+        self.source = source
+
+    def check_from_source(self):
+        expected = Checker(self.source).check_from_source()
+        ast = ASTGenerator(self.source).generate()
+        if not isinstance(ast, str):
+            assert check(ParallelChecker(2), ast) == check(StaticChecker(), ast)
+            serial, parallel = StaticChecker(), ParallelChecker(2)
+            serial.errors, parallel.errors = [], []
+            assert check(parallel, ast) == check(serial, ast)
+        return expected
+
+
+@pytest.mark.parametrize("name, case", CHECKER_CASES, ids=[name for name, _ in CHECKER_CASES])
+def test_replay_checker_case(name, case, monkeypatch):
+    """Replay a test_checker case and compare parallel and serial checking"""
+    monkeypatch.setattr(test_checker, "Checker", ParallelCheckerCase)
+    case()
+
+
+SOURCE = """
+class A {
+    void f() { Missing m := nil; int x := y; }
+    void g() { Missing m := nil; int z := w; }
+    A() { int v := u; }
+    int a, a;
+    Missing h() { return nil; }
+    ~A() { int t := s; }
+    static void main() { }
+}
+"""
+
+
+def test_001():
+    """Test the first error raised is the serial one, whatever the workers"""
+    ast = ASTGenerator(SOURCE.replace("Missing m := nil; int x", "int x")).generate()
+    for workers in [1, 2, 3, 8]:
+        with pytest.raises(UndeclaredIdentifier) as info:
+            ParallelChecker(workers).check_program(ast)
+        assert str(info.value) == "UndeclaredIdentifier(y)"
+
+
+def test_002():
+    """Test errors are collected in serial order, once per use, with the program's nodes"""
+    ast = ASTGenerator(SOURCE).generate()
+    serial = StaticChecker()
+    serial.errors = []
+    serial.check_program(ast)
+    assert [str(d) for d in serial.errors] == [
+        "UndeclaredClass(Missing)",
+        "UndeclaredIdentifier(y)",
+        "UndeclaredClass(Missing)",
+        "UndeclaredIdentifier(w)",
+        "UndeclaredIdentifier(u)",
+        "Redeclared(Attribute, a)",
+        "UndeclaredClass(Missing)",
+        "UndeclaredIdentifier(s)",
+    ]
+    for workers in [2, 3]:
+        checker = ParallelChecker(workers)
+        checker.errors = []
+        checker.check_program(ast)
+        assert [str(d) for d in checker.errors] == [str(d) for d in serial.errors]
+        assert all(d.node is e.node and d.site is e.site for d, e in zip(checker.errors, serial.errors))
@@ -556,3 +556,103 @@ continues on new line";
     '''
     expected = "Unclosed String: This string"
     assert Parser(source).parse() == expected
+
+
+def test_061():
+    """Two-stage parse: valid program succeeds in the SLL stage"""
+    source = '''
+    class Shape {
+        float length, width;
+        float getArea() { return this.length * this.width; }
+        static void main() {
+            Shape s := new Shape();
+            if s.getArea() > 1.0 then io.writeFloat(s.getArea()); else { }
+        }
+    }
+    '''
+    expected = "success"
+    assert Parser(source, mode="sll-ll").parse() == expected
+
+
+def test_062():
+    """Two-stage parse: syntax error is reported by the LL fallback"""
+    source = '''
+    class Constr {
+        Constr() extra { }
+        void main() { Constr c := new Constr(); }
+    }
+    '''
+    expected = "Error on line 3 col 17: extra"
+    assert Parser(source, mode="sll-ll").parse() == expected
+
+
+def test_063():
+    """Two-stage parse: lexical error propagates from the SLL stage"""
+    source = '''class A { void main() { string s := "open; } }'''
+    expected = "Unclosed String: open; } }"
+    assert Parser(source, mode="sll-ll").parse() == expected
+
+
+def test_064():
+    """Trailing separators in parameter and argument lists"""
+    source = '''class A { void f(int a; float b;) { g.h(1, 2,); } }'''
+    expected = "success"
+    assert Parser(source).parse() == expected
+
+
+def test_065():
+    """Recovering parse reports one error per broken member and class"""
+    source = '''class A {
+    int x := ;
+    void m() {
+        if i then { x := * 2; }
+        i := i + ;
+    }
+    float y;
+    void n() { return 1 }
+}
+class B extends { int z; }
+class C { int w := 1 2; void ok() { } }'''
+    expected = "\n".join([
+        "Error on line 2 col 13: ;",
+        "Error on line 4 col 25: *",
+        "Error on line 8 col 24: }",
+        "Error on line 10 col 16: {",
+        "Error on line 11 col 21: 2",
+    ])
+    assert Parser(source, recover=True).parse() == expected
+
+
+def test_066():
+    """Recovering parse merges lexical errors in source order"""
+    source = '''class A { int x := 1 $ 2; string s := "open
+; void m() { x := ; } }'''
+    expected = "\n".join([
+        "Error on line 1 col 21: Error Token $",
+        "Error on line 1 col 23: 2",
+        "Error on line 1 col 38: Unclosed String: open",
+        "Error on line 2 col 0: ;",
+        "Error on line 2 col 18: ;",
+    ])
+    assert Parser(source, recover=True).parse() == expected
+
+
+def test_067():
+    """Recovering parse of a valid program"""
+    source = '''class A { void m() { x := 1; } }'''
+    expected = "success"
+    assert Parser(source, recover=True).parse() == expected
+
+
+def test_068():
+    """Recovering parse stops at the error cap"""
+    source = "class A {\n" + "    int x := ;\n" * 20 + "}"
+    parser = Parser(source, recover=True)
+    assert parser.parse_all_errors(max_errors=5).count("\n") == 4
+
+
+def test_069():
+    """Recovering parse reports one error for an incomplete expression before ;"""
+    source = '''class A { void m() { x := 1 +; y := 2; } }'''
+    expected = "Error on line 1 col 29: ;"
+    assert Parser(source, recover=True).parse() == expected
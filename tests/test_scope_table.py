@@ -0,0 +1,74 @@
+from src.semantics.class_index import ClassIndex
+from src.semantics.scope_table import ScopeTable
+from src.semantics.static_checker import (
+    ForSignal, StaticChecker, VariableSymb, Tint, Tfloat, get_class_attribute, get_for_signal
+)
+from tests.utils import ASTGenerator, Checker
+
+
+def test_001():
+    """Test inner scopes shadow outer ones and redeclaring replaces a symbol"""
+    outer = ScopeTable()
+    outer.declare(VariableSymb(False, Tint(), "x"))
+    inner = outer.enter().enter()
+    inner.declare(VariableSymb(False, Tfloat(), "x"))
+    assert type(inner.lookup("x").type) is Tfloat
+    assert type(outer.lookup("x").type) is Tint
+    assert inner.lookup_local("y") is None and inner.lookup("y") is None
+    assert inner.global_scope is outer and "x" not in inner.parent
+    outer.declare(VariableSymb(True, Tint(), "x"))
+    assert outer.lookup("x").is_final and len(outer) == 1
+    loop = outer.enter()
+    loop.declare(ForSignal())
+    assert get_for_signal(loop.enter()) is not None and get_for_signal(outer) is None
+
+
+def test_002():
+    """Test a method with thousands of locals, each reading the previous one"""
+    lines = ["class A {", "    static void main() {", "        int v0 := 0;"]
+    lines += [f"        int v{k} := v{k - 1};" for k in range(1, 3000)]
+    source = "\n".join(lines + ["    }", "}"])
+    assert Checker(source).check_from_source() == "Static checking passed"
+    redeclared = "\n".join(lines + ["        float v1500;", "    }", "}"])
+    assert Checker(redeclared).check_from_source() == "Redeclared(Variable, v1500)"
+
+
+def test_003():
+    """Test a declaration's initializers see earlier declarations only"""
+    source = """
+class A {
+    int a := 1, b := a;
+    void f(int x) {
+        int y := x, z := y;
+    }
+    static void main() { }
+}
+"""
+    assert Checker(source).check_from_source() == "UndeclaredIdentifier(y)"
+
+
+def test_004():
+    """Test subclasses resolve inherited members through the superclass's table"""
+    checker = StaticChecker()
+    ast = ASTGenerator("""
+class A { int x; int f() { return 1; } }
+class B extends A { float x; }
+class C extends B { void g() { float y := this.x; int z := this.f(); } static void main() { } }
+""").generate()
+    env = ClassIndex(ast)
+    checker.check_program(ast, env)
+    a, b, c = (env.lookup(name) for name in "ABC")
+    assert [m.name for m in c.members] == ["g", "main"]
+    assert get_class_attribute(c, "f") is get_class_attribute(a, "f")
+    assert type(get_class_attribute(c, "x").type) is Tfloat
+    assert get_class_attribute(c, "A") is None
+
+
+def test_005():
+    """Test reading an inherited constant through this does not make it assignable"""
+    source = """
+class A { final int K := 1; int f() { return this.K; } }
+class B extends A { void g() { K := 2; } static void main() { } }
+"""
+    expected = "CannotAssignToConstant(AssignmentStatement(IdLHS(K) := IntLiteral(2)))"
+    assert Checker(source).check_from_source() == expected
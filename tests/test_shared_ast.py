@@ -0,0 +1,77 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import test_ast_gen
+from src.utils.nodes import *
+from src.utils.shared_ast import SharedArena, SharedAST
+from src.utils.traversal import tree_height
+from tests.utils import ASTGenerator
+
+
+AST_GEN_CASES = sorted(
+    (name, case) for name, case in vars(test_ast_gen).items() if name.startswith("test_")
+)
+
+
+class SharedASTGenerator:
+    """ASTGenerator stand-in that hands each AST over through shared memory."""
+
+    def __init__(self, input_string):
+        self.input_string = input_string
+
+    def generate(self):
+        ast = ASTGenerator(self.input_string).generate()
+        if isinstance(ast, str):
+            return ast
+        with SharedAST(ast) as shared, SharedArena(pickle.loads(pickle.dumps(shared.handle))) as arena:
+            return arena.to_node(shared.handle.root)
+
+
+@pytest.mark.parametrize("name, case", AST_GEN_CASES, ids=[name for name, _ in AST_GEN_CASES])
+def test_replay_ast_gen_case(name, case, monkeypatch):
+    """Replay a test_ast_gen case through a shared memory block"""
+    monkeypatch.setattr(test_ast_gen, "ASTGenerator", SharedASTGenerator)
+    case()
+
+
+def render(handle):
+    with SharedArena(handle) as arena:
+        return str(arena.root())
+
+
+def test_001():
+    """Test workers read the shared AST through views"""
+    ast = ASTGenerator('class A { float f := 2.5; void m() { string s := "café"; s := s ^ "!"; } }').generate()
+    with SharedAST(ast) as shared, ProcessPoolExecutor(2) as pool:
+        assert list(pool.map(render, [shared.handle] * 3)) == [str(ast)] * 3
+
+
+def test_002():
+    """Test the attached arena is read-only"""
+    ast = ASTGenerator("class A { int x := 1; }").generate()
+    with SharedAST(ast) as shared, SharedArena(shared.handle) as arena:
+        root = arena.root()
+        assert root == ast and tree_height(root) == tree_height(ast)
+        with pytest.raises(TypeError):
+            arena.add(ast)
+        with pytest.raises(TypeError):
+            arena.kinds[0] = 0
+        with pytest.raises(AttributeError):
+            root.class_decls = []
+
+
+def test_003():
+    """Test shared views are not pickled with their arena, which is passed as a handle"""
+    ast = ASTGenerator("class A { int x := 1; }").generate()
+    with SharedAST(ast) as shared, SharedArena(shared.handle) as arena:
+        with pytest.raises(TypeError):
+            pickle.dumps(arena.root())
+
+
+def test_004():
+    """Test integers wider than 64 bits are shared"""
+    ast = ASTGenerator("class A { int x := -99999999999999999999999; }").generate()
+    with SharedAST(ast) as shared, SharedArena(shared.handle) as arena:
+        assert arena.root() == ast
@@ -0,0 +1,65 @@
+import pytest
+
+import test_parser
+from utils import Parser
+from src.grammar.fast_lexer import FastLexer
+from src.grammar.token_buffer import CompactTokenStream
+
+
+PARSER_CASES = sorted(
+    (name, case) for name, case in vars(test_parser).items() if name.startswith("test_")
+)
+
+
+def comparing_parser(source, **kwargs):
+    """Parser factory that checks the compact stream parses like CommonTokenStream."""
+    expected = Parser(source, **kwargs).parse()
+    parser = Parser(source, tokens="compact", **kwargs)
+    assert parser.parse() == expected
+    return Parser(source, tokens="compact", **kwargs)
+
+
+@pytest.mark.parametrize("name, case", PARSER_CASES, ids=[name for name, _ in PARSER_CASES])
+def test_replay_parser_case(name, case, monkeypatch):
+    """Replay a test_parser case over the compact token stream, comparing with CommonTokenStream"""
+    monkeypatch.setattr(test_parser, "Parser", comparing_parser)
+    case()
+
+
+def test_001():
+    """Test tokens are stored column-wise with lexemes sliced lazily"""
+    source = 'class A {\n  string s := "hi";\n}'
+    stream = CompactTokenStream(FastLexer(source), source)
+    stream.fill()
+    tokens = stream.tokens
+    assert [tokens.text(i) for i in range(len(tokens))] == [
+        "class", "A", "{", "string", "s", ":=", '"hi"', ";", "}", "<EOF>",
+    ]
+    assert (stream.get(6).type, stream.get(6).line, stream.get(6).column) == (FastLexer.STRINGLIT, 2, 14)
+    assert tokens.nbytes() >= 5 * 4 * len(tokens)
+
+
+def test_002():
+    """Test lookahead and lookbehind stop at the ends of the buffer"""
+    source = "a b"
+    stream = CompactTokenStream(FastLexer(source), source)
+    assert stream.LT(-1) is None
+    assert stream.LT(5).text == "<EOF>"
+    stream.consume()
+    assert (stream.LT(-1).text, stream.LT(1).text) == ("a", "b")
+    stream.consume()
+    with pytest.raises(Exception):
+        stream.consume()
+    assert stream.getText() == "ab"
+
+
+@pytest.mark.parametrize("source", [
+    "class A { int x := (1; }",
+    "class A { void m() { x := a[1; y := 2; } }",
+    "class A { void m() { x := 1 } }",
+])
+def test_003(source):
+    """Test recovery conjures missing tokens when the fast lexer feeds the compact stream"""
+    expected = Parser(source, recover=True).parse()
+    assert expected.startswith("Error on line 1")
+    assert Parser(source, recover=True, tokens="compact", lexer="fast").parse() == expected
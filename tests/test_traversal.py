@@ -0,0 +1,129 @@
+import pytest
+
+import test_checker  # before tests.utils, which puts src/utils first on sys.path
+from src.semantics.static_error import MustInLoop
+from src.utils.nodes import *
+from src.utils.traversal import SKIP, IterativeVisitor, tree_height
+from src.utils.visitor import BaseVisitor
+from tests.utils import ASTGenerator, Checker
+
+
+CHECKER_CASES = sorted(
+    (name, case) for name, case in vars(test_checker).items() if name.startswith("test_")
+)
+
+DEPTH = 100_000
+
+
+class MisplacedJumps(IterativeVisitor):
+    """Collects break/continue statements that are not inside a for loop."""
+
+    def __init__(self):
+        super().__init__()
+        self.loop_depth = 0
+        self.misplaced = []
+
+    def enter_for_statement(self, node):
+        self.loop_depth += 1
+
+    def leave_for_statement(self, node, results):
+        self.loop_depth -= 1
+
+    def enter_break_statement(self, node):
+        if not self.loop_depth:
+            self.misplaced.append(node)
+
+    def enter_continue_statement(self, node):
+        if not self.loop_depth:
+            self.misplaced.append(node)
+
+
+def misplaced_jumps(node):
+    visitor = MisplacedJumps()
+    visitor.traverse(node)
+    return visitor.misplaced
+
+
+class LoopCheckingChecker:
+    """Checker stand-in that compares a traversal finding misplaced jumps with the checker's MustInLoop."""
+
+    def __init__(self, source):
+        self.source = source
+
+    def check_from_source(self):
+        result = Checker(self.source).check_from_source()
+        jumps = misplaced_jumps(ASTGenerator(self.source).generate())
+        if result.startswith("MustInLoop"):
+            assert str(MustInLoop(jumps[0])) == result
+        if result == "Static checking passed":
+            assert jumps == []
+        return result
+
+
+@pytest.mark.parametrize("name, case", CHECKER_CASES, ids=[name for name, _ in CHECKER_CASES])
+def test_replay_checker_case(name, case, monkeypatch):
+    """Replay a test_checker case, checking enter/leave hooks find the jumps MustInLoop reports"""
+    monkeypatch.setattr(test_checker, "Checker", LoopCheckingChecker)
+    case()
+
+
+def method_body(*statements):
+    method = MethodDecl(False, PrimitiveType("void"), "m", [], BlockStatement([], list(statements)))
+    return Program([ClassDecl("A", None, [method])])
+
+
+def test_001():
+    """Test leave hooks return values up the tree in child field order"""
+
+    class Evaluate(IterativeVisitor):
+        def leave_int_literal(self, node, results):
+            return node.value
+
+        def leave_binary_op(self, node, results):
+            left, right = results
+            return left - right if node.operator == "-" else left * right
+
+        def leave_array_literal(self, node, results):
+            [values] = results
+            return sum(values)
+
+    expr = BinaryOp(IntLiteral(10), "-", BinaryOp(IntLiteral(2), "*", ArrayLiteral([IntLiteral(1), IntLiteral(3)])))
+    assert Evaluate().traverse(expr) == 2
+    ast = ASTGenerator("class A { void m() { x := (1 + 2); } }").generate()
+    assert tree_height(ast) == 8
+
+
+def test_002():
+    """Test an enter hook returning SKIP prunes the subtree"""
+
+    class SkipLoops(IterativeVisitor):
+        def enter_for_statement(self, node):
+            return SKIP
+
+        def leave_node(self, node, results):
+            children = [r for result in results for r in (result if type(result) is list else [result])]
+            return 1 + sum(r for r in children if r is not None)
+
+    loop = ForStatement("i", IntLiteral(0), "to", IntLiteral(9), BreakStatement())
+    assert SkipLoops().traverse(method_body(loop, BreakStatement())) == 6
+
+
+def test_003():
+    """Test a 100k-deep else-if chain is analysed without recursion"""
+    stmt = BreakStatement()
+    for i in range(DEPTH):
+        stmt = IfStatement(BoolLiteral(True), ContinueStatement() if i == 0 else BlockStatement([], []), stmt)
+    program = method_body(stmt)
+    with pytest.raises(RecursionError):
+        BaseVisitor().visit(program)
+    assert [type(jump) for jump in misplaced_jumps(program)] == [ContinueStatement, BreakStatement]
+    loop = ForStatement("i", IntLiteral(0), "to", IntLiteral(9), stmt)
+    assert misplaced_jumps(method_body(loop)) == []
+
+
+def test_004():
+    """Test results are returned up 100k nested parentheses"""
+    expr = Identifier("x")
+    for _ in range(DEPTH):
+        expr = ParenthesizedExpression(expr)
+    assert tree_height(expr) == DEPTH + 1
@@ -0,0 +1,42 @@
+from src.utils.nodes import *
+from src.utils.visitor import BaseVisitor
+
+
+class Counter(BaseVisitor):
+    def __init__(self):
+        self.identifiers = 0
+
+    def visit_identifier(self, node, o=None):
+        self.identifiers += 1
+
+
+def test_001():
+    """Test the dispatch table calls subclass overrides of visit methods"""
+    expr = BinaryOp(Identifier("a"), "+", UnaryOp("-", Identifier("b")))
+    counter = Counter()
+    counter.visit(expr)
+    counter.visit(expr)
+    assert counter.identifiers == 4
+    assert counter._handlers[Identifier] is Counter.visit_identifier
+
+
+def test_002():
+    """Test each visitor instance keeps its own table"""
+    base, counter = BaseVisitor(), Counter()
+    base.visit(Identifier("a"))
+    counter.visit(Identifier("a"))
+    assert base._handlers[Identifier] is BaseVisitor.visit_identifier
+    assert counter._handlers[Identifier] is Counter.visit_identifier
+    assert counter.identifiers == 1
+
+
+def test_003():
+    """Test each node class's visit_method names the method its accept() calls"""
+    from src.utils.ast_arena import KINDS
+
+    class Recorder:
+        def __getattr__(self, name):
+            return lambda node, o: name
+
+    for node_class in KINDS:
+        assert node_class.accept(None, Recorder()) == node_class.visit_method
@@ -10,16 +10,27 @@ sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src
 from antlr4 import *
 from build.OPLangLexer import OPLangLexer
 from build.OPLangParser import OPLangParser
-from src.utils.error_listener import NewErrorListener
+from src.grammar.fast_lexer import FastLexer
+from src.grammar.token_buffer import CompactTokenStream
+from src.utils.error_listener import NewErrorListener, SyntaxException
+from src.utils.parse_strategy import DEFAULT_MAX_ERRORS, parse_recovering, parse_with_mode
 from src.astgen.ast_generation import ASTGeneration
+from src.astgen.ast_builder import build_ast
 from src.semantics.static_checker import StaticChecker
 from src.utils.nodes import *
 
 
 class Tokenizer:
-    def __init__(self, input_string):
+    def __init__(self, input_string, lexer="antlr", recover=False):
         self.input_stream = InputStream(input_string)
-        self.lexer = OPLangLexer(self.input_stream)
+        if lexer == "antlr":
+            self.lexer = OPLangLexer(self.input_stream)
+        elif lexer == "fast":
+            self.lexer = FastLexer(input_string)
+        else:
+            raise ValueError(f"Unknown lexer: {lexer}")
+        if recover:
+            self.lexer.errors = []
 
     def get_tokens(self):
         tokens = []
@@ -49,40 +60,79 @@ class Tokenizer:
                 return str(e)
         return ",".join(tokens)
 
+    def get_errors(self):
+        """Tokenize the remaining input and return every recorded lexical error."""
+        while self.lexer.nextToken().type != Token.EOF:
+            pass
+        return [f"Error on line {e.line} col {e.column}: {e}" for e in self.lexer.errors]
+
 
 class Parser:
-    def __init__(self, input_string):
+    def __init__(self, input_string, mode="ll", recover=False, tokens="common", lexer="antlr"):
+        self.mode = mode
+        self.recover = recover
         self.input_stream = InputStream(input_string)
-        self.lexer = OPLangLexer(self.input_stream)
-        self.token_stream = CommonTokenStream(self.lexer)
+        if lexer == "antlr":
+            self.lexer = OPLangLexer(self.input_stream)
+        elif lexer == "fast":
+            self.lexer = FastLexer(input_string)
+        else:
+            raise ValueError(f"Unknown lexer: {lexer}")
+        if recover:
+            self.lexer.errors = []
+        if tokens == "common":
+            self.token_stream = CommonTokenStream(self.lexer)
+        elif tokens == "compact":
+            self.token_stream = CompactTokenStream(self.lexer, input_string)
+        else:
+            raise ValueError(f"Unknown token stream: {tokens}")
         self.parser = OPLangParser(self.token_stream)
         self.parser.removeErrorListeners()
         self.parser.addErrorListener(NewErrorListener.INSTANCE)
 
     def parse(self):
+        if self.recover:
+            return self.parse_all_errors()
         try:
-            self.parser.program()  # Assuming 'program' is the entry point of your grammar
+            parse_with_mode(self.parser, self.mode)
             return "success"
         except Exception as e:
             return str(e)
 
+    def parse_all_errors(self, max_errors=DEFAULT_MAX_ERRORS):
+        """Parse in one pass, returning every lexical and syntax error one per line."""
+        _, syntax_errors = parse_recovering(self.parser, max_errors)
+        lexical_errors = [
+            SyntaxException(f"Error on line {e.line} col {e.column}: {e}", e.line, e.column)
+            for e in self.lexer.errors
+        ]
+        errors = sorted(lexical_errors + syntax_errors, key=lambda e: (e.line, e.column))
+        return "\n".join(str(e) for e in errors) or "success"
+
 
 class ASTGenerator:
     """Class to generate AST from HLang source code."""
 
-    def __init__(self, input_string):
+    def __init__(self, input_string, mode="ll", direct=False, index=None):
         self.input_string = input_string
+        self.mode = mode
+        self.direct = direct
+        self.index = index
         self.input_stream = InputStream(input_string)
         self.lexer = OPLangLexer(self.input_stream)
         self.token_stream = CommonTokenStream(self.lexer)
         self.parser = OPLangParser(self.token_stream)
-        self.ast_generator = ASTGeneration()
+        self.ast_generator = ASTGeneration(index=index)
 
     def generate(self):
         """Generate AST from the input string."""
         try:
+            # Build the AST during the parse, without keeping the parse tree
+            if self.direct:
+                return build_ast(self.parser, self.mode, index=self.index)
+
             # Parse the program starting from the entry point
-            parse_tree = self.parser.program()
+            parse_tree = parse_with_mode(self.parser, self.mode)
 
             # Generate AST using the visitor
             ast = self.ast_generator.visit(parse_tree)
@@ -94,16 +144,24 @@ class ASTGenerator:
 class Checker:
     """Class to perform static checking on the AST."""
 
-    def __init__(self, source=None, ast=None):
+    def __init__(self, source=None, ast=None, recover=False):
         self.source = source
         self.ast = ast
         self.checker = StaticChecker()
+        if recover:
+            self.checker.errors = []
+
+    def result(self):
+        """Return the collected errors one per line, or the success message."""
+        if self.checker.errors:
+            return "\n".join(str(error) for error in self.checker.errors)
+        return "Static checking passed"
 
     def check_from_ast(self):
         """Perform static checking on the AST."""
         try:
             self.checker.check_program(self.ast)
-            return "Static checking passed"
+            return self.result()
         except Exception as e:
             return str(e)
 
@@ -115,6 +173,6 @@ class Checker:
             if isinstance(self.ast, str):  # If AST generation failed
                 return self.ast
             self.checker.check_program(self.ast)
-            return "Static checking passed"
+            return self.result()
         except Exception as e:
             return str(e)